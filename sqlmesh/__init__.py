@@ -3,6 +3,7 @@
 """
 from __future__ import annotations
 
+import importlib
 import logging
 import os
 import sys
@@ -13,19 +14,47 @@ from sqlmesh.core.dialect import extend_sqlglot
 
 extend_sqlglot()
 
-from sqlmesh.core.config import Config
-from sqlmesh.core.context import Context, ExecutionContext
-from sqlmesh.core.engine_adapter import EngineAdapter
-from sqlmesh.core.hooks import hook
-from sqlmesh.core.macros import macro
-from sqlmesh.core.model import Model, model
-from sqlmesh.core.snapshot import Snapshot
+if t.TYPE_CHECKING:
+    from sqlmesh.core.config import Config
+    from sqlmesh.core.context import Context, ExecutionContext
+    from sqlmesh.core.engine_adapter import EngineAdapter
+    from sqlmesh.core.hooks import hook
+    from sqlmesh.core.macros import macro
+    from sqlmesh.core.model import Model, model
+    from sqlmesh.core.snapshot import Snapshot
 
 try:
     from sqlmesh._version import __version__, __version_tuple__  # type: ignore
 except ImportError:
     pass
 
+# The public API is imported on first access, so that entry points which don't need it
+# (e.g. the CLI's help or scheduler tasks) don't pay for importing pandas and the engine adapters.
+_LAZY_ATTRIBUTES = {
+    "Config": "sqlmesh.core.config",
+    "Context": "sqlmesh.core.context",
+    "ExecutionContext": "sqlmesh.core.context",
+    "EngineAdapter": "sqlmesh.core.engine_adapter",
+    "hook": "sqlmesh.core.hooks",
+    "macro": "sqlmesh.core.macros",
+    "Model": "sqlmesh.core.model",
+    "model": "sqlmesh.core.model",
+    "Snapshot": "sqlmesh.core.snapshot",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
 
 class RuntimeEnv(str, Enum):
     """Enum defining what environment SQLMesh is running in."""
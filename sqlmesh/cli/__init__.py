@@ -5,8 +5,7 @@ import click
 from sqlglot.errors import SqlglotError
 
 from sqlmesh import debug_mode_enabled
-from sqlmesh.utils.concurrency import NodeExecutionFailedError
-from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.errors import NodeExecutionFailedError, SQLMeshError
 
 DECORATOR_RETURN_TYPE = t.TypeVar("DECORATOR_RETURN_TYPE")
 
@@ -11,9 +11,12 @@ from sqlmesh import debug_mode_enabled, enable_logging
 from sqlmesh.cli import error_handler
 from sqlmesh.cli import options as opt
 from sqlmesh.cli.example_project import ProjectTemplate, init_example_project
-from sqlmesh.core.context import Context
 from sqlmesh.utils.date import TimeLike
 from sqlmesh.utils.errors import MissingDependencyError
+from sqlmesh.utils.tracing import JsonlTraceSink, tracer
+
+if t.TYPE_CHECKING:
+    from sqlmesh.core.context import Context
 
 
 @click.group(no_args_is_help=True)
@@ -29,6 +32,16 @@ from sqlmesh.utils.errors import MissingDependencyError
     type=str,
     help="The name of the connection to use for tests.",
 )
+@click.option(
+    "--trace",
+    is_flag=True,
+    help="Record the duration of executed statements, evaluations and state operations to a JSONL file.",
+)
+@click.option(
+    "--trace-file",
+    type=str,
+    help="The path of the trace file. Implies --trace. Default: sqlmesh_trace.jsonl",
+)
 @click.pass_context
 @error_handler
 def cli(
@@ -37,6 +50,8 @@ def cli(
     config: t.Optional[str] = None,
     connection: t.Optional[str] = None,
     test_connection: t.Optional[str] = None,
+    trace: bool = False,
+    trace_file: t.Optional[str] = None,
 ) -> None:
     """SQLMesh command line tool."""
     if ctx.invoked_subcommand == "version":
@@ -55,6 +70,14 @@ def cli(
     if debug_mode_enabled():
         enable_logging(level=logging.DEBUG)
 
+    if trace or trace_file:
+        trace_sink = JsonlTraceSink(trace_file or "sqlmesh_trace.jsonl")
+        tracer.add_sink(trace_sink)
+        ctx.call_on_close(lambda: tracer.remove_sink(trace_sink))
+
+    # Imported here so that commands which don't need a context (e.g. --help) start quickly.
+    from sqlmesh.core.context import Context
+
     context = Context(
         paths=paths,
         config=config,
@@ -190,6 +213,15 @@ def diff(ctx: click.Context, environment: t.Optional[str] = None) -> None:
     "--skip-tests",
     help="Skip tests prior to generating the plan if they are defined.",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    "test_jobs",
+    type=int,
+    default=1,
+    help="The number of unit tests to run concurrently prior to generating the plan.",
+)
+@opt.run_all_tests
 @click.option(
     "--restate-model",
     "-r",
@@ -266,13 +298,24 @@ def dag(ctx: click.Context, file: str) -> None:
 @cli.command("test")
 @opt.match_pattern
 @opt.verbose
+@opt.jobs
+@opt.run_all_tests
 @click.argument("tests", nargs=-1)
 @click.pass_obj
 @error_handler
-def test(obj: Context, k: t.List[str], verbose: bool, tests: t.List[str]) -> None:
+def test(
+    obj: Context,
+    k: t.List[str],
+    verbose: bool,
+    jobs: int,
+    run_all_tests: bool,
+    tests: t.List[str],
+) -> None:
     """Run model unit tests."""
     # Set Python unittest verbosity level
-    result = obj.test(match_patterns=k, tests=tests, verbose=verbose)
+    result = obj.test(
+        match_patterns=k, tests=tests, verbose=verbose, jobs=jobs, run_all_tests=run_all_tests
+    )
     if not result.wasSuccessful():
         exit(1)
 
@@ -60,3 +60,17 @@ verbose = click.option(
     is_flag=True,
     help="Verbose output.",
 )
+
+jobs = click.option(
+    "-j",
+    "--jobs",
+    type=int,
+    default=1,
+    help="The number of unit tests to run concurrently.",
+)
+
+run_all_tests = click.option(
+    "--run-all-tests",
+    is_flag=True,
+    help="Run all unit tests, including tests of unchanged models and tests which have passed before.",
+)
@@ -0,0 +1,213 @@
+"""
+# Audit fusion
+
+Most audits scan the audited interval of a model and count rows which match a predicate. Instead of running
+one query per audit, such audits are combined into a single query which scans the model once and computes
+the result of each audit as a conditional aggregate:
+
+```sql
+SELECT
+  COUNT(CASE WHEN _q_0.a IS NULL THEN 1 END) AS _audit_0,
+  COUNT(CASE WHEN NOT _q_0.b IN ('x', 'y') THEN 1 END) AS _audit_1,
+  CASE WHEN COUNT(*) <= 0 THEN 1 ELSE 0 END AS _audit_2
+FROM (SELECT * FROM db.t AS t WHERE t.ds BETWEEN ...) AS _q_0
+```
+
+The following shapes of rendered audit queries can be fused:
+- Row filters: `SELECT <columns> FROM <model> WHERE <predicate>`. The count of the audit is the number of rows
+  which match the predicate.
+- Row filters over window projections: `SELECT <columns> FROM (SELECT <window functions> FROM <model>) WHERE
+  <predicate>`, like the built-in `unique_values` audit. The window projections are computed alongside all
+  model columns.
+- Aggregate checks: `SELECT <constant> FROM <model> HAVING <predicate>`, like the built-in `number_of_rows`
+  audit. The query returns a single row if the predicate holds and no rows otherwise.
+
+Queries of any other shape, as well as predicates containing subqueries, are left as is.
+"""
+from __future__ import annotations
+
+import typing as t
+
+from sqlglot import exp
+from sqlglot.optimizer.simplify import simplify
+
+_UNSUPPORTED_CLAUSES = (
+    "joins",
+    "laterals",
+    "group",
+    "having",
+    "limit",
+    "offset",
+    "distinct",
+    "qualify",
+    "with",
+    "into",
+    "pivots",
+)
+
+
+class _Measure(t.NamedTuple):
+    source: exp.Subquery
+    expression: exp.Expression
+    window_projections: t.List[exp.Alias]
+
+
+def fuse_audit_queries(
+    queries: t.Sequence[exp.Expression],
+) -> t.Tuple[t.List[t.Tuple[exp.Select, t.List[int]]], t.List[int]]:
+    """Combines audit queries that scan the same source into single queries.
+
+    Args:
+        queries: The rendered audit queries.
+
+    Returns:
+        A tuple of (fused queries, indices of queries which couldn't be fused). Each fused query is paired
+        with the indices of the audit queries it computes. The i-th projection of a fused query contains
+        the count of the audit query with the i-th index.
+    """
+    groups: t.Dict[str, t.List[t.Tuple[int, _Measure]]] = {}
+    unfused = []
+
+    for index, query in enumerate(queries):
+        measure = _measure(query, index)
+        if measure is None:
+            unfused.append(index)
+        else:
+            groups.setdefault(measure.source.sql(), []).append((index, measure))
+
+    fused = []
+    for measures in groups.values():
+        if len(measures) < 2:
+            unfused.extend(index for index, _ in measures)
+            continue
+
+        source = measures[0][1].source
+        window_projections = [p for _, measure in measures for p in measure.window_projections]
+        if window_projections:
+            alias = source.alias
+            source = exp.Subquery(
+                this=exp.select(exp.Column(this=exp.Star(), table=exp.to_identifier(alias)))
+                .select(*window_projections, copy=False)
+                .from_(source.copy()),
+                alias=exp.TableAlias(this=exp.to_identifier(alias)),
+            )
+
+        query = exp.select(
+            *(
+                exp.alias_(measure.expression, f"_audit_{position}")
+                for position, (_, measure) in enumerate(measures)
+            )
+        ).from_(source.copy())
+        fused.append((query, [index for index, _ in measures]))
+
+    return fused, sorted(unfused)
+
+
+def _measure(query: exp.Expression, index: int) -> t.Optional[_Measure]:
+    if not isinstance(query, exp.Select) or not _is_single_source(query):
+        return None
+
+    source = query.args["from"].expressions[0]
+    if not isinstance(source, exp.Subquery) or not source.alias:
+        return None
+
+    if query.args.get("having"):
+        return _aggregate_measure(query, source)
+    if not _is_row_preserving(query):
+        return None
+
+    where = query.args.get("where")
+    condition = where.this if where else None
+    if condition is not None and not _is_scalar(condition):
+        return None
+
+    inner = source.this
+    window_projections: t.List[exp.Alias] = []
+    if (
+        isinstance(inner, exp.Select)
+        and _is_single_source(inner)
+        and not any(inner.args.get(clause) for clause in ("where", *_UNSUPPORTED_CLAUSES))
+        and any(p.find(exp.Window) for p in inner.expressions)
+    ):
+        base = inner.args["from"].expressions[0]
+        if not isinstance(base, exp.Subquery) or not base.alias:
+            return None
+
+        renamed = {}
+        for projection in inner.expressions:
+            if not isinstance(projection, exp.Alias) or projection.find(exp.AggFunc, exp.Subquery):
+                return None
+            renamed[projection.alias] = f"_audit_{index}_{projection.alias}"
+            window_projections.append(exp.alias_(projection.this.copy(), renamed[projection.alias]))
+
+        if condition is not None:
+            condition = _rename_columns(condition, source.alias, base.alias, renamed)
+            if condition is None:
+                return None
+        source = base
+
+    expression = (
+        exp.Count(this=exp.Case(ifs=[exp.If(this=condition.copy(), true=exp.Literal.number(1))]))
+        if condition is not None
+        else exp.Count(this=exp.Star())
+    )
+    return _Measure(source=source, expression=expression, window_projections=window_projections)
+
+
+def _aggregate_measure(query: exp.Select, source: exp.Subquery) -> t.Optional[_Measure]:
+    if any(query.args.get(clause) for clause in ("where", "group", "distinct", "qualify", "with")):
+        return None
+    if not all(isinstance(p.unalias(), exp.Literal) for p in query.expressions):
+        return None
+
+    limit = query.args.get("limit")
+    if limit is not None:
+        limit_value = simplify(limit.expression.copy())
+        if not isinstance(limit_value, exp.Literal) or limit_value.is_string:
+            return None
+        if int(limit_value.this) < 1:
+            return None
+
+    condition = query.args["having"].this
+    if condition.find(exp.Window, exp.Subquery):
+        return None
+
+    return _Measure(
+        source=source,
+        expression=exp.Case(
+            ifs=[exp.If(this=condition.copy(), true=exp.Literal.number(1))],
+            default=exp.Literal.number(0),
+        ),
+        window_projections=[],
+    )
+
+
+def _is_single_source(query: exp.Select) -> bool:
+    from_ = query.args.get("from")
+    if from_ is None:
+        return False
+    return len(from_.expressions) == 1 and not query.args.get("joins")
+
+
+def _is_row_preserving(query: exp.Select) -> bool:
+    if any(query.args.get(clause) for clause in _UNSUPPORTED_CLAUSES):
+        return False
+    return all(
+        isinstance(p.unalias(), (exp.Star, exp.Column, exp.Literal)) for p in query.expressions
+    )
+
+
+def _is_scalar(condition: exp.Expression) -> bool:
+    return not condition.find(exp.Subquery, exp.Select, exp.AggFunc, exp.Window)
+
+
+def _rename_columns(
+    condition: exp.Expression, alias: str, new_alias: str, renamed: t.Dict[str, str]
+) -> t.Optional[exp.Expression]:
+    condition = condition.copy()
+    for column in condition.find_all(exp.Column):
+        if column.table not in ("", alias) or column.name not in renamed:
+            return None
+        column.set("this", exp.to_identifier(renamed[column.name]))
+        column.set("table", exp.to_identifier(new_alias))
+    return condition
@@ -24,6 +24,7 @@ else:
 
 class _ConnectionConfig(abc.ABC, BaseConfig):
     concurrent_tasks: int
+    statement_timeout: t.Optional[float] = None
 
     @property
     @abc.abstractmethod
@@ -60,6 +61,9 @@ class _ConnectionConfig(abc.ABC, BaseConfig):
                 }
             ),
             multithreaded=self.concurrent_tasks > 1,
+            # One connection per concurrent task plus one for the calling thread.
+            max_connections=self.concurrent_tasks + 1,
+            statement_timeout=self.statement_timeout,
             **self._extra_engine_config,
         )
 
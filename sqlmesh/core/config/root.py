@@ -38,6 +38,8 @@ class Config(BaseConfig):
             during plan creation.
         users: A list of users that can be used for approvals/notifications.
         model_defaults: Default values for model definitions.
+        model_load_processes: The number of processes used to parse and load SQL models. Models are loaded in the
+            current process by default.
     """
 
     connections: t.Union[t.Dict[str, ConnectionConfig], ConnectionConfig] = DuckDBConnectionConfig()
@@ -56,6 +58,7 @@ class Config(BaseConfig):
     auto_categorize_changes: CategorizerConfig = CategorizerConfig()
     users: t.List[User] = []
     model_defaults: ModelDefaultsConfig = ModelDefaultsConfig()
+    model_load_processes: int = 1
     loader: t.Type[Loader] = SqlMeshLoader
 
     _FIELD_UPDATE_STRATEGY: t.ClassVar[t.Dict[str, UpdateStrategy]] = {
@@ -10,14 +10,14 @@ from requests import Session
 from sqlmesh.core.config.base import BaseConfig
 from sqlmesh.core.config.common import concurrent_tasks_validator
 from sqlmesh.core.console import Console
-from sqlmesh.core.plan import AirflowPlanEvaluator, BuiltInPlanEvaluator, PlanEvaluator
-from sqlmesh.core.state_sync import EngineAdapterStateSync, StateReader, StateSync
 from sqlmesh.schedulers.airflow.client import AirflowClient
 
 if t.TYPE_CHECKING:
     from google.auth.transport.requests import AuthorizedSession
 
     from sqlmesh.core.context import Context
+    from sqlmesh.core.plan import PlanEvaluator
+    from sqlmesh.core.state_sync import StateReader, StateSync
 
 if sys.version_info >= (3, 9):
     from typing import Annotated, Literal
@@ -68,14 +68,19 @@ class BuiltInSchedulerConfig(_SchedulerConfig, BaseConfig):
     type_: Literal["builtin"] = Field(alias="type", default="builtin")
 
     def create_state_sync(self, context: Context) -> t.Optional[StateSync]:
+        from sqlmesh.core.state_sync import EngineAdapterStateSync
+
         return EngineAdapterStateSync(context.engine_adapter)
 
     def create_plan_evaluator(self, context: Context) -> PlanEvaluator:
+        from sqlmesh.core.plan import BuiltInPlanEvaluator
+
         return BuiltInPlanEvaluator(
             state_sync=context.state_sync,
             snapshot_evaluator=context.snapshot_evaluator,
             backfill_concurrent_tasks=context.concurrent_tasks,
             console=context.console,
+            notification_targets=context.notification_targets,
         )
 
 
@@ -101,13 +106,15 @@ class _BaseAirflowSchedulerConfig(_SchedulerConfig):
         )
 
     def create_plan_evaluator(self, context: Context) -> PlanEvaluator:
+        from sqlmesh.core.plan import AirflowPlanEvaluator
+
         return AirflowPlanEvaluator(
             airflow_client=self.get_client(context.console),
             dag_run_poll_interval_secs=self.dag_run_poll_interval_secs,
             dag_creation_poll_interval_secs=self.dag_creation_poll_interval_secs,
             dag_creation_max_retry_attempts=self.dag_creation_max_retry_attempts,
             console=context.console,
-            notification_targets=context.config.notification_targets,
+            notification_targets=context.notification_targets,
             backfill_concurrent_tasks=self.backfill_concurrent_tasks,
             ddl_concurrent_tasks=self.ddl_concurrent_tasks,
             users=context.config.users,
@@ -36,6 +36,7 @@ import abc
 import contextlib
 import typing as t
 import unittest.result
+from dataclasses import dataclass
 from io import StringIO
 from pathlib import Path
 from types import MappingProxyType
@@ -63,14 +64,23 @@ from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotEvaluator,
     SnapshotFingerprint,
+    SnapshotId,
+    fingerprints_from_models,
     to_table_mapping,
 )
 from sqlmesh.core.state_sync import StateReader, StateSync
-from sqlmesh.core.test import get_all_model_tests, run_model_tests, run_tests
+from sqlmesh.core.test import (
+    ModelTestMetadata,
+    ModelTestResultCache,
+    get_all_model_tests,
+    load_model_tests,
+    run_tests,
+)
 from sqlmesh.core.user import User
 from sqlmesh.utils import UniqueKeyDict, sys_path
+from sqlmesh.utils.cancellation import CancellationToken
 from sqlmesh.utils.dag import DAG
-from sqlmesh.utils.date import TimeLike, yesterday_ds
+from sqlmesh.utils.date import TimeLike, now_timestamp, yesterday_ds
 from sqlmesh.utils.errors import ConfigError, MissingDependencyError, PlanError
 
 if t.TYPE_CHECKING:
@@ -82,6 +92,15 @@ if t.TYPE_CHECKING:
     ModelOrSnapshot = t.Union[str, Model, Snapshot]
 
 
+@dataclass
+class _CachedSnapshot:
+    """A snapshot built from a local model along with the inputs it was built from."""
+
+    model: Model
+    settings: t.Tuple[str, str, str]
+    snapshot: Snapshot
+
+
 class BaseContext(abc.ABC):
     """The base context which defines methods to execute a model."""
 
@@ -217,12 +236,22 @@ class Context(BaseContext):
         self._macros: UniqueKeyDict[str, ExecutableOrMacro] = UniqueKeyDict("macros")
         self._hooks: UniqueKeyDict[str, hook] = UniqueKeyDict("hooks")
 
+        # Locally built snapshots and fingerprints are memoized until the models they were built from change.
+        self._snapshot_cache: t.Dict[str, _CachedSnapshot] = {}
+        self._fingerprint_cache: t.Dict[str, SnapshotFingerprint] = {}
+        self._snapshot_cache_audits: t.Optional[UniqueKeyDict[str, Audit]] = None
+        self._snapshot_cache_remote_ids: t.Set[SnapshotId] = set()
+
         self.path, self.config = t.cast(t.Tuple[Path, Config], next(iter(self.configs.items())))
         self._scheduler = self.config.scheduler
         self.connection = connection
         self.test_connection = test_connection
         self.environment_ttl = self.config.environment_ttl
         self.auto_categorize_changes = self.config.auto_categorize_changes
+        self.notification_targets = [
+            *(notification_targets or []),
+            *self.config.notification_targets,
+        ]
         connection_config = self.config.get_connection(connection)
         self.concurrent_tasks = concurrent_tasks or connection_config.concurrent_tasks
         self._engine_adapter = engine_adapter or connection_config.create_engine_adapter()
@@ -232,6 +261,7 @@ class Context(BaseContext):
             if test_connection is None
             else self.config.get_connection(test_connection)
         )
+        self._test_connection_config = test_connection_config
         self._test_engine_adapter = test_connection_config.create_engine_adapter()
 
         self.snapshot_evaluator = SnapshotEvaluator(
@@ -306,6 +336,7 @@ class Context(BaseContext):
             self.state_sync,
             max_workers=self.concurrent_tasks,
             console=self.console,
+            notification_targets=self.notification_targets,
         )
 
     @property
@@ -333,13 +364,24 @@ class Context(BaseContext):
 
     def refresh(self) -> None:
         """Refresh all models that have been updated."""
-        if self._loader.reload_needed():
-            self.load()
+        modified_paths = self._loader.modified_paths()
+        if modified_paths:
+            self.load(update_paths=modified_paths)
+
+    def load(self, update_paths: t.Iterable[str | Path] = ()) -> Context:
+        """Load all files in the context's path.
 
-    def load(self) -> Context:
-        """Load all files in the context's path."""
+        Args:
+            update_paths: The files which have been modified, added or removed since the last load. If provided,
+                only the parts of the project affected by these files are reloaded.
+        """
+        paths = [Path(path) for path in update_paths]
         with sys_path(*self.configs):
-            project = self._loader.load(self)
+            if paths:
+                project = self._loader.reload(self, paths)
+            else:
+                project = self._loader.load(self)
+                self._clear_snapshot_cache()
             self._hooks = project.hooks
             self._macros = project.macros
             self._models = project.models
@@ -356,6 +398,7 @@ class Context(BaseContext):
         end: t.Optional[TimeLike] = None,
         latest: t.Optional[TimeLike] = None,
         skip_janitor: bool = False,
+        cancellation_token: t.Optional[CancellationToken] = None,
     ) -> None:
         """Run the entire dag through the scheduler.
 
@@ -365,9 +408,12 @@ class Context(BaseContext):
             end: The end of the interval to render.
             latest: The latest time used for non incremental datasets.
             skip_janitor: Whether to skip the janitor task.
+            cancellation_token: The token used to cancel the run.
         """
         environment = environment or c.PROD
-        self.scheduler(environment=environment).run(environment, start, end, latest)
+        self.scheduler(environment=environment).run(
+            environment, start, end, latest, cancellation_token=cancellation_token
+        )
 
         if not skip_janitor:
             self._run_janitor()
@@ -422,43 +468,85 @@ class Context(BaseContext):
             else {}
         )
 
-        fingerprint_cache: t.Dict[str, SnapshotFingerprint] = {}
         models = self._models.copy()
         audits = self._audits.copy()
         projects = {config.project for config in self.configs.values()}
 
+        remote_ids = set()
         for name, snapshot in remote_snapshots.items():
             if name not in models and snapshot.project not in projects:
                 models[name] = snapshot.model
+                remote_ids.add(snapshot.snapshot_id)
 
                 for audit in snapshot.audits:
                     if name not in audits:
                         audits[name] = audit
 
-        snapshots = {}
+        # Models and audits sourced from other projects affect fingerprints of any model.
+        if (
+            self._snapshot_cache_audits is not self._audits
+            or remote_ids != self._snapshot_cache_remote_ids
+        ):
+            self._clear_snapshot_cache()
+            self._snapshot_cache_audits = self._audits
+            self._snapshot_cache_remote_ids = remote_ids
 
+        settings = {}
         for model in models.values():
             if model.name in remote_snapshots:
                 snapshot = remote_snapshots[model.name]
-                physical_schema = snapshot.physical_schema
-                ttl = snapshot.ttl
-                project = snapshot.project
+                settings[model.name] = (snapshot.physical_schema, snapshot.ttl, snapshot.project)
             else:
                 config = self.config_for_model(model)
-                physical_schema = config.physical_schema
-                ttl = config.snapshot_ttl
-                project = config.project
-
-            snapshot = Snapshot.from_model(
-                model,
-                models=models,
-                audits=audits,
-                cache=fingerprint_cache,
-                physical_schema=physical_schema,
-                ttl=ttl,
-                project=project,
+                settings[model.name] = (
+                    config.physical_schema,
+                    config.snapshot_ttl,
+                    config.project,
+                )
+
+        self._invalidate_snapshot_cache(
+            name
+            for name, model in models.items()
+            if name not in self._snapshot_cache
+            or self._snapshot_cache[name].model is not model
+            or self._snapshot_cache[name].settings != settings[name]
+        )
+        self._invalidate_snapshot_cache(name for name in self._snapshot_cache if name not in models)
+
+        fingerprints_from_models(
+            models,
+            names=[name for name in models if name not in self._fingerprint_cache],
+            physical_schema={name: schema for name, (schema, _, _) in settings.items()},
+            audits=audits,
+            cache=self._fingerprint_cache,
+        )
+
+        snapshots = {}
+        now = now_timestamp()
+
+        for model in models.values():
+            cached = self._snapshot_cache.get(model.name)
+            if cached is None:
+                physical_schema, ttl, project = settings[model.name]
+                cached = _CachedSnapshot(
+                    model=model,
+                    settings=settings[model.name],
+                    snapshot=Snapshot.from_model(
+                        model,
+                        models=models,
+                        audits=audits,
+                        cache=self._fingerprint_cache,
+                        physical_schema=physical_schema,
+                        ttl=ttl,
+                        project=project,
+                    ),
+                )
+                self._snapshot_cache[model.name] = cached
+
+            # Callers mutate the returned snapshots (e.g. when categorizing changes), so a copy is returned.
+            snapshots[model.name] = cached.snapshot.copy(
+                update={"created_ts": now, "updated_ts": now}
             )
-            snapshots[model.name] = snapshot
 
         stored_snapshots = self.state_reader.get_snapshots(
             [s.snapshot_id for s in snapshots.values() if not s.version]
@@ -466,6 +554,25 @@ class Context(BaseContext):
 
         return {name: stored_snapshots.get(s.snapshot_id, s) for name, s in snapshots.items()}
 
+    def _invalidate_snapshot_cache(self, names: t.Iterable[str]) -> None:
+        """Removes memoized snapshots and fingerprints of the given models and their descendants."""
+        invalidated = set(names)
+        if not invalidated:
+            return
+
+        graph = self.dag.graph
+        for name in self.dag.sorted():
+            if name not in invalidated and graph.get(name, set()) & invalidated:
+                invalidated.add(name)
+
+        for name in invalidated:
+            self._snapshot_cache.pop(name, None)
+            self._fingerprint_cache.pop(name, None)
+
+    def _clear_snapshot_cache(self) -> None:
+        self._snapshot_cache.clear()
+        self._fingerprint_cache.clear()
+
     def render(
         self,
         model_or_snapshot: ModelOrSnapshot,
@@ -577,6 +684,8 @@ class Context(BaseContext):
         latest: t.Optional[TimeLike] = None,
         create_from: t.Optional[str] = None,
         skip_tests: bool = False,
+        test_jobs: int = 1,
+        run_all_tests: bool = False,
         restate_models: t.Optional[t.Iterable[str]] = None,
         no_gaps: bool = False,
         skip_backfill: bool = False,
@@ -598,6 +707,10 @@ class Context(BaseContext):
             create_from: The environment to create the target environment from if it
                 doesn't exist. If not specified, the "prod" environment will be used.
             skip_tests: Unit tests are run by default so this will skip them if enabled
+            test_jobs: The number of unit tests to run concurrently. Default: 1.
+            run_all_tests: Whether to run all unit tests. By default only tests of models which have
+                changed compared to the target environment are run, and tests which have passed before
+                without any changes since are skipped.
             restate_models: A list of of either internal or external models that need to be restated
                 for the given plan interval. If the target environment is a production environment,
                 ALL snapshots that depended on these upstream tables will have their intervals deleted
@@ -628,10 +741,15 @@ class Context(BaseContext):
                 "When targeting the production enviornment either the backfill should not be skipped or the lack of data gaps should be enforced (--no-gaps flag)."
             )
 
-        self._run_plan_tests(skip_tests)
+        context_diff = self._context_diff(environment or c.PROD, create_from=create_from)
+        self._run_plan_tests(
+            skip_tests,
+            jobs=test_jobs,
+            context_diff=None if run_all_tests else context_diff,
+        )
 
         plan = Plan(
-            context_diff=self._context_diff(environment or c.PROD, create_from=create_from),
+            context_diff=context_diff,
             state_reader=self.state_reader,
             start=start,
             end=end,
@@ -654,7 +772,7 @@ class Context(BaseContext):
 
         return plan
 
-    def apply(self, plan: Plan) -> None:
+    def apply(self, plan: Plan, cancellation_token: t.Optional[CancellationToken] = None) -> None:
         """Applies a plan by pushing snapshots and backfilling data.
 
         Given a plan, it pushes snapshots into the state sync and then uses the scheduler
@@ -662,12 +780,15 @@ class Context(BaseContext):
 
         Args:
             plan: The plan to apply.
+            cancellation_token: The token used to cancel the plan application.
         """
         if not plan.context_diff.has_changes and not plan.requires_backfill:
             return
         if plan.uncategorized:
             raise PlanError("Can't apply a plan with uncategorized changes.")
-        self._scheduler.create_plan_evaluator(self).evaluate(plan)
+        self._scheduler.create_plan_evaluator(self).evaluate(
+            plan, cancellation_token=cancellation_token
+        )
 
     def diff(self, environment: t.Optional[str] = None, detailed: bool = False) -> None:
         """Show a diff of the current context with a given environment.
@@ -739,37 +860,59 @@ class Context(BaseContext):
         match_patterns: t.Optional[t.List[str]] = None,
         tests: t.Optional[t.List[str]] = None,
         verbose: bool = False,
+        jobs: int = 1,
+        models: t.Optional[t.Iterable[str]] = None,
+        run_all_tests: bool = False,
     ) -> unittest.result.TestResult:
-        """Discover and run model tests"""
+        """Discover and run model tests.
+
+        Args:
+            match_patterns: Only run tests whose names match at least one of these patterns.
+            tests: Specific tests to run, e.g. ["tests/test_orders.yaml::test_single_order"].
+            verbose: Whether to report the outcome of each test.
+            jobs: The number of tests to run concurrently. Each concurrently running group of tests
+                uses its own connection to the test engine.
+            models: Only run tests of these models. Tests of models which don't exist in this context
+                are always run.
+            run_all_tests: Whether to run tests which have passed before even if neither they nor
+                the models they test have changed since.
+
+        Returns:
+            The result of the test run.
+        """
         verbosity = 2 if verbose else 1
 
-        try:
-            if tests:
-                result = run_model_tests(
-                    tests=tests,
-                    models=self._models,
-                    engine_adapter=self._test_engine_adapter,
-                    verbosity=verbosity,
-                    patterns=match_patterns,
-                )
-            else:
-                test_meta = []
-
-                for path, config in self.configs.items():
-                    test_meta.extend(
-                        get_all_model_tests(
-                            path / c.TESTS,
-                            patterns=match_patterns,
-                            ignore_patterns=config.ignore_patterns,
-                        )
+        if tests:
+            test_meta = load_model_tests(tests, patterns=match_patterns)
+        else:
+            test_meta = []
+            for path, config in self.configs.items():
+                test_meta.extend(
+                    get_all_model_tests(
+                        path / c.TESTS,
+                        patterns=match_patterns,
+                        ignore_patterns=config.ignore_patterns,
                     )
-
-                result = run_tests(
-                    test_meta,
-                    models=self._models,
-                    engine_adapter=self._test_engine_adapter,
-                    verbosity=verbosity,
                 )
+
+        if models is not None:
+            selected = set(models)
+            test_meta = [
+                meta
+                for meta in test_meta
+                if meta.body.get("model") in selected or meta.body.get("model") not in self._models
+            ]
+
+        try:
+            result = run_tests(
+                test_meta,
+                models=self._models,
+                engine_adapter=self._test_engine_adapter,
+                verbosity=verbosity,
+                jobs=jobs,
+                engine_adapter_factory=self._test_connection_config.create_engine_adapter,
+                result_cache=None if run_all_tests else self._test_result_cache(test_meta),
+            )
         finally:
             self._test_engine_adapter.close()
         return result
@@ -859,12 +1002,34 @@ class Context(BaseContext):
         self.snapshot_evaluator.close()
 
     def _run_plan_tests(
-        self, skip_tests: bool = False
+        self,
+        skip_tests: bool = False,
+        jobs: int = 1,
+        context_diff: t.Optional[ContextDiff] = None,
     ) -> t.Tuple[t.Optional[unittest.result.TestResult], t.Optional[str]]:
+        """Runs tests prior to generating a plan.
+
+        If a context diff is provided, only tests of models which have been added or whose data has
+        changed directly or through one of their upstream models are run, and tests which have passed
+        before are skipped. Otherwise all tests are run.
+        """
         if self._test_engine_adapter and not skip_tests:
+            models = (
+                {
+                    *context_diff.added,
+                    *(
+                        name
+                        for name in context_diff.modified_snapshots
+                        if context_diff.directly_modified(name)
+                        or context_diff.indirectly_modified(name)
+                    ),
+                }
+                if context_diff
+                else None
+            )
             test_output_io = StringIO()
             with contextlib.redirect_stderr(test_output_io):
-                result = self.test()
+                result = self.test(jobs=jobs, models=models, run_all_tests=context_diff is None)
             test_output = test_output_io.getvalue()
             self.console.log_test_results(result, test_output, self._test_engine_adapter.dialect)
             if not result.wasSuccessful():
@@ -874,6 +1039,22 @@ class Context(BaseContext):
             return result, test_output
         return None, None
 
+    def _test_result_cache(self, tests: t.List[ModelTestMetadata]) -> ModelTestResultCache:
+        # Fingerprints are computed separately from snapshots, since they only need to cover the data
+        # of tested models and their upstream models and shouldn't require access to the state.
+        fingerprints = fingerprints_from_models(
+            self._models,
+            names=[test.body["model"] for test in tests if test.body.get("model") in self._models],
+            audits=self._audits,
+        )
+        return ModelTestResultCache(
+            self.path / c.CACHE,
+            fingerprints={
+                name: fingerprint.to_version() for name, fingerprint in fingerprints.items()
+            },
+            dialect=self._test_engine_adapter.dialect,
+        )
+
     @property
     def _model_tables(self) -> t.Dict[str, str]:
         """Mapping of model name to physical table name.
@@ -94,8 +94,21 @@ class ContextDiff(PydanticModel):
             if name not in added and snapshot.fingerprint != existing_info[name].fingerprint
         }
 
+        # Only the versioning information is fetched for all snapshots. Entire snapshots are only fetched
+        # for modified models and for stored snapshots which aren't available locally.
+        stored_versions = state_reader.get_snapshot_versions(
+            [snapshot.snapshot_id for snapshot in snapshots.values()]
+        )
         stored = state_reader.get_snapshots(
-            list(modified_info.values()) + [snapshot.snapshot_id for snapshot in snapshots.values()]
+            [
+                *modified_info.values(),
+                *(
+                    snapshot.snapshot_id
+                    for name, snapshot in snapshots.items()
+                    if snapshot.snapshot_id in stored_versions
+                    and (name in modified_info or not snapshot.version)
+                ),
+            ]
         )
 
         merged_snapshots = {}
@@ -105,18 +118,23 @@ class ContextDiff(PydanticModel):
 
         for name, snapshot in snapshots.items():
             modified = modified_info.get(name)
-            existing = stored.get(snapshot.snapshot_id)
+            existing_version = stored_versions.get(snapshot.snapshot_id)
 
-            if existing:
+            if existing_version:
+                # Versioned local snapshots have been fetched from the state already.
+                existing = stored.get(snapshot.snapshot_id, snapshot)
                 merged_snapshots[name] = existing.copy()
                 if modified:
                     modified_snapshots[name] = (existing, stored[modified.snapshot_id])
-                    for child, versions in existing.indirect_versions.items():
+                    for child, versions in existing_version.indirect_versions.items():
                         existing_versions = snapshot_remote_versions.get(child)
-                        if not existing_versions or existing_versions[1] < existing.created_ts:
+                        if (
+                            not existing_versions
+                            or existing_versions[1] < existing_version.created_ts
+                        ):
                             snapshot_remote_versions[child] = (
                                 versions,
-                                existing.created_ts,
+                                existing_version.created_ts,
                             )
             else:
                 snapshot = snapshot.copy()
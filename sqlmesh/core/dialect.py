@@ -5,12 +5,14 @@ import re
 import typing as t
 from difflib import unified_diff
 
-import pandas as pd
 from jinja2.meta import find_undeclared_variables
 from sqlglot import Dialect, Generator, Parser, TokenType, exp
 
 from sqlmesh.utils.jinja import ENVIRONMENT
 
+if t.TYPE_CHECKING:
+    import pandas as pd
+
 
 class Model(exp.Expression):
     arg_types = {"expressions": True}
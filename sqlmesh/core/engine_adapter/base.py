@@ -11,8 +11,11 @@ from __future__ import annotations
 import contextlib
 import itertools
 import logging
+import threading
+import time
 import typing as t
 import uuid
+import zlib
 
 import pandas as pd
 from sqlglot import Dialect, exp
@@ -34,12 +37,19 @@ from sqlmesh.core.schema_diff import SchemaDiffer
 from sqlmesh.utils import double_escape, optional_import
 from sqlmesh.utils.connection_pool import create_connection_pool
 from sqlmesh.utils.date import TimeLike, make_inclusive
-from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.errors import (
+    ExecutionCancelledError,
+    QueryTimeoutError,
+    SQLMeshError,
+)
+from sqlmesh.utils.tracing import tracer
 
 if t.TYPE_CHECKING:
     from sqlmesh.core._typing import TableName
     from sqlmesh.core.engine_adapter._typing import DF, QueryOrDF
     from sqlmesh.core.model.meta import IntervalUnit
+    from sqlmesh.utils.cancellation import CancellationToken
+    from sqlmesh.utils.tracing import Span
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +65,10 @@ class EngineAdapter:
             connection on every call.
         dialect: The dialect with which this adapter is associated.
         multithreaded: Indicates whether this adapter will be used by more than one thread.
+        max_connections: The maximum number of connections shared between threads when the adapter
+            is multithreaded. Unbounded if not set.
+        statement_timeout: The maximum number of seconds a single statement is allowed to run before
+            it gets cancelled. Unbounded if not set.
     """
 
     DIALECT = ""
@@ -62,6 +76,7 @@ class EngineAdapter:
     DEFAULT_SQL_GEN_KWARGS: t.Dict[str, str | bool | int] = {}
     ESCAPE_JSON = False
     SUPPORTS_INDEXES = False
+    SUPPORTS_PARTITION_OVERWRITE = False
     SCHEMA_DIFFER = SchemaDiffer()
 
     def __init__(
@@ -70,12 +85,18 @@ class EngineAdapter:
         dialect: str = "",
         sql_gen_kwargs: t.Optional[t.Dict[str, Dialect | bool | str]] = None,
         multithreaded: bool = False,
+        max_connections: t.Optional[int] = None,
+        statement_timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ):
         self.dialect = dialect.lower() or self.DIALECT
-        self._connection_pool = create_connection_pool(connection_factory, multithreaded)
+        self._connection_pool = create_connection_pool(
+            connection_factory, multithreaded, max_connections=max_connections
+        )
         self.sql_gen_kwargs = sql_gen_kwargs or {}
+        self.statement_timeout = statement_timeout
         self._extra_config = kwargs
+        self._execution_scope = threading.local()
 
     @property
     def cursor(self) -> t.Any:
@@ -86,9 +107,9 @@ class EngineAdapter:
         return None
 
     def recycle(self) -> t.Any:
-        """Closes all open connections and releases all allocated resources associated with any thread
-        except the calling one."""
-        self._connection_pool.close_all(exclude_calling_thread=True)
+        """Releases connections associated with any thread except the calling one. Depending on the
+        connection pool, released connections are either kept open for reuse or closed."""
+        self._connection_pool.release_all(exclude_calling_thread=True)
 
     def close(self) -> t.Any:
         """Closes all open connections and releases all allocated resources."""
@@ -402,6 +423,25 @@ class EngineAdapter:
             )
         )
 
+    def register_df_view(
+        self,
+        view_name: TableName,
+        df: pd.DataFrame,
+        columns_to_types: t.Dict[str, exp.DataType],
+    ) -> None:
+        """Create a view over a dataframe which is only queried through this engine adapter.
+
+        By default the dataframe is converted into a literal values statement. Engines which can query
+        dataframes in place register them with the current connection instead, in which case the view
+        can't be used by other connections.
+
+        Args:
+            view_name: The view name.
+            df: The dataframe.
+            columns_to_types: Columns of the view and their types.
+        """
+        self.create_view(view_name, df, columns_to_types)
+
     def create_schema(self, schema_name: str, ignore_if_exists: bool = True) -> None:
         """Create a schema from a name or qualified table name."""
         self.execute(
@@ -433,8 +473,9 @@ class EngineAdapter:
 
     def columns(self, table_name: TableName) -> t.Dict[str, exp.DataType]:
         """Fetches column names and types for the target table."""
-        self.execute(exp.Describe(this=exp.to_table(table_name), kind="TABLE"))
-        describe_output = self.cursor.fetchall()
+        with self.pinned_connection():
+            self.execute(exp.Describe(this=exp.to_table(table_name), kind="TABLE"))
+            describe_output = self.cursor.fetchall()
         return {
             column_name: exp.DataType.build(column_type, dialect=self.dialect)
             for column_name, column_type, *_ in itertools.takewhile(
@@ -528,37 +569,38 @@ class EngineAdapter:
         df: pd.DataFrame,
         columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None,
     ) -> None:
-        connection = self._connection_pool.get()
-        table = exp.to_table(table_name)
-        into = self._insert_into_expression(table_name, columns_to_types)
-
-        sqlalchemy = optional_import("sqlalchemy")
-        # pandas to_sql doesn't support insert overwrite, it only supports deleting the table or appending
-        if sqlalchemy and isinstance(connection, sqlalchemy.engine.Connectable):
-            df.to_sql(
-                table.sql(dialect=self.dialect),
-                connection,
-                if_exists="append",
-                index=False,
-                chunksize=self.DEFAULT_BATCH_SIZE,
-                method="multi",
-            )
-        else:
-            if not columns_to_types:
-                raise SQLMeshError(
-                    "Column Mapping must be specified when using a Pandas DataFrame and not using SQLAlchemy"
+        with self.pinned_connection():
+            connection = self._connection_pool.get()
+            table = exp.to_table(table_name)
+            into = self._insert_into_expression(table_name, columns_to_types)
+
+            sqlalchemy = optional_import("sqlalchemy")
+            # pandas to_sql doesn't support insert overwrite, it only supports deleting the table or appending
+            if sqlalchemy and isinstance(connection, sqlalchemy.engine.Connectable):
+                df.to_sql(
+                    table.sql(dialect=self.dialect),
+                    connection,
+                    if_exists="append",
+                    index=False,
+                    chunksize=self.DEFAULT_BATCH_SIZE,
+                    method="multi",
                 )
-            with self.transaction():
-                for i, expression in enumerate(
-                    self._pandas_to_sql(df, columns_to_types, self.DEFAULT_BATCH_SIZE)
-                ):
-                    self.execute(
-                        exp.Insert(
-                            this=into,
-                            expression=expression,
-                            overwrite=False,
-                        )
+            else:
+                if not columns_to_types:
+                    raise SQLMeshError(
+                        "Column Mapping must be specified when using a Pandas DataFrame and not using SQLAlchemy"
                     )
+                with self.transaction():
+                    for i, expression in enumerate(
+                        self._pandas_to_sql(df, columns_to_types, self.DEFAULT_BATCH_SIZE)
+                    ):
+                        self.execute(
+                            exp.Insert(
+                                this=into,
+                                expression=expression,
+                                overwrite=False,
+                            )
+                        )
 
     def insert_overwrite_by_time_partition(
         self,
@@ -569,7 +611,25 @@ class EngineAdapter:
         time_formatter: t.Callable[[TimeLike], exp.Expression],
         time_column: TimeColumn | exp.Column | str,
         columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None,
+        partitioned_by: t.Optional[t.List[str]] = None,
+        partition_interval_unit: t.Optional[IntervalUnit] = None,
     ) -> None:
+        """Overwrites the rows of the given time interval with the results of a query or dataframe.
+
+        If the engine supports it and the target table is partitioned by the time column only, the affected
+        partitions are replaced as a whole instead of deleting and re-inserting individual rows.
+
+        Args:
+            table_name: The name of the target table.
+            query_or_df: The SQL query to run or a dataframe.
+            start: The start of the interval.
+            end: The end of the interval.
+            time_formatter: A function which converts a time-like value into a literal of the time column type.
+            time_column: The time column of the target table.
+            columns_to_types: A mapping between the column name and its data type.
+            partitioned_by: The partition columns of the target table.
+            partition_interval_unit: The interval unit of the time partitions.
+        """
         low, high = [time_formatter(dt) for dt in make_inclusive(start, end)]
         if isinstance(time_column, TimeColumn):
             time_column = time_column.column
@@ -578,6 +638,43 @@ class EngineAdapter:
             low=low,
             high=high,
         )
+        if (
+            self.SUPPORTS_PARTITION_OVERWRITE
+            and partition_interval_unit is not None
+            and partitioned_by
+            and len(partitioned_by) == 1
+            and exp.to_column(partitioned_by[0]).name == exp.to_column(time_column).name
+        ):
+            return self._insert_overwrite_by_partition(
+                table_name,
+                query_or_df,
+                start,
+                end,
+                where,
+                time_formatter,
+                exp.to_column(time_column).name,
+                partition_interval_unit,
+                columns_to_types,
+            )
+        return self._insert_overwrite_by_condition(table_name, query_or_df, where, columns_to_types)
+
+    def _insert_overwrite_by_partition(
+        self,
+        table_name: TableName,
+        query_or_df: QueryOrDF,
+        start: TimeLike,
+        end: TimeLike,
+        where: exp.Condition,
+        time_formatter: t.Callable[[TimeLike], exp.Expression],
+        time_column: str,
+        partition_interval_unit: IntervalUnit,
+        columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None,
+    ) -> None:
+        """Replaces the time partitions covered by the given interval in one step.
+
+        Engines which set `SUPPORTS_PARTITION_OVERWRITE` override this method with their native partition
+        exchange mechanism. The default implementation falls back to a delete / insert.
+        """
         return self._insert_overwrite_by_condition(table_name, query_or_df, where, columns_to_types)
 
     @classmethod
@@ -696,16 +793,18 @@ class EngineAdapter:
         query: t.Union[exp.Expression, str],
         ignore_unsupported_errors: bool = False,
     ) -> t.Tuple:
-        self.execute(query, ignore_unsupported_errors=ignore_unsupported_errors)
-        return self.cursor.fetchone()
+        with self.pinned_connection():
+            self.execute(query, ignore_unsupported_errors=ignore_unsupported_errors)
+            return self.cursor.fetchone()
 
     def fetchall(
         self,
         query: t.Union[exp.Expression, str],
         ignore_unsupported_errors: bool = False,
     ) -> t.List[t.Tuple]:
-        self.execute(query, ignore_unsupported_errors=ignore_unsupported_errors)
-        return self.cursor.fetchall()
+        with self.pinned_connection():
+            self.execute(query, ignore_unsupported_errors=ignore_unsupported_errors)
+            return self.cursor.fetchall()
 
     def _fetch_native_df(self, query: t.Union[exp.Expression, str]) -> DF:
         """Fetches a DataFrame that can be either Pandas or PySpark from the cursor"""
@@ -714,7 +813,8 @@ class EngineAdapter:
 
     def fetchdf(self, query: t.Union[exp.Expression, str]) -> pd.DataFrame:
         """Fetches a Pandas DataFrame from the cursor"""
-        df = self._fetch_native_df(query)
+        with self.pinned_connection():
+            df = self._fetch_native_df(query)
         if not isinstance(df, pd.DataFrame):
             raise NotImplementedError(
                 "The cursor's `fetch_native_df` method is not returning a pandas DataFrame. Need to update `fetchdf` so a Pandas DataFrame is returned"
@@ -735,19 +835,80 @@ class EngineAdapter:
         ):
             yield
             return
-        self._connection_pool.begin()
+        with self.pinned_connection():
+            self._connection_pool.begin()
+            try:
+                yield
+            except Exception as e:
+                self._connection_pool.rollback()
+                raise e
+            else:
+                self._connection_pool.commit()
+
+    @contextlib.contextmanager
+    def pinned_connection(self) -> t.Generator[None, None, None]:
+        """A context manager which keeps the connection of the calling thread checked out until the outermost
+        context exits.
+
+        Outside of this context and outside of transactions the connection is returned to the pool as soon as
+        a statement completes, so this context must enclose statements whose results are read from the cursor
+        after `execute` returns.
+        """
+        scope = self._execution_scope
+        depth = getattr(scope, "connection_depth", 0)
+        scope.connection_depth = depth + 1
         try:
             yield
-        except Exception as e:
-            self._connection_pool.rollback()
-            raise e
-        else:
-            self._connection_pool.commit()
+        except Exception:
+            # The connection is health checked before it's reused by another thread.
+            scope.connection_failed = True
+            raise
+        finally:
+            scope.connection_depth = depth
+            if depth == 0:
+                failed = getattr(scope, "connection_failed", False)
+                scope.connection_failed = False
+                self._connection_pool.release(failed=failed)
 
     def supports_transactions(self, transaction_type: TransactionType) -> bool:
         """Whether or not the engine adapter supports transactions for the given transaction type."""
         return True
 
+    @contextlib.contextmanager
+    def cancellable(
+        self,
+        cancellation_token: t.Optional[CancellationToken] = None,
+        timeout: t.Optional[float] = None,
+    ) -> t.Generator[None, None, None]:
+        """A context manager which makes statements executed by the calling thread cancellable.
+
+        A statement which is running when the token gets cancelled or when the timeout expires is interrupted
+        using the engine's native cancellation mechanism. Nested contexts inherit the token and the deadline
+        of the enclosing one.
+
+        Args:
+            cancellation_token: The token used to cancel running statements.
+            timeout: The maximum number of seconds all statements executed within this context are allowed
+                to run combined.
+        """
+        scope = self._execution_scope
+        prev_token = getattr(scope, "cancellation_token", None)
+        prev_deadline = getattr(scope, "deadline", None)
+
+        deadline = prev_deadline
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            if prev_deadline is not None:
+                deadline = min(deadline, prev_deadline)
+
+        scope.cancellation_token = cancellation_token or prev_token
+        scope.deadline = deadline
+        try:
+            yield
+        finally:
+            scope.cancellation_token = prev_token
+            scope.deadline = prev_deadline
+
     def execute(
         self,
         sql: t.Union[str, exp.Expression],
@@ -760,7 +921,99 @@ class EngineAdapter:
         )
         sql = self._to_sql(sql, **to_sql_kwargs) if isinstance(sql, exp.Expression) else sql
         logger.debug(f"Executing SQL:\n{sql}")
-        self.cursor.execute(sql, **kwargs)
+        with self.pinned_connection(), tracer.span("engine_adapter.execute") as span:
+            with self._interruptible():
+                self.cursor.execute(sql, **kwargs)
+            if span:
+                self._set_execute_span_attributes(span, sql)
+
+    @contextlib.contextmanager
+    def _interruptible(self) -> t.Generator[threading.Event, None, None]:
+        """Cancels the statement executed within this context once the active cancellation token is
+        cancelled or the statement timeout expires.
+
+        Yields an event which is set as soon as the statement has been interrupted.
+        """
+        interrupted = threading.Event()
+        token: t.Optional[CancellationToken] = getattr(
+            self._execution_scope, "cancellation_token", None
+        )
+        timeout = self._remaining_timeout()
+
+        if token is None and timeout is None:
+            yield interrupted
+            return
+
+        if token is not None:
+            token.raise_if_cancelled()
+        if timeout is not None and timeout <= 0:
+            raise QueryTimeoutError("The execution timed out before the statement could start.")
+
+        cursor = self.cursor
+        timed_out = threading.Event()
+
+        def cancel() -> None:
+            interrupted.set()
+            self._cancel_query(cursor)
+
+        def cancel_on_timeout() -> None:
+            timed_out.set()
+            cancel()
+
+        unregister = token.on_cancel(cancel) if token is not None else None
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, cancel_on_timeout)
+            timer.daemon = True
+            timer.start()
+
+        try:
+            yield interrupted
+        except Exception as ex:
+            if timed_out.is_set():
+                raise QueryTimeoutError(
+                    f"The statement was cancelled after running for {timeout:.1f} seconds."
+                ) from ex
+            if interrupted.is_set():
+                raise ExecutionCancelledError("The statement was cancelled.") from ex
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if unregister is not None:
+                unregister()
+
+    def _remaining_timeout(self) -> t.Optional[float]:
+        deadline = getattr(self._execution_scope, "deadline", None)
+        remaining = deadline - time.monotonic() if deadline is not None else None
+        if self.statement_timeout is not None:
+            return (
+                min(remaining, self.statement_timeout)
+                if remaining is not None
+                else self.statement_timeout
+            )
+        return remaining
+
+    def _cancel_query(self, cursor: t.Any) -> None:
+        """Cancels the statement which is currently being executed by the given cursor.
+
+        This method is called from a thread other than the one executing the statement.
+        """
+        cancel = getattr(cursor, "cancel", None)
+        if callable(cancel):
+            cancel()
+        else:
+            logger.warning(
+                "Engine adapter %s doesn't support cancellation of running statements",
+                type(self).__name__,
+            )
+
+    def _set_execute_span_attributes(self, span: Span, sql: str) -> None:
+        span.set("dialect", self.dialect)
+        span.set("sql_hash", str(zlib.crc32(sql.encode("utf-8"))))
+        row_count = getattr(self.cursor, "rowcount", None)
+        if isinstance(row_count, int) and row_count >= 0:
+            span.set("row_count", row_count)
 
     def _create_table_properties(
         self,
@@ -25,8 +25,9 @@ class BasePostgresEngineAdapter(EngineAdapter):
             .from_("information_schema.columns")
             .where(f"table_name = '{table.alias_or_name}' AND table_schema = '{table.args['db']}'")
         )
-        self.execute(sql)
-        resp = self.cursor.fetchall()
+        with self.pinned_connection():
+            self.execute(sql)
+            resp = self.cursor.fetchall()
         return {
             column_name: exp.DataType.build(data_type, dialect=self.dialect)
             for column_name, data_type in resp
@@ -54,9 +55,9 @@ class BasePostgresEngineAdapter(EngineAdapter):
         if database_name:
             sql = sql.where(f"table_schema = '{database_name}'")
 
-        self.execute(sql)
-
-        result = self.cursor.fetchone()
+        with self.pinned_connection():
+            self.execute(sql)
+            result = self.cursor.fetchone()
 
         return result[0] == 1 if result is not None else False
 
@@ -13,6 +13,7 @@ from sqlmesh.core.engine_adapter.shared import (
     TransactionType,
 )
 from sqlmesh.utils import nullsafe_join
+from sqlmesh.utils.date import TimeLike
 from sqlmesh.utils.errors import SQLMeshError
 
 if t.TYPE_CHECKING:
@@ -20,9 +21,12 @@ if t.TYPE_CHECKING:
     from sqlmesh.core.engine_adapter._typing import QueryOrDF
     from sqlmesh.core.model.meta import IntervalUnit
 
+PARTITION_OVERWRITE_MODE_KEY = "spark.sql.sources.partitionOverwriteMode"
+
 
 class BaseSparkEngineAdapter(EngineAdapter):
     ESCAPE_JSON = True
+    SUPPORTS_PARTITION_OVERWRITE = True
 
     def replace_query(
         self,
@@ -62,6 +66,35 @@ class BaseSparkEngineAdapter(EngineAdapter):
             )
         )
 
+    def _insert_overwrite_by_partition(
+        self,
+        table_name: TableName,
+        query_or_df: QueryOrDF,
+        start: TimeLike,
+        end: TimeLike,
+        where: exp.Condition,
+        time_formatter: t.Callable[[TimeLike], exp.Expression],
+        time_column: str,
+        partition_interval_unit: IntervalUnit,
+        columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None,
+    ) -> None:
+        """
+        Replaces the partitions produced by the query with a single dynamic partition overwrite. Spark partitions
+        are keyed by the values of the time column, so the interval unit doesn't affect which partitions are
+        replaced. Partitions of the interval for which the query returns no rows are left as is.
+
+        The overwrite mode is only changed for the session of the connection used by this statement and is
+        reset right after.
+        """
+        with self.pinned_connection():
+            self.execute(f"SET {PARTITION_OVERWRITE_MODE_KEY}=dynamic")
+            try:
+                self._insert_overwrite_by_condition(
+                    table_name, query_or_df, columns_to_types=columns_to_types
+                )
+            finally:
+                self.execute(f"RESET {PARTITION_OVERWRITE_MODE_KEY}")
+
     def create_state_table(
         self,
         table_name: str,
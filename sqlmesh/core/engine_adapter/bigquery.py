@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import functools
 import logging
+import threading
 import typing as t
 
 import pandas as pd
@@ -20,6 +21,7 @@ from sqlmesh.core.model.meta import IntervalUnit
 from sqlmesh.core.schema_diff import SchemaDiffer
 from sqlmesh.utils.date import to_datetime
 from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.tracing import tracer
 
 if t.TYPE_CHECKING:
     from google.cloud.bigquery.client import Client as BigQueryClient
@@ -113,11 +115,12 @@ class BigQueryEngineAdapter(EngineAdapter):
         BigQuery's `fetchone` method doesn't call execute and therefore would not benefit from the execute
         configuration we have in place. Therefore this implementation calls execute instead.
         """
-        self.execute(query, ignore_unsupported_errors=ignore_unsupported_errors)
-        try:
-            return next(self.cursor._query_data)
-        except StopIteration:
-            return ()
+        with self.pinned_connection():
+            self.execute(query, ignore_unsupported_errors=ignore_unsupported_errors)
+            try:
+                return next(self.cursor._query_data)
+            except StopIteration:
+                return ()
 
     def fetchall(
         self,
@@ -128,8 +131,9 @@ class BigQueryEngineAdapter(EngineAdapter):
         BigQuery's `fetchone` method doesn't call execute and therefore would not benefit from the execute
         configuration we have in place. Therefore this implementation calls execute instead.
         """
-        self.execute(query, ignore_unsupported_errors=ignore_unsupported_errors)
-        return list(self.cursor._query_data)
+        with self.pinned_connection():
+            self.execute(query, ignore_unsupported_errors=ignore_unsupported_errors)
+            return list(self.cursor._query_data)
 
     def __load_pandas_to_temp_table(
         self,
@@ -297,6 +301,7 @@ class BigQueryEngineAdapter(EngineAdapter):
     def _retryable_execute(
         self,
         sql: str,
+        interrupted: t.Optional[threading.Event] = None,
     ) -> None:
         """
         BigQuery's Python DB API implementation does not support retries, so we have to implement them ourselves.
@@ -311,6 +316,9 @@ class BigQueryEngineAdapter(EngineAdapter):
             job_config=job_config,
             timeout=self._extra_config.get("job_creation_timeout_seconds"),
         )
+        if interrupted is not None and interrupted.is_set():
+            # The cancellation was requested while the job was being created.
+            self.cursor._query_job.cancel()
         results = self.cursor._query_job.result(
             timeout=self._extra_config.get("job_execution_timeout_seconds")  # type: ignore
         )
@@ -333,12 +341,23 @@ class BigQueryEngineAdapter(EngineAdapter):
         )
         sql = self._to_sql(sql, **to_sql_kwargs) if isinstance(sql, exp.Expression) else sql
         logger.debug(f"Executing SQL:\n{sql}")
-        retry.retry_target(
-            target=functools.partial(self._retryable_execute, sql=sql),
-            predicate=_ErrorCounter(self._extra_config["job_retries"]).should_retry,
-            sleep_generator=retry.exponential_sleep_generator(initial=1.0, maximum=3.0),
-            deadline=self._extra_config.get("job_retry_deadline_seconds"),
-        )
+        with self.pinned_connection(), tracer.span(
+            "engine_adapter.execute"
+        ) as span, self._interruptible() as interrupted:
+            error_counter = _ErrorCounter(self._extra_config["job_retries"])
+            retry.retry_target(
+                target=functools.partial(self._retryable_execute, sql=sql, interrupted=interrupted),
+                predicate=lambda ex: not interrupted.is_set() and error_counter.should_retry(ex),
+                sleep_generator=retry.exponential_sleep_generator(initial=1.0, maximum=3.0),
+                deadline=self._extra_config.get("job_retry_deadline_seconds"),
+            )
+            if span:
+                self._set_execute_span_attributes(span, sql)
+
+    def _cancel_query(self, cursor: t.Any) -> None:
+        query_job = getattr(cursor, "_query_job", None)
+        if query_job is not None:
+            query_job.cancel()
 
     def _get_data_objects(
         self, schema_name: str, catalog_name: t.Optional[str] = None
@@ -384,7 +403,7 @@ class _ErrorCounter:
 
         return (ServerError, BadRequest, ConnectionError)
 
-    def _is_retryable(self, error: t.Type[Exception]) -> bool:
+    def _is_retryable(self, error: Exception) -> bool:
         from google.api_core.exceptions import Forbidden
 
         if isinstance(error, self.retryable_errors):
@@ -395,7 +414,7 @@ class _ErrorCounter:
             return True
         return False
 
-    def should_retry(self, error: t.Type[Exception]) -> bool:
+    def should_retry(self, error: Exception) -> bool:
         if self.num_retries == 0:
             return False
         self.error_count += 1
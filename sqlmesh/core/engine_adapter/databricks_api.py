@@ -33,16 +33,19 @@ class DatabricksSQLEngineAdapter(BaseSparkEngineAdapter):
         """
         Returns all the data objects that exist in the given schema and optionally catalog.
         """
-        tables = [x.asDict() for x in self.cursor.tables(catalog_name, schema_name)]
-        if any(not row["TABLE_TYPE"] for row in tables):
-            if catalog_name:
-                self.execute(f"USE CATALOG {catalog_name}")
-            view_names = [
-                row.viewName for row in self.fetchdf(f"SHOW VIEWS FROM {schema_name}").itertuples()  # type: ignore
-            ]
-            for table in tables:
-                if not table["TABLE_TYPE"]:
-                    table["TABLE_TYPE"] = "VIEW" if table["TABLE_NAME"] in view_names else "TABLE"
+        with self.pinned_connection():
+            tables = [x.asDict() for x in self.cursor.tables(catalog_name, schema_name)]
+            if any(not row["TABLE_TYPE"] for row in tables):
+                if catalog_name:
+                    self.execute(f"USE CATALOG {catalog_name}")
+                view_names = [
+                    row.viewName for row in self.fetchdf(f"SHOW VIEWS FROM {schema_name}").itertuples()  # type: ignore
+                ]
+                for table in tables:
+                    if not table["TABLE_TYPE"]:
+                        table["TABLE_TYPE"] = (
+                            "VIEW" if table["TABLE_NAME"] in view_names else "TABLE"
+                        )
         return [
             DataObject(
                 catalog=row["TABLE_CAT"],
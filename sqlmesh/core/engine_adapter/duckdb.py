@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+import re
 import typing as t
 
 import pandas as pd
@@ -16,6 +17,14 @@ if t.TYPE_CHECKING:
 class DuckDBEngineAdapter(EngineAdapter):
     DIALECT = "duckdb"
 
+    def _cancel_query(self, cursor: t.Any) -> None:
+        # Older versions of DuckDB don't support interrupting running queries.
+        interrupt = getattr(cursor, "interrupt", None)
+        if callable(interrupt):
+            interrupt()
+        else:
+            super()._cancel_query(cursor)
+
     def _insert_append_pandas_df(
         self,
         table_name: TableName,
@@ -30,6 +39,28 @@ class DuckDBEngineAdapter(EngineAdapter):
             )
         )
 
+    def register_df_view(
+        self,
+        view_name: TableName,
+        df: pd.DataFrame,
+        columns_to_types: t.Dict[str, exp.DataType],
+    ) -> None:
+        relation_name = _registered_df_name(view_name)
+        self.cursor.register(relation_name, df)
+        self.create_view(
+            view_name,
+            exp.select(
+                *(
+                    exp.alias_(exp.cast(exp.column(column, quoted=True), to=kind.copy()), column)
+                    for column, kind in columns_to_types.items()
+                )
+            ).from_(relation_name),
+        )
+
+    def drop_view(self, view_name: TableName, ignore_if_not_exists: bool = True) -> None:
+        super().drop_view(view_name, ignore_if_not_exists=ignore_if_not_exists)
+        self.cursor.unregister(_registered_df_name(view_name))
+
     def _get_data_objects(
         self, schema_name: str, catalog_name: t.Optional[str] = None
     ) -> t.List[DataObject]:
@@ -60,3 +91,7 @@ class DuckDBEngineAdapter(EngineAdapter):
             )
             for row in df.itertuples()
         ]
+
+
+def _registered_df_name(view_name: TableName) -> str:
+    return "__sqlmesh_df__" + re.sub(r"\W", "_", exp.to_table(view_name).sql())
@@ -46,6 +46,10 @@ class PostgresEngineAdapter(BasePostgresEngineAdapter):
             self.execute(sql)
             return self.insert_append(table_name, query_or_df, columns_to_types)
 
+    def _cancel_query(self, cursor: t.Any) -> None:
+        # Sends a cancel request for the connection's backend, which is equivalent to pg_cancel_backend.
+        cursor.connection.cancel()
+
     def _fetch_native_df(self, query: t.Union[exp.Expression, str]) -> DF:
         """Fetches a Pandas DataFrame from a SQL query."""
         sql = self._to_sql(query) if isinstance(query, exp.Expression) else query
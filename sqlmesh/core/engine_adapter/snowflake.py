@@ -46,6 +46,13 @@ class SnowflakeEngineAdapter(EngineAdapter):
             df.columns = query.named_selects
         return df
 
+    def _cancel_query(self, cursor: t.Any) -> None:
+        # Each thread uses its own connection, so cancelling all queries of the cursor's session
+        # only affects the statement executed by this cursor. Unlike SYSTEM$CANCEL_QUERY this doesn't
+        # depend on the query ID, which the connector only assigns once the query has been submitted.
+        session_id = cursor.connection.session_id
+        cursor.connection.cursor().execute(f"SELECT SYSTEM$CANCEL_ALL_QUERIES({session_id})")
+
     def _get_data_objects(
         self, schema_name: str, catalog_name: t.Optional[str] = None
     ) -> t.List[DataObject]:
@@ -9,10 +9,12 @@ from sqlmesh.core.engine_adapter._typing import PySparkDataFrame, PySparkSession
 from sqlmesh.core.engine_adapter.base_spark import BaseSparkEngineAdapter
 from sqlmesh.core.engine_adapter.shared import DataObject, DataObjectType
 from sqlmesh.utils import nullsafe_join
+from sqlmesh.utils.date import TimeLike
 
 if t.TYPE_CHECKING:
     from sqlmesh.core._typing import TableName
     from sqlmesh.core.engine_adapter._typing import DF, QueryOrDF
+    from sqlmesh.core.model.meta import IntervalUnit
 
 
 class SparkEngineAdapter(BaseSparkEngineAdapter):
@@ -31,7 +33,8 @@ class SparkEngineAdapter(BaseSparkEngineAdapter):
         return self.fetch_pyspark_df(query).toPandas()
 
     def fetch_pyspark_df(self, query: t.Union[exp.Expression, str]) -> PySparkDataFrame:
-        return t.cast(PySparkDataFrame, self._fetch_native_df(query))
+        with self.pinned_connection():
+            return t.cast(PySparkDataFrame, self._fetch_native_df(query))
 
     def _insert_overwrite_by_condition(
         self,
@@ -47,6 +50,27 @@ class SparkEngineAdapter(BaseSparkEngineAdapter):
         else:
             super()._insert_overwrite_by_condition(table_name, query_or_df, where, columns_to_types)
 
+    def _insert_overwrite_by_partition(
+        self,
+        table_name: TableName,
+        query_or_df: QueryOrDF,
+        start: TimeLike,
+        end: TimeLike,
+        where: exp.Condition,
+        time_formatter: t.Callable[[TimeLike], exp.Expression],
+        time_column: str,
+        partition_interval_unit: IntervalUnit,
+        columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None,
+    ) -> None:
+        # The Spark session is shared between threads, so the overwrite mode is passed as an option of
+        # this write instead of being set on the session.
+        df = (
+            self.fetch_pyspark_df(query_or_df)
+            if isinstance(query_or_df, exp.Expression)
+            else self._ensure_pyspark_df(query_or_df)
+        )
+        self._insert_pyspark_df(table_name, df, overwrite=True, partition_overwrite_mode="dynamic")
+
     def insert_append(
         self,
         table_name: TableName,
@@ -96,13 +120,15 @@ class SparkEngineAdapter(BaseSparkEngineAdapter):
         table_name: TableName,
         df: PySparkDataFrame,
         overwrite: bool = False,
+        partition_overwrite_mode: t.Optional[str] = None,
     ) -> None:
         if isinstance(table_name, exp.Table):
             table_name = table_name.sql(dialect=self.dialect)
 
-        df.select(*self.spark.table(table_name).columns).write.insertInto(  # type: ignore
-            table_name, overwrite=overwrite
-        )
+        writer = df.select(*self.spark.table(table_name).columns).write  # type: ignore
+        if partition_overwrite_mode:
+            writer = writer.option("partitionOverwriteMode", partition_overwrite_mode)
+        writer.insertInto(table_name, overwrite=overwrite)
 
     def _create_table_from_df(
         self,
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import abc
+import hashlib
 import importlib
 import itertools
 import linecache
+import multiprocessing
 import os
 import sys
 import types
 import typing as t
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+from sqlglot import exp
 from sqlglot.errors import SqlglotError
 from sqlglot.schema import MappingSchema
 
@@ -20,9 +24,11 @@ from sqlmesh.core.audit import Audit
 from sqlmesh.core.dialect import parse
 from sqlmesh.core.hooks import HookRegistry, hook
 from sqlmesh.core.macros import MacroRegistry, macro
-from sqlmesh.core.model import Model, ModelCache, SeedModel, load_model
+from sqlmesh.core.model import Model, ModelCache, SeedModel, SqlModel, load_model
 from sqlmesh.core.model import model as model_registry
+from sqlmesh.core.model.seed import SeedFileLoader
 from sqlmesh.utils import UniqueKeyDict
+from sqlmesh.utils.cache import OptimizedQueryCache
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.errors import ConfigError
 
@@ -31,7 +37,23 @@ if t.TYPE_CHECKING:
     from sqlmesh.core.context import Context
 
 
-def update_model_schemas(dag: DAG[str], models: UniqueKeyDict[str, Model]) -> None:
+def update_model_schemas(
+    dag: DAG[str],
+    models: UniqueKeyDict[str, Model],
+    model_names: t.Optional[t.Collection[str]] = None,
+) -> None:
+    """Propagates the columns of each model to its downstream models.
+
+    Star queries are re-optimized against the new schema through the persistent optimized query cache, whose
+    entries are keyed by the schemas of the referenced tables. Models whose upstream columns didn't change since
+    the last load are therefore restored from the cache instead of being optimized again.
+
+    Args:
+        dag: The DAG of models.
+        models: All models by name.
+        model_names: The names of models whose schemas should be updated. The columns of all other models are
+            used as they are. Updates all models by default.
+    """
     schema = MappingSchema()
     for name in dag.sorted():
         model = models.get(name)
@@ -40,12 +62,13 @@ def update_model_schemas(dag: DAG[str], models: UniqueKeyDict[str, Model]) -> No
         if not model:
             continue
 
-        if model.contains_star_query and any(dep not in models for dep in model.depends_on):
-            raise ConfigError(
-                f"Can't expand SELECT * expression for model '{name}'. Projections for models that use external sources must be specified explicitly at '{model._path}'"
-            )
+        if model_names is None or name in model_names:
+            if model.contains_star_query and any(dep not in models for dep in model.depends_on):
+                raise ConfigError(
+                    f"Can't expand SELECT * expression for model '{name}'. Projections for models that use external sources must be specified explicitly at '{model._path}'"
+                )
 
-        model.update_schema(schema)
+            model.update_schema(schema)
         schema.add_table(name, model.columns_to_types)
 
 
@@ -64,6 +87,8 @@ class Loader(abc.ABC):
     def __init__(self) -> None:
         self._path_mtimes: t.Dict[Path, float] = {}
         self._dag: DAG[str] = DAG()
+        self._project: t.Optional[LoadedProject] = None
+        self._optimized_query_cache: t.Optional[OptimizedQueryCache] = None
 
     def load(self, context: Context) -> LoadedProject:
         """
@@ -79,31 +104,63 @@ class Loader(abc.ABC):
         self._context = context
         self._path_mtimes.clear()
         self._dag = DAG()
+        self._optimized_query_cache = OptimizedQueryCache(context.path / c.CACHE)
 
-        config_mtimes: t.Dict[Path, t.List[float]] = defaultdict(list)
+        config_files: t.Dict[Path, t.List[Path]] = defaultdict(list)
         for context_path, config in self._context.configs.items():
             for config_file in context_path.glob("config.*"):
                 self._track_file(config_file)
-                config_mtimes[context_path].append(self._path_mtimes[config_file])
+                config_files[context_path].append(config_file)
 
         for config_file in context.sqlmesh_path.glob("config.*"):
             self._track_file(config_file)
-            config_mtimes[context.sqlmesh_path].append(self._path_mtimes[config_file])
+            config_files[context.sqlmesh_path].append(config_file)
 
-        self._config_mtimes = {path: max(mtimes) for path, mtimes in config_mtimes.items()}
+        self._config_hashes = {
+            path: _hash(*(_file_hash(config_file) for config_file in sorted(files)))
+            for path, files in config_files.items()
+        }
 
         macros, hooks = self._load_scripts()
         models = self._load_models(macros, hooks)
         for model in models.values():
+            self._set_optimized_query_cache(model)
             self._add_model_to_dag(model)
         update_model_schemas(self._dag, models)
 
         audits = self._load_audits()
 
-        project = LoadedProject(
+        self._project = LoadedProject(
             macros=macros, hooks=hooks, models=models, audits=audits, dag=self._dag
         )
-        return project
+        return self._project
+
+    def reload(self, context: Context, paths: t.Iterable[Path]) -> LoadedProject:
+        """
+        Reloads the project after the given files have been modified, added or removed.
+
+        This implementation reloads the entire project. Loaders may override it to only reload
+        what is affected by the given files.
+
+        Args:
+            context: The context to load macros and models for
+            paths: The paths of the modified files
+        """
+        return self.load(context)
+
+    def modified_paths(self) -> t.Set[Path]:
+        """
+        Returns the files the macros and models depend on which were modified or removed
+        since the last load.
+        """
+        modified = set()
+        for path, initial_mtime in self._path_mtimes.items():
+            try:
+                if path.stat().st_mtime > initial_mtime:
+                    modified.add(path)
+            except FileNotFoundError:
+                modified.add(path)
+        return modified
 
     def reload_needed(self) -> bool:
         """
@@ -113,10 +170,7 @@ class Loader(abc.ABC):
         Returns:
             True if a modification is found; False otherwise
         """
-        return any(
-            path.stat().st_mtime > initial_mtime
-            for path, initial_mtime in self._path_mtimes.items()
-        )
+        return bool(self.modified_paths())
 
     @abc.abstractmethod
     def _load_scripts(self) -> t.Tuple[MacroRegistry, HookRegistry]:
@@ -138,33 +192,154 @@ class Loader(abc.ABC):
         """Project file to track for modifications"""
         self._path_mtimes[path] = path.stat().st_mtime
 
+    def _set_optimized_query_cache(self, model: Model) -> None:
+        """Makes the model consult the project's cache of optimized queries. Models may come from other
+        processes or from the model cache, so the cache is set again once a model has been loaded."""
+        if isinstance(model, SqlModel):
+            model.set_optimized_query_cache(self._optimized_query_cache)
+
 
 class SqlMeshLoader(Loader):
     """Loads macros and models for a context using the SQLMesh file formats"""
 
+    def reload(self, context: Context, paths: t.Iterable[Path]) -> LoadedProject:
+        """
+        Reloads only the files that have been modified, added or removed, as well as the models that
+        use modified macros or hooks. Schemas are only updated for the reloaded models and their
+        downstream models. Configuration changes cause the entire project to be reloaded.
+
+        Args:
+            context: The context to load macros and models for
+            paths: The paths of the modified files
+        """
+        project = self._project
+        if project is None or context is not self._context:
+            return self.load(context)
+
+        modified_paths = {_normalize_path(path) for path in paths}
+        if any(self._is_config_file(path) for path in modified_paths):
+            return self.load(context)
+
+        linecache.clearcache()
+
+        for tracked_path in list(self._path_mtimes):
+            if not tracked_path.exists():
+                self._path_mtimes.pop(tracked_path)
+
+        models_by_path: t.Dict[Path, t.List[Model]] = defaultdict(list)
+        for model in project.models.values():
+            models_by_path[_normalize_path(model._path)].append(model)
+            if isinstance(model, SeedModel):
+                models_by_path[_normalize_path(model.seed_path)].append(model)
+
+        scripts_modified = False
+        audits_modified = False
+        model_paths: t.Set[Path] = set()
+
+        for path in modified_paths:
+            model_paths.update(_normalize_path(model._path) for model in models_by_path[path])
+
+            context_path = self._context_path(path)
+            if context_path is None or any(
+                path.match(ignore_pattern)
+                for ignore_pattern in self._context.configs[context_path].ignore_patterns
+            ):
+                continue
+
+            folder = path.relative_to(_normalize_path(context_path)).parts[0]
+            if folder in (c.MACROS, c.HOOKS) and path.suffix == ".py":
+                scripts_modified = True
+            elif folder == c.AUDITS and path.suffix == ".sql":
+                audits_modified = True
+            elif folder == c.MODELS and path.suffix in (".sql", ".py"):
+                model_paths.add(path)
+
+        macros, hooks = project.macros, project.hooks
+        if scripts_modified:
+            script_paths = {path for path, _ in self._script_paths}
+            macros, hooks = self._load_scripts()
+            script_paths.update(path for path, _ in self._script_paths)
+            modified_scripts = modified_paths & script_paths
+
+            # Models embed the source of the macros and hooks they use, so they need to be reloaded
+            # if any of them has been modified.
+            for model in project.models.values():
+                context_path = self._context_path(_normalize_path(model._path))
+                if context_path is not None and any(
+                    _normalize_path(context_path / executable.path) in modified_scripts
+                    for executable in model.python_env.values()
+                    if executable.path
+                ):
+                    model_paths.add(_normalize_path(model._path))
+
+        models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
+        reloaded_names = set()
+        for name, model in project.models.items():
+            if _normalize_path(model._path) in model_paths:
+                reloaded_names.add(name)
+            else:
+                models[name] = model
+
+        sql_files = []
+        python_files = []
+        for path in sorted(model_paths):
+            context_path = self._context_path(path)
+            if context_path is None or not path.exists():
+                continue
+            # Use the same form of the path as a full load would.
+            path = context_path / path.relative_to(_normalize_path(context_path))
+            if path.suffix == ".sql":
+                sql_files.append((context_path, path))
+            else:
+                python_files.append((context_path, path))
+
+        reloaded_models = self._load_sql_model_paths(sql_files, macros, hooks)
+        for context_path, path in python_files:
+            reloaded_models.extend(
+                self._load_python_model_file(
+                    path, context_path, self._context.configs[context_path]
+                )
+            )
+        for model in reloaded_models:
+            self._set_optimized_query_cache(model)
+            models[model.name] = model
+            reloaded_names.add(model.name)
+
+        self._dag = DAG()
+        for model in models.values():
+            self._add_model_to_dag(model)
+
+        # Columns of models downstream from reloaded or removed models may have changed as well.
+        updated_names = set(reloaded_names)
+        graph = self._dag.graph
+        for name in self._dag.sorted():
+            if name not in updated_names and graph.get(name, set()) & updated_names:
+                updated_names.add(name)
+        update_model_schemas(self._dag, models, model_names=updated_names)
+
+        audits = self._load_audits() if audits_modified else project.audits
+
+        self._project = LoadedProject(
+            macros=macros, hooks=hooks, models=models, audits=audits, dag=self._dag
+        )
+        return self._project
+
     def _load_scripts(self) -> t.Tuple[MacroRegistry, HookRegistry]:
         """Loads all user defined hooks and macros."""
         # Store a copy of the macro registry
         standard_hooks = hook.get_registry()
         standard_macros = macro.get_registry()
 
-        macros_max_mtime: t.Optional[float] = None
+        self._script_paths: t.List[t.Tuple[Path, Path]] = []
 
         for context_path, config in self._context.configs.items():
             for path in itertools.chain(
                 self._glob_paths(context_path / c.MACROS, config=config, extension=".py"),
                 self._glob_paths(context_path / c.HOOKS, config=config, extension=".py"),
             ):
-                if self._import_python_file(path, context_path):
+                if _import_python_file(path, context_path):
+                    self._script_paths.append((path, context_path))
                     self._track_file(path)
-                    macro_file_mtime = self._path_mtimes[path]
-                    macros_max_mtime = (
-                        max(macros_max_mtime, macro_file_mtime)
-                        if macros_max_mtime
-                        else macro_file_mtime
-                    )
-
-        self._macros_max_mtime = macros_max_mtime
 
         hooks = hook.get_registry()
         macros = macro.get_registry()
@@ -189,72 +364,146 @@ class SqlMeshLoader(Loader):
     ) -> UniqueKeyDict[str, Model]:
         """Loads the sql models into a Dict"""
         models: UniqueKeyDict = UniqueKeyDict("models")
-        for context_path, config in self._context.configs.items():
-            cache = SqlMeshLoader._Cache(self, context_path)
+        files = [
+            (context_path, path)
+            for context_path, config in self._context.configs.items()
+            for path in self._glob_paths(context_path / c.MODELS, config=config, extension=".sql")
+        ]
+        for model in self._load_sql_model_paths(files, macros, hooks):
+            models[model.name] = model
+        return models
 
-            for path in self._glob_paths(context_path / c.MODELS, config=config, extension=".sql"):
-                if not os.path.getsize(path):
-                    continue
+    def _load_sql_model_paths(
+        self, files: t.List[t.Tuple[Path, Path]], macros: MacroRegistry, hooks: HookRegistry
+    ) -> t.List[Model]:
+        """Loads the sql models from the given (context path, file path) pairs in the order of the files."""
+        paths_by_context: t.Dict[Path, t.List[Path]] = defaultdict(list)
+        for context_path, path in files:
+            if not os.path.getsize(path):
+                continue
+
+            self._track_file(path)
+            paths_by_context[context_path].append(path)
+
+        caches = {
+            context_path: SqlMeshLoader._Cache(self, context_path)
+            for context_path in paths_by_context
+        }
+        cached_models: t.Dict[Path, Model] = {}
+        for context_path, paths in paths_by_context.items():
+            cached_models.update(caches[context_path].get_many(paths))
+
+        loaded_models = self._load_sql_model_files(
+            [
+                (context_path, path)
+                for context_path, paths in paths_by_context.items()
+                for path in paths
+                if path not in cached_models
+            ],
+            macros,
+            hooks,
+        )
+        for context_path, paths in paths_by_context.items():
+            caches[context_path].put_many(
+                {path: loaded_models[path] for path in paths if path in loaded_models}
+            )
 
-                self._track_file(path)
+        # Models are returned in the order of their files regardless of the order in which they were loaded.
+        models = []
+        for context_path, path in files:
+            model = cached_models.get(path) or loaded_models.get(path)
+            if model is None:
+                continue
+            model._path = path
+            models.append(model)
+
+            if isinstance(model, SeedModel):
+                seed_path = model.seed_path
+                self._track_file(seed_path)
+                # Seeds of models loaded in processes only carry the hash of their content.
+                model.seed.set_content_loader(SeedFileLoader(seed_path))
 
-                def _load() -> Model:
-                    with open(path, "r", encoding="utf-8") as file:
-                        try:
-                            expressions = parse(
-                                file.read(), default_dialect=config.model_defaults.dialect
-                            )
-                        except SqlglotError as ex:
-                            raise ConfigError(
-                                f"Failed to parse a model definition at '{path}': {ex}."
-                            )
-                    return load_model(
-                        expressions,
-                        defaults=config.model_defaults.dict(),
-                        macros=macros,
-                        hooks=hooks,
-                        path=Path(path).absolute(),
-                        module_path=context_path,
-                        dialect=config.model_defaults.dialect,
-                        time_column_format=config.time_column_format,
-                    )
-
-                model = cache.get_or_load_model(path, _load)
-                models[model.name] = model
+        return models
 
-                if isinstance(model, SeedModel):
-                    seed_path = model.seed_path
-                    self._track_file(seed_path)
+    def _load_sql_model_files(
+        self, files: t.List[t.Tuple[Path, Path]], macros: MacroRegistry, hooks: HookRegistry
+    ) -> t.Dict[Path, Model]:
+        """Loads models from the given (context path, file path) pairs.
 
-        return models
+        If configured, the files are distributed across a pool of processes.
+        """
+        processes = self._context.config.model_load_processes
+        if processes <= 1 or len(files) <= 1:
+            return {
+                path: _load_sql_model(
+                    path,
+                    context_path,
+                    self._context.configs[context_path],
+                    macros,
+                    hooks,
+                    optimized_query_cache=self._optimized_query_cache,
+                )
+                for context_path, path in files
+            }
+
+        workers = min(processes, len(files))
+        configs = {
+            context_path: _ModelLoadConfig.from_config(config)
+            for context_path, config in self._context.configs.items()
+        }
+
+        # Macro and hook registries are process-local, so each worker needs to import the scripts itself.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_model_load_process,
+            initargs=(list(self._context.configs), self._script_paths),
+        ) as executor:
+            serialized_models = executor.map(
+                _load_serialized_sql_model,
+                [path for _, path in files],
+                [context_path for context_path, _ in files],
+                [configs[context_path] for context_path, _ in files],
+                chunksize=max(1, len(files) // (workers * 4)),
+            )
+            return {
+                path: _deserialize_model(serialized_model)
+                for (_, path), serialized_model in zip(files, serialized_models)
+            }
 
     def _load_python_models(self) -> UniqueKeyDict[str, Model]:
         """Loads the python models into a Dict"""
         models: UniqueKeyDict = UniqueKeyDict("models")
-        registry = model_registry.registry()
-        registry.clear()
-        registered: t.Set[str] = set()
 
         for context_path, config in self._context.configs.items():
             for path in self._glob_paths(context_path / c.MODELS, config=config, extension=".py"):
-                if not os.path.getsize(path):
-                    continue
-
-                self._track_file(path)
-                self._import_python_file(path, context_path)
-                new = registry.keys() - registered
-                registered |= new
-                for name in new:
-                    model = registry[name].model(
-                        path=path,
-                        module_path=context_path,
-                        defaults=config.model_defaults.dict(),
-                        time_column_format=config.time_column_format,
-                    )
+                for model in self._load_python_model_file(path, context_path, config):
                     models[model.name] = model
 
         return models
 
+    def _load_python_model_file(
+        self, path: Path, context_path: Path, config: Config
+    ) -> t.List[Model]:
+        """Loads the python models defined in the given file."""
+        if not os.path.getsize(path):
+            return []
+
+        registry = model_registry.registry()
+        registry.clear()
+
+        self._track_file(path)
+        _import_python_file(path, context_path)
+        return [
+            registry[name].model(
+                path=path,
+                module_path=context_path,
+                defaults=config.model_defaults.dict(),
+                time_column_format=config.time_column_format,
+            )
+            for name in registry
+        ]
+
     def _load_audits(self) -> UniqueKeyDict[str, Audit]:
         """Loads all the model audits."""
         audits_by_name: UniqueKeyDict[str, Audit] = UniqueKeyDict("audits")
@@ -272,15 +521,18 @@ class SqlMeshLoader(Loader):
                         audits_by_name[audit.name] = audit
         return audits_by_name
 
-    def _import_python_file(self, file: Path, context_path: Path) -> types.ModuleType:
-        relative_path = file.relative_to(context_path)
-        module_name = str(relative_path.with_suffix("")).replace(os.path.sep, ".")
-        # remove the entire module hierarchy in case they were already loaded
-        parts = module_name.split(".")
-        for i in range(len(parts)):
-            sys.modules.pop(".".join(parts[0 : i + 1]), None)
+    def _is_config_file(self, path: Path) -> bool:
+        return path.name.startswith("config.") and path.parent in {
+            _normalize_path(config_path)
+            for config_path in (*self._context.configs, self._context.sqlmesh_path)
+        }
 
-        return importlib.import_module(module_name)
+    def _context_path(self, path: Path) -> t.Optional[Path]:
+        """Returns the context path which contains the given normalized file path."""
+        for context_path in self._context.configs:
+            if _normalize_path(context_path) in path.parents:
+                return context_path
+        return None
 
     def _glob_paths(
         self, path: Path, config: Config, extension: str
@@ -308,14 +560,32 @@ class SqlMeshLoader(Loader):
             self._loader = loader
             self._context_path = context_path
 
-            self._model_cache = ModelCache(loader._context.path / c.CACHE)
-
-        def get_or_load_model(self, target_path: Path, loader: t.Callable[[], Model]) -> Model:
-            model = self._model_cache.get_or_load(
-                self._cache_entry_name(target_path), self._model_cache_entry_id(target_path), loader
+            self._model_cache = ModelCache(
+                loader._context.path / c.CACHE, file_hash=self._script_hash
+            )
+            self._script_hashes: t.Dict[str, t.Optional[str]] = {}
+
+        def get_many(self, target_paths: t.List[Path]) -> t.Dict[Path, Model]:
+            names = {
+                self._cache_entry_name(target_path): target_path for target_path in target_paths
+            }
+            models = self._model_cache.get_many(
+                {
+                    name: self._model_cache_entry_id(target_path)
+                    for name, target_path in names.items()
+                }
+            )
+            return {names[name]: model for name, model in models.items()}
+
+        def put_many(self, models: t.Dict[Path, Model]) -> None:
+            self._model_cache.put_many(
+                (
+                    self._cache_entry_name(target_path),
+                    self._model_cache_entry_id(target_path),
+                    model,
+                )
+                for target_path, model in models.items()
             )
-            model._path = target_path
-            return model
 
         def _cache_entry_name(self, target_path: Path) -> str:
             return "__".join(target_path.relative_to(self._context_path).parts).replace(
@@ -323,10 +593,121 @@ class SqlMeshLoader(Loader):
             )
 
         def _model_cache_entry_id(self, model_path: Path) -> str:
-            mtimes = [
-                self._loader._path_mtimes[model_path],
-                self._loader._macros_max_mtime,
-                self._loader._config_mtimes.get(self._context_path),
-                self._loader._config_mtimes.get(self._loader._context.sqlmesh_path),
-            ]
-            return str(int(max(m for m in mtimes if m is not None)))
+            # Macros and hooks used by the model are validated separately by the model cache, since
+            # it's not known which of them the model uses before it has been loaded.
+            return _hash(
+                _file_hash(model_path),
+                self._loader._config_hashes.get(self._context_path, ""),
+                self._loader._config_hashes.get(self._loader._context.sqlmesh_path, ""),
+            )
+
+        def _script_hash(self, relative_path: str) -> t.Optional[str]:
+            if relative_path not in self._script_hashes:
+                try:
+                    self._script_hashes[relative_path] = _file_hash(
+                        self._context_path / relative_path
+                    )
+                except OSError:
+                    self._script_hashes[relative_path] = None
+            return self._script_hashes[relative_path]
+
+
+@dataclass
+class _ModelLoadConfig:
+    """The subset of a project config needed to load a SQL model, sent to model load processes."""
+
+    defaults: t.Dict[str, t.Any]
+    dialect: t.Optional[str]
+    time_column_format: str
+
+    @classmethod
+    def from_config(cls, config: Config) -> _ModelLoadConfig:
+        return cls(
+            defaults=config.model_defaults.dict(),
+            dialect=config.model_defaults.dialect,
+            time_column_format=config.time_column_format,
+        )
+
+
+_SerializedModel = t.Tuple[t.Type[Model], t.Dict[str, t.Any], t.Optional[t.Dict[str, t.Any]]]
+
+
+def _load_sql_model(
+    path: Path,
+    context_path: Path,
+    config: Config | _ModelLoadConfig,
+    macros: MacroRegistry,
+    hooks: HookRegistry,
+    optimized_query_cache: t.Optional[OptimizedQueryCache] = None,
+) -> Model:
+    if not isinstance(config, _ModelLoadConfig):
+        config = _ModelLoadConfig.from_config(config)
+
+    with open(path, "r", encoding="utf-8") as file:
+        try:
+            expressions = parse(file.read(), default_dialect=config.dialect)
+        except SqlglotError as ex:
+            raise ConfigError(f"Failed to parse a model definition at '{path}': {ex}.")
+
+    return load_model(
+        expressions,
+        defaults=config.defaults,
+        macros=macros,
+        hooks=hooks,
+        path=Path(path).absolute(),
+        module_path=context_path,
+        dialect=config.dialect,
+        time_column_format=config.time_column_format,
+        optimized_query_cache=optimized_query_cache,
+    )
+
+
+def _init_model_load_process(
+    context_paths: t.List[Path], script_paths: t.List[t.Tuple[Path, Path]]
+) -> None:
+    for context_path in context_paths:
+        if str(context_path) not in sys.path:
+            sys.path.insert(0, str(context_path))
+
+    for path, context_path in script_paths:
+        _import_python_file(path, context_path)
+
+
+def _load_serialized_sql_model(
+    path: Path, context_path: Path, config: _ModelLoadConfig
+) -> _SerializedModel:
+    """Loads a SQL model in a model load process and serializes it the same way ModelCache does."""
+    model = _load_sql_model(path, context_path, config, macro.get_registry(), hook.get_registry())
+    rendered_query = model.render_query().dump() if isinstance(model, SqlModel) else None
+    return type(model), model.dict(), rendered_query
+
+
+def _deserialize_model(serialized_model: _SerializedModel) -> Model:
+    model_type, model_dict, rendered_query = serialized_model
+    model = model_type.parse_obj(model_dict)
+    if rendered_query is not None and isinstance(model, SqlModel):
+        model._query_renderer.update_cache(exp.Expression.load(rendered_query))
+    return model
+
+
+def _import_python_file(file: Path, context_path: Path) -> types.ModuleType:
+    relative_path = file.relative_to(context_path)
+    module_name = str(relative_path.with_suffix("")).replace(os.path.sep, ".")
+    # remove the entire module hierarchy in case they were already loaded
+    parts = module_name.split(".")
+    for i in range(len(parts)):
+        sys.modules.pop(".".join(parts[0 : i + 1]), None)
+
+    return importlib.import_module(module_name)
+
+
+def _file_hash(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def _hash(*parts: str) -> str:
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _normalize_path(path: Path | str) -> Path:
+    return Path(os.path.realpath(path))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import typing as t
 from functools import reduce
 from string import Template
@@ -21,7 +22,7 @@ from sqlmesh.core.dialect import (
 )
 from sqlmesh.utils import UniqueKeyDict, registry_decorator
 from sqlmesh.utils.errors import MacroEvalError, SQLMeshError
-from sqlmesh.utils.jinja import JinjaMacroRegistry
+from sqlmesh.utils.jinja import JinjaMacroRegistry, has_jinja
 from sqlmesh.utils.metaprogramming import Executable, prepare_env, print_exception
 
 
@@ -126,11 +127,35 @@ class MacroEvaluator:
             raise MacroEvalError(f"Error trying to eval macro.") from e
 
     def transform(self, query: exp.Expression) -> exp.Expression | t.List[exp.Expression] | None:
+        # Macro results are spliced directly into the tree. If any of them could be parsed differently
+        # in the context it's spliced into, the whole tree is regenerated and parsed again instead.
+        reparse = False
+
+        def _splice(
+            node: exp.Expression, value: exp.Expression | t.List[exp.Expression] | None
+        ) -> exp.Expression | t.List[exp.Expression] | None:
+            nonlocal reparse
+            if value is None or reparse:
+                return value
+            if isinstance(value, list):
+                return [_splice(node, item) for item in value]  # type: ignore
+            if isinstance(value, _DIALECT_SPECIFIC_TYPES):
+                value = self.parse_one(value.sql(dialect=self.dialect))
+            if not _is_spliceable(value, node.parent, node.arg_key):
+                reparse = True
+            return value
+
         def _transform_node(node: exp.Expression) -> exp.Expression:
             if isinstance(node, MacroVar):
-                return exp.convert(_norm_env_value(self.locals[node.name]))
+                value = self.locals[node.name]
+                converted = exp.convert(_norm_env_value(value))
+                if isinstance(value, (exp.Expression, list, tuple)):
+                    # The value may be spliced more than once, so it must not be shared between trees.
+                    converted = converted.copy()
+                return _splice(node, converted)  # type: ignore
             elif node.is_string:
-                node.set("this", self.jinja_env.from_string(node.this).render())
+                if has_jinja(node.this):
+                    node.set("this", self.jinja_env.from_string(node.this).render())
                 return node
             else:
                 return node
@@ -144,11 +169,13 @@ class MacroEvaluator:
                 node, lambda n: n if isinstance(n, exp.Lambda) else evaluate_macros(n)
             )
             if isinstance(node, MacroFunc):
-                return self.evaluate(node)
+                return _splice(node, self.evaluate(node))
             return node
 
         transformed = evaluate_macros(query)
 
+        if not reparse:
+            return transformed
         if isinstance(transformed, list):
             return [self.parse_one(node.sql(dialect=self.dialect)) for node in transformed]
         elif isinstance(transformed, Jinja):
@@ -303,6 +330,62 @@ def _norm_var_arg_lambda(
     return expressions, func
 
 
+_UNSIGNED_NUMBER = re.compile(r"\d+(\.\d+)?")
+
+# Expressions which are generated differently depending on the dialect, e.g. TIME_STR_TO_TIME('...')
+# becomes CAST('...' AS TIMESTAMP) in DuckDB. They are parsed again to match the dialect's representation.
+_DIALECT_SPECIFIC_TYPES = (exp.TimeStrToTime, exp.DateStrToDate)
+
+# Nodes in which a spliced expression is delimited by commas or keywords, so that its generated SQL
+# can't be parsed differently due to operator precedence.
+_DELIMITED_PARENTS = (
+    exp.Select,
+    exp.Where,
+    exp.Having,
+    exp.Qualify,
+    exp.Paren,
+    exp.Tuple,
+    exp.Array,
+    exp.Alias,
+    exp.Ordered,
+    exp.Group,
+    exp.Func,
+)
+
+# Nodes in which expressions are parsed as tables or other non-scalar constructs.
+_NON_SCALAR_PARENTS = (exp.From, exp.Join, exp.Table, exp.Into, exp.In, exp.Lateral)
+
+
+def _is_spliceable(
+    value: exp.Expression, parent: t.Optional[exp.Expression], arg_key: t.Optional[str]
+) -> bool:
+    """Returns True if the given expression is parsed back into an identical tree when it's generated as
+    a part of its parent."""
+    if isinstance(parent, _NON_SCALAR_PARENTS) or (
+        isinstance(parent, exp.Cast) and arg_key == "to"
+    ):
+        return False
+    if _is_atomic(value) or (
+        isinstance(value, (exp.Cast, exp.TimeStrToTime, exp.DateStrToDate))
+        and _is_atomic(value.this)
+    ):
+        return True
+    if isinstance(value, exp.Tuple):
+        return isinstance(parent, _DELIMITED_PARENTS) and all(
+            _is_atomic(expression) for expression in value.expressions
+        )
+    return isinstance(value, exp.Condition) and isinstance(parent, _DELIMITED_PARENTS)
+
+
+def _is_atomic(value: exp.Expression) -> bool:
+    if isinstance(value, exp.Literal):
+        if value.is_string:
+            # Quotes and escape sequences are represented differently between dialects.
+            return "'" not in value.this and "\\" not in value.this
+        return bool(_UNSIGNED_NUMBER.fullmatch(value.this))
+    return isinstance(value, (exp.Boolean, exp.Null))
+
+
 def _norm_env_value(value: t.Any) -> t.Any:
     if isinstance(value, list):
         return tuple(value)
@@ -13,6 +13,7 @@ from sqlmesh.utils.pydantic import PydanticModel
 class SqlModelCacheEntry(PydanticModel):
     model: SqlModel
     rendered_query: t.Dict
+    file_hashes: t.Dict[str, t.Optional[str]] = {}
 
 
 class ModelCache:
@@ -20,10 +21,16 @@ class ModelCache:
 
     Args:
         path: The path to the cache folder.
+        file_hash: Returns the content hash of a file, given its path relative to the module path of models.
+            If provided, cached models which embed python definitions from a file that has changed since
+            they were stored are ignored.
     """
 
-    def __init__(self, path: Path):
+    def __init__(
+        self, path: Path, file_hash: t.Optional[t.Callable[[str], t.Optional[str]]] = None
+    ):
         self.path = path
+        self._file_hash = file_hash
         self._file_cache: FileCache[SqlModelCacheEntry] = FileCache(
             path,
             SqlModelCacheEntry,
@@ -41,17 +48,82 @@ class ModelCache:
         Returns:
             The model definition.
         """
-        cache_entry = self._file_cache.get(name, entry_id)
-        if cache_entry:
-            model = cache_entry.model
-            model._query_renderer.update_cache(exp.Expression.load(cache_entry.rendered_query))
+        model = self.get(name, entry_id)
+        if model:
             return model
 
         loaded_model = loader()
-        if isinstance(loaded_model, SqlModel):
-            new_entry = SqlModelCacheEntry(
-                model=loaded_model, rendered_query=loaded_model.render_query().dump()
+        self.put(name, entry_id, loaded_model)
+        return loaded_model
+
+    def get(self, name: str, entry_id: str) -> t.Optional[Model]:
+        """Returns a cached model definition if exists.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+
+        Returns:
+            The model definition or None if no entry was found in the cache.
+        """
+        return self.get_many({name: entry_id}).get(name)
+
+    def get_many(self, entry_ids: t.Dict[str, str]) -> t.Dict[str, Model]:
+        """Returns all cached model definitions that exist.
+
+        Args:
+            entry_ids: The unique entry identifiers by entry names.
+
+        Returns:
+            The found model definitions by entry names.
+        """
+        models: t.Dict[str, Model] = {}
+        for name, cache_entry in self._file_cache.get_many(entry_ids).items():
+            if self._file_hash and any(
+                self._file_hash(file_path) != file_hash
+                for file_path, file_hash in cache_entry.file_hashes.items()
+            ):
+                continue
+            model = cache_entry.model
+            model._query_renderer.update_cache(exp.Expression.load(cache_entry.rendered_query))
+            models[name] = model
+        return models
+
+    def put(self, name: str, entry_id: str, model: Model) -> None:
+        """Stores the given model definition in the cache. Only SQL models are cached.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+            model: The model definition to store.
+        """
+        self.put_many([(name, entry_id, model)])
+
+    def put_many(self, models: t.Iterable[t.Tuple[str, str, Model]]) -> None:
+        """Stores the given model definitions in the cache. Only SQL models are cached.
+
+        Args:
+            models: Tuples of an entry name, its unique identifier and the model definition to store.
+        """
+        self._file_cache.put_many(
+            (
+                name,
+                entry_id,
+                SqlModelCacheEntry(
+                    model=model,
+                    rendered_query=model.render_query().dump(),
+                    file_hashes=self._python_env_file_hashes(model),
+                ),
             )
-            self._file_cache.put(name, entry_id, new_entry)
+            for name, entry_id, model in models
+            if isinstance(model, SqlModel)
+        )
 
-        return loaded_model
+    def _python_env_file_hashes(self, model: Model) -> t.Dict[str, t.Optional[str]]:
+        if not self._file_hash:
+            return {}
+        return {
+            executable.path: self._file_hash(executable.path)
+            for executable in model.python_env.values()
+            if executable.path
+        }
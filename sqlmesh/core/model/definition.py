@@ -47,6 +47,7 @@ if t.TYPE_CHECKING:
     from sqlmesh.core.engine_adapter import EngineAdapter
     from sqlmesh.core.engine_adapter._typing import DF, QueryOrDF
     from sqlmesh.core.snapshot import Snapshot
+    from sqlmesh.utils.cache import OptimizedQueryCache
 
 if sys.version_info >= (3, 9):
     from typing import Annotated, Literal
@@ -54,6 +55,9 @@ else:
     from typing_extensions import Annotated, Literal
 
 
+M = t.TypeVar("M", bound="_Model")
+
+
 class _Model(ModelMeta, frozen=True):
     """Model is the core abstraction for user defined datasets.
 
@@ -96,6 +100,8 @@ class _Model(ModelMeta, frozen=True):
             then backfilling this model will do all of history in one job. If this is set, a model's backfill
             will be chunked such that each individual job will only contain jobs with max `batch_size` intervals.
         lookback: The number of previous incremental intervals in the lookback window.
+        timeout: The maximum number of seconds the evaluation of a single batch is allowed to take.
+            Running statements are cancelled once it expires.
         storage_format: The storage format used to store the physical table, only applicable in certain engines.
             (eg. 'parquet')
         partitioned_by: The partition columns, only applicable in certain engines. (eg. (ds, hour))
@@ -112,6 +118,9 @@ class _Model(ModelMeta, frozen=True):
     _path: Path = Path()
     _depends_on: t.Optional[t.Set[str]] = None
     _column_descriptions: t.Optional[t.Dict[str, str]] = None
+    # Hashes used to fingerprint snapshots of this model along with the inputs they were computed from.
+    _data_hash: t.Optional[t.Tuple[t.Tuple[t.Any, ...], str]] = None
+    _metadata_hash: t.Optional[t.Tuple[t.Tuple[t.Any, ...], str]] = None
 
     _expressions_validator = expression_validator
 
@@ -323,6 +332,13 @@ class _Model(ModelMeta, frozen=True):
             schema: The new schema.
         """
 
+    def copy(self: M, **kwargs: t.Any) -> M:
+        model = super().copy(**kwargs)
+        # The copy may have different fields, so the memoized hashes can't be reused.
+        model._data_hash = None
+        model._metadata_hash = None
+        return model
+
     def text_diff(self, other: Model) -> str:
         """Produce a text diff against another model.
 
@@ -610,8 +626,18 @@ class SqlModel(_Model):
     def contains_star_query(self) -> bool:
         return self._query_renderer.contains_star_query
 
+    def set_optimized_query_cache(self, cache: t.Optional[OptimizedQueryCache]) -> None:
+        """Sets the persistent cache which is consulted before optimizing the rendered query of this model.
+
+        Args:
+            cache: The cache to use or None to disable the persistent caching of optimized queries.
+        """
+        self._query_renderer.set_optimized_query_cache(cache)
+
     def update_schema(self, schema: MappingSchema) -> None:
         self._query_renderer.update_schema(schema)
+        self._columns_to_types = None
+        self._metadata_hash = None
 
     @property
     def columns_to_types(self) -> t.Dict[str, exp.DataType]:
@@ -712,7 +738,7 @@ class SeedModel(_Model):
     """The model definition which uses a pre-built static dataset to source the data from.
 
     Args:
-        seed: The content of a pre-built static dataset.
+        seed: The pre-built static dataset, identified by the hash of its content.
     """
 
     kind: SeedKind
@@ -737,12 +763,17 @@ class SeedModel(_Model):
 
         meta_a = self.render_definition()[0]
         meta_b = other.render_definition()[0]
+        try:
+            content_a, content_b = self.seed.content, other.seed.content
+        except SQLMeshError:
+            # Fall back to diffing content hashes if the content of either seed can't be loaded.
+            content_a, content_b = self.seed.content_hash, other.seed.content_hash
         return "\n".join(
             (
                 d.text_diff(meta_a, meta_b, self.dialect),
                 *unified_diff(
-                    self.seed.content.split("\n"),
-                    other.seed.content.split("\n"),
+                    content_a.split("\n"),
+                    content_b.split("\n"),
                 ),
             )
         ).strip()
@@ -768,8 +799,11 @@ class SeedModel(_Model):
         if not isinstance(previous, SeedModel):
             return None
 
-        new_df = pd.concat([df for df in self.seed.read()])
-        old_df = pd.concat([df for df in previous.seed.read()])
+        try:
+            new_df = pd.concat([df for df in self.seed.read()])
+            old_df = pd.concat([df for df in previous.seed.read()])
+        except SQLMeshError:
+            return None
 
         new_columns = set(new_df.columns)
         old_columns = set(old_df.columns)
@@ -878,6 +912,7 @@ def load_model(
     hooks: t.Optional[HookRegistry] = None,
     python_env: t.Optional[t.Dict[str, Executable]] = None,
     dialect: t.Optional[str] = None,
+    optimized_query_cache: t.Optional[OptimizedQueryCache] = None,
     **kwargs: t.Any,
 ) -> Model:
     """Load a model from a parsed SQLMesh model file.
@@ -894,6 +929,7 @@ def load_model(
             from the macro registry.
         dialect: The default dialect if no model dialect is configured.
             The format must adhere to Python's strftime codes.
+        optimized_query_cache: The persistent cache of optimized queries used by SQL models.
         kwargs: Additional kwargs to pass to the loader.
     """
     if not expressions:
@@ -949,6 +985,7 @@ def load_model(
             macros=macros,
             hooks=hooks,
             python_env=python_env,
+            optimized_query_cache=optimized_query_cache,
             **meta_fields,
         )
     else:
@@ -984,6 +1021,7 @@ def create_sql_model(
     hooks: t.Optional[HookRegistry] = None,
     python_env: t.Optional[t.Dict[str, Executable]] = None,
     dialect: t.Optional[str] = None,
+    optimized_query_cache: t.Optional[OptimizedQueryCache] = None,
     **kwargs: t.Any,
 ) -> Model:
     """Creates a SQL model.
@@ -1003,6 +1041,7 @@ def create_sql_model(
             from the macro registry.
         dialect: The default dialect if no model dialect is configured.
             The format must adhere to Python's strftime codes.
+        optimized_query_cache: The persistent cache of optimized queries.
     """
     if not isinstance(query, (exp.Subqueryable, d.Jinja)):
         raise_config_error(
@@ -1029,6 +1068,7 @@ def create_sql_model(
         dialect=dialect,
         expressions=statements or [],
         query=query,
+        optimized_query_cache=optimized_query_cache,
         **kwargs,
     )
 
@@ -1117,6 +1157,7 @@ def _create_model(
     depends_on: t.Optional[t.Set[str]] = None,
     dialect: t.Optional[str] = None,
     expressions: t.Optional[t.List[exp.Expression]] = None,
+    optimized_query_cache: t.Optional[OptimizedQueryCache] = None,
     **kwargs: t.Any,
 ) -> Model:
     _validate_model_fields(klass, {"name", *kwargs}, path)
@@ -1140,6 +1181,8 @@ def _create_model(
 
     model._path = path
     model.set_time_format(time_column_format)
+    if isinstance(model, SqlModel):
+        model.set_optimized_query_cache(optimized_query_cache)
     model.validate_definition()
 
     return t.cast(Model, model)
@@ -1298,6 +1341,7 @@ META_FIELD_CONVERTER: t.Dict[str, t.Callable] = {
     "start": lambda value: exp.Literal.string(value),
     "cron": lambda value: exp.Literal.string(value),
     "batch_size": lambda value: exp.Literal.number(value),
+    "timeout": lambda value: exp.Literal.number(value),
     "partitioned_by_": lambda value: (
         exp.to_identifier(value[0]) if len(value) == 1 else exp.Tuple(expressions=value)
     ),
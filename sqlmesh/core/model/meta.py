@@ -53,6 +53,7 @@ class ModelMeta(PydanticModel):
     stamp: t.Optional[str]
     start: t.Optional[TimeLike]
     retention: t.Optional[int]  # not implemented yet
+    timeout: t.Optional[int]
     storage_format: t.Optional[str]
     partitioned_by_: t.List[str] = Field(default=[], alias="partitioned_by")
     pre: t.List[HookCall] = []
@@ -181,6 +182,17 @@ class ModelMeta(PydanticModel):
             return v.name
         return str(v) if v is not None else None
 
+    @validator("timeout", pre=True)
+    def _timeout_validator(cls, v: t.Any) -> t.Optional[int]:
+        if v is None:
+            return None
+        timeout = int(v.name if isinstance(v, exp.Expression) else v)
+        if timeout <= 0:
+            raise ConfigError(
+                f"Invalid timeout {timeout}. The value should be a positive number of seconds"
+            )
+        return timeout
+
     @validator("cron", pre=True)
     def _cron_validator(cls, v: t.Any) -> t.Optional[str]:
         cron = cls._string_validator(v)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import typing as t
 from io import StringIO
 from pathlib import Path
@@ -8,8 +9,12 @@ import numpy as np
 import pandas as pd
 from sqlglot import exp
 
+from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
 
+# Returns the content of a seed given its hash or None if the content is not available.
+SeedContentLoader = t.Callable[[str], t.Optional[str]]
+
 PANDAS_TYPE_MAPPINGS = {
     np.dtype("int8"): exp.DataType.build("tinyint"),
     np.dtype("int16"): exp.DataType.build("smallint"),
@@ -26,12 +31,46 @@ PANDAS_TYPE_MAPPINGS = {
 class Seed(PydanticModel):
     """Represents content of a seed.
 
+    Only the hash of the content is serialized. The content itself is stored externally, either
+    in the seed file or in the state, and is only loaded once the seed is read.
+
     Presently only CSV format is supported.
     """
 
-    content: str
+    content_hash: str
+    _content: t.Optional[str] = None
+    _content_loader: t.Optional[SeedContentLoader] = None
     _df: t.Optional[pd.DataFrame] = None
 
+    def __init__(self, **data: t.Any) -> None:
+        content = data.pop("content", None)
+        if content is not None:
+            data.setdefault("content_hash", hash_seed_content(content))
+        super().__init__(**data)
+        self._content = content
+
+    @property
+    def content(self) -> str:
+        """The content of the seed, loaded from its external storage if necessary."""
+        if self._content is not None:
+            return self._content
+
+        content = self._content_loader(self.content_hash) if self._content_loader else None
+        if content is None:
+            raise SQLMeshError(
+                f"Content of the seed with hash '{self.content_hash}' is not available."
+            )
+        if hash_seed_content(content) != self.content_hash:
+            raise SQLMeshError(
+                f"Content of the seed doesn't match its hash '{self.content_hash}'. "
+                "Has the seed file changed since it was loaded?"
+            )
+        return content
+
+    def set_content_loader(self, loader: SeedContentLoader) -> None:
+        """Sets the callable which loads the content of this seed by its hash."""
+        self._content_loader = loader
+
     @property
     def columns_to_types(self) -> t.Dict[str, exp.DataType]:
         result = {}
@@ -61,6 +100,29 @@ class Seed(PydanticModel):
         return self._df
 
 
+def hash_seed_content(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 def create_seed(path: str | Path) -> Seed:
-    with open(path, "r") as fd:
-        return Seed(content=fd.read())
+    loader = SeedFileLoader(Path(path))
+    seed = Seed(content_hash=hash_seed_content(loader.read()))
+    seed.set_content_loader(loader)
+    return seed
+
+
+class SeedFileLoader:
+    """Loads the content of a seed from its file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __call__(self, content_hash: str) -> t.Optional[str]:
+        try:
+            return self.read()
+        except OSError:
+            return None
+
+    def read(self) -> str:
+        with open(self.path, "r") as fd:
+            return fd.read()
@@ -6,33 +6,49 @@ A plan evaluator is responsible for evaluating a plan when it is being applied.
 # Evaluation steps
 
 At a high level, when a plan is evaluated, SQLMesh will:
-- Push new snapshots to the state sync.
-- Create snapshot tables.
+- Create snapshot tables and push new snapshots to the state sync.
 - Backfill data.
 - Promote the snapshots.
 
+The built-in evaluator runs these steps as a single DAG of tasks: the intervals of a snapshot are
+backfilled as soon as its table has been created and its parents have been backfilled. In development
+environments a snapshot is also promoted as soon as it and all its upstream snapshots are complete.
+
 Refer to `sqlmesh.core.plan`.
 """
 import abc
 import typing as t
+from collections import defaultdict
 
+from sqlmesh.core import constants as c
 from sqlmesh.core._typing import NotificationTarget
 from sqlmesh.core.console import Console, get_console
 from sqlmesh.core.plan.definition import Plan
-from sqlmesh.core.scheduler import Scheduler
-from sqlmesh.core.snapshot import SnapshotEvaluator, SnapshotInfoLike
+from sqlmesh.core.scheduler import Interval, Scheduler
+from sqlmesh.core.snapshot import (
+    Snapshot,
+    SnapshotEvaluator,
+    SnapshotId,
+    SnapshotInfoLike,
+    SnapshotTableInfo,
+)
 from sqlmesh.core.state_sync import StateSync
 from sqlmesh.core.user import User
 from sqlmesh.schedulers.airflow import common as airflow_common
 from sqlmesh.schedulers.airflow.client import AirflowClient
-from sqlmesh.utils import random_id
+from sqlmesh.utils import format_exception, random_id
+from sqlmesh.utils.cancellation import CancellationToken
+from sqlmesh.utils.concurrency import concurrent_apply_to_dag
+from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import now
 from sqlmesh.utils.errors import SQLMeshError
 
 
 class PlanEvaluator(abc.ABC):
     @abc.abstractmethod
-    def evaluate(self, plan: Plan) -> None:
+    def evaluate(
+        self, plan: Plan, cancellation_token: t.Optional[CancellationToken] = None
+    ) -> None:
         """Evaluates a plan by pushing snapshots and backfilling data.
 
         Given a plan, it pushes snapshots into the state and then kicks off
@@ -42,9 +58,25 @@ class PlanEvaluator(abc.ABC):
 
         Args:
             plan: The plan to evaluate.
+            cancellation_token: The token used to cancel the evaluation. Evaluators which delegate
+                the evaluation to an external scheduler may ignore it.
         """
 
 
+class _PlanTask(t.NamedTuple):
+    """A unit of work in the plan application DAG."""
+
+    kind: str
+    snapshot_id: t.Optional[SnapshotId] = None
+    interval: t.Optional[Interval] = None
+
+
+_CREATE = "create"
+_BACKFILL = "backfill"
+_UPDATE_ENVIRONMENT = "update_environment"
+_PROMOTE = "promote"
+
+
 class BuiltInPlanEvaluator(PlanEvaluator):
     def __init__(
         self,
@@ -52,91 +84,300 @@ class BuiltInPlanEvaluator(PlanEvaluator):
         snapshot_evaluator: SnapshotEvaluator,
         backfill_concurrent_tasks: int = 1,
         console: t.Optional[Console] = None,
+        notification_targets: t.Optional[t.List[NotificationTarget]] = None,
     ):
         self.state_sync = state_sync
         self.snapshot_evaluator = snapshot_evaluator
         self.backfill_concurrent_tasks = backfill_concurrent_tasks
         self.console = console or get_console()
+        self.notification_targets = notification_targets or []
 
-    def evaluate(self, plan: Plan) -> None:
-        tasks = (
-            [self._push, self._restate, self._backfill, self._promote]
-            if not plan.forward_only
-            else [self._push, self._restate, self._promote, self._backfill]
-        )
-
-        for task in tasks:
-            task(plan)
+    def evaluate(
+        self, plan: Plan, cancellation_token: t.Optional[CancellationToken] = None
+    ) -> None:
+        token = cancellation_token or CancellationToken()
+        token.raise_if_cancelled()
+
+        self._restate(plan)
+
+        if plan.forward_only:
+            self._apply(plan, token, backfill=False)
+            token.raise_if_cancelled()
+            self._promote(plan)
+            token.raise_if_cancelled()
+            self._apply(plan, token, create=False)
+        else:
+            # Views of a development environment can be updated as soon as the snapshot and
+            # everything upstream of it has been backfilled. The environment itself is only updated
+            # once all intervals have been processed, and the gaps check can't be performed before.
+            promote_early = plan.is_dev and not plan.no_gaps
+            promoted = self._apply(plan, token, promote=promote_early)
+            token.raise_if_cancelled()
+            self._promote(plan, promoted=promoted)
 
         if not plan.requires_backfill:
             self.console.log_success("Virtual Update executed successfully")
 
-    def _backfill(self, plan: Plan) -> None:
-        """Backfill missing intervals for snapshots that are part of the given plan.
+    def _apply(
+        self,
+        plan: Plan,
+        cancellation_token: CancellationToken,
+        create: bool = True,
+        backfill: bool = True,
+        promote: bool = False,
+    ) -> t.Optional[t.Tuple[t.List[SnapshotTableInfo], t.List[SnapshotTableInfo]]]:
+        """Creates snapshot tables, backfills missing intervals and optionally promotes snapshots
+        as a single DAG of tasks.
+
+        Each new snapshot is pushed to the state sync right after its table has been created, and its
+        intervals are backfilled as soon as its own table and the intervals of its parents are ready,
+        so there are no barriers between the creation and the backfill of unrelated snapshots.
 
         Args:
             plan: The plan to source snapshots from.
+            cancellation_token: The token used to cancel the application.
+            create: Whether to create tables for new snapshots and push them to the state sync.
+            backfill: Whether to backfill missing intervals.
+            promote: Whether to promote each snapshot once it and all its upstream snapshots have been
+                backfilled, and to update the environment once all snapshots have been promoted. The
+                environment stays unchanged if any task fails.
+
+        Returns:
+            A tuple of (added snapshot table infos, removed snapshot table infos) if snapshots
+            have been promoted, None otherwise.
         """
-        if not plan.requires_backfill:
-            return
+        new_snapshots = {s.snapshot_id: s for s in plan.new_snapshots} if create else {}
+        parent_snapshot_ids = {
+            p_sid for snapshot in new_snapshots.values() for p_sid in snapshot.parents
+        }
+        stored_snapshots_by_id = (
+            self.state_sync.get_snapshots(parent_snapshot_ids - set(new_snapshots))
+            if parent_snapshot_ids
+            else {}
+        )
+        all_snapshots_by_id = {**stored_snapshots_by_id, **new_snapshots}
 
-        snapshots = plan.snapshots
         scheduler = Scheduler(
-            snapshots,
+            plan.snapshots,
             self.snapshot_evaluator,
             self.state_sync,
             max_workers=self.backfill_concurrent_tasks,
             console=self.console,
+            notification_targets=self.notification_targets,
+        )
+        is_dev = plan.environment_name != c.PROD
+        latest = now()
+        batches = (
+            scheduler.batches(plan.start, plan.end, latest, is_dev=is_dev)
+            if backfill and plan.requires_backfill
+            else {}
+        )
+        interval_dag = scheduler.interval_dag(batches)
+
+        dag = DAG[_PlanTask]()
+        for s_id, snapshot in new_snapshots.items():
+            dag.add(
+                _PlanTask(_CREATE, s_id),
+                [_PlanTask(_CREATE, p_sid) for p_sid in snapshot.parents if p_sid in new_snapshots],
+            )
+
+        snapshots_by_id: t.Dict[SnapshotId, Snapshot] = {}
+        backfill_tasks: t.Dict[SnapshotId, t.List[_PlanTask]] = defaultdict(list)
+        for (snapshot, interval), upstream in interval_dag.graph.items():
+            snapshots_by_id[snapshot.snapshot_id] = snapshot
+            task = _PlanTask(_BACKFILL, snapshot.snapshot_id, interval)
+            backfill_tasks[snapshot.snapshot_id].append(task)
+            dependencies = [_PlanTask(_BACKFILL, s.snapshot_id, i) for s, i in upstream]
+            if snapshot.snapshot_id in new_snapshots:
+                dependencies.append(_PlanTask(_CREATE, snapshot.snapshot_id))
+            dag.add(task, dependencies)
+
+        environment = plan.environment
+        plan_snapshots_by_id = {s.snapshot_id: s for s in plan.snapshots}
+        added: t.List[SnapshotTableInfo] = []
+        removed: t.List[SnapshotTableInfo] = []
+
+        if promote:
+            promote_tasks = []
+            for s_id, snapshot in plan_snapshots_by_id.items():
+                promote_task = _PlanTask(_PROMOTE, s_id)
+                promote_tasks.append(promote_task)
+                dependencies = [
+                    *backfill_tasks.get(s_id, []),
+                    *(
+                        _PlanTask(_PROMOTE, p_sid)
+                        for p_sid in snapshot.parents
+                        if p_sid in plan_snapshots_by_id
+                    ),
+                ]
+                if s_id in new_snapshots:
+                    dependencies.append(_PlanTask(_CREATE, s_id))
+                dag.add(promote_task, dependencies)
+            # The environment is updated and its snapshots are unpaused only after everything else
+            # has succeeded, so a failed backfill leaves the environment unchanged.
+            dag.add(_PlanTask(_UPDATE_ENVIRONMENT), promote_tasks)
+
+        visited = set()
+        for snapshot, _ in interval_dag.sorted():
+            if snapshot in visited:
+                continue
+            visited.add(snapshot)
+            intervals = batches[snapshot]
+            self.console.start_snapshot_progress(snapshot, len(intervals), plan.environment_name)
+
+        def run_task(task: _PlanTask) -> None:
+            if task.kind == _CREATE:
+                assert task.snapshot_id
+                snapshot = new_snapshots[task.snapshot_id]
+                self.snapshot_evaluator.create_snapshot(snapshot, all_snapshots_by_id)
+                self.state_sync.push_snapshots([snapshot])
+            elif task.kind == _BACKFILL:
+                assert task.snapshot_id and task.interval
+                start, end = task.interval
+                scheduler.evaluate(
+                    snapshots_by_id[task.snapshot_id],
+                    start,
+                    end,
+                    latest,
+                    is_dev=is_dev,
+                    cancellation_token=cancellation_token,
+                )
+            elif task.kind == _UPDATE_ENVIRONMENT:
+                _added, _removed = self._update_environment(plan)
+                added.extend(_added)
+                removed.extend(_removed)
+            else:
+                assert task.snapshot_id
+                self.snapshot_evaluator.promote_snapshot(
+                    plan_snapshots_by_id[task.snapshot_id].table_info,
+                    environment.name,
+                    is_dev=plan.is_dev,
+                )
+
+        tasks_num = (
+            self.backfill_concurrent_tasks
+            if batches
+            else self.snapshot_evaluator.ddl_concurrent_tasks
         )
-        is_run_successful = scheduler.run(plan.environment_name, plan.start, plan.end)
-        if not is_run_successful:
+        with self.snapshot_evaluator.concurrent_context(), scheduler.deferred_audits(
+            cancellation_token
+        ):
+            try:
+                errors, skipped = concurrent_apply_to_dag(
+                    dag,
+                    run_task,
+                    tasks_num,
+                    raise_on_error=False,
+                    cancellation_token=cancellation_token,
+                )
+            except KeyboardInterrupt:
+                cancellation_token.cancel()
+                self.console.stop_snapshot_progress(success=False)
+                raise
+
+        success = not errors and not skipped
+        self.console.stop_snapshot_progress(success=success)
+
+        for error in errors:
+            task = error.node
+            formatted_exception = "".join(format_exception(error.__cause__ or error))
+            self.console.log_error(
+                f"FAILED to {task.kind} snapshot {task.snapshot_id}\n{formatted_exception}"
+                if task.snapshot_id
+                else f"FAILED to update environment '{environment.name}'\n{formatted_exception}"
+            )
+
+        for s_id in {task.snapshot_id for task in skipped if task.snapshot_id}:
+            self.console.log_status_update(f"SKIPPED snapshot {s_id}\n")
+
+        if cancellation_token.is_cancelled:
+            self.console.log_error("The plan application has been cancelled.")
+            cancellation_token.raise_if_cancelled()
+        if not success:
             raise SQLMeshError("Plan application failed.")
 
-    def _push(self, plan: Plan) -> None:
+        if not promote:
+            return None
+        return added, removed
+
+    def _push(self, plan: Plan, cancellation_token: t.Optional[CancellationToken] = None) -> None:
         """Push the snapshots to the state sync.
 
         As a part of plan pushing, snapshot tables are created.
 
         Args:
             plan: The plan to source snapshots from.
+            cancellation_token: The token used to cancel the creation of tables.
         """
-        parent_snapshot_ids = {
-            p_sid for snapshot in plan.new_snapshots for p_sid in snapshot.parents
-        }
-
-        stored_snapshots_by_id = self.state_sync.get_snapshots(parent_snapshot_ids)
-        new_snapshots_by_id = {snapshot.snapshot_id: snapshot for snapshot in plan.new_snapshots}
-        all_snapshots_by_id = {**stored_snapshots_by_id, **new_snapshots_by_id}
+        self._apply(plan, cancellation_token or CancellationToken(), backfill=False)
 
-        self.snapshot_evaluator.create(plan.new_snapshots, all_snapshots_by_id)
-        self.state_sync.push_snapshots(plan.new_snapshots)
+    def _backfill(
+        self, plan: Plan, cancellation_token: t.Optional[CancellationToken] = None
+    ) -> None:
+        """Backfill missing intervals for snapshots that are part of the given plan.
 
-    def _promote(self, plan: Plan) -> None:
-        """Promote a plan.
+        Args:
+            plan: The plan to source snapshots from.
+            cancellation_token: The token used to cancel the backfill.
+        """
+        self._apply(plan, cancellation_token or CancellationToken(), create=False)
 
-        Promotion creates views with a model's name + env pointing to a physical snapshot.
+    def _update_environment(
+        self, plan: Plan
+    ) -> t.Tuple[t.List[SnapshotTableInfo], t.List[SnapshotTableInfo]]:
+        """Updates the environment targeted by the plan in the state sync.
 
         Args:
             plan: The plan to promote.
+
+        Returns:
+            A tuple of (added snapshot table infos, removed snapshot table infos).
         """
         environment = plan.environment
 
         added, removed = self.state_sync.promote(environment, no_gaps=plan.no_gaps)
 
-        self.console.start_promotion_progress(environment.name, len(added) + len(removed))
-
         if not environment.end_at:
             if not plan.is_dev:
                 self.snapshot_evaluator.migrate(plan.environment.snapshots)
             self.state_sync.unpause_snapshots(added, now())
 
+        return added, removed
+
+    def _promote(
+        self,
+        plan: Plan,
+        promoted: t.Optional[t.Tuple[t.List[SnapshotTableInfo], t.List[SnapshotTableInfo]]] = None,
+    ) -> None:
+        """Promote a plan.
+
+        Promotion creates views with a model's name + env pointing to a physical snapshot.
+
+        Args:
+            plan: The plan to promote.
+            promoted: The added and removed snapshot table infos if the environment has already been
+                updated and all added snapshots have already been promoted.
+        """
+        environment = plan.environment
+
+        if promoted is None:
+            added, removed = self._update_environment(plan)
+            to_promote = added
+        else:
+            added, removed = promoted
+            to_promote = []
+
+        self.console.start_promotion_progress(environment.name, len(added) + len(removed))
+        if len(added) > len(to_promote):
+            self.console.update_promotion_progress(len(added) - len(to_promote))
+
         def on_complete(snapshot: SnapshotInfoLike) -> None:
             self.console.update_promotion_progress(1)
 
         completed = False
         try:
             self.snapshot_evaluator.promote(
-                added,
+                to_promote,
                 environment=environment.name,
                 is_dev=plan.is_dev,
                 on_complete=on_complete,
@@ -155,10 +396,15 @@ class BuiltInPlanEvaluator(PlanEvaluator):
         if not plan.restatements:
             return
 
+        # Restatements are applied before new snapshots are pushed, so intervals of new snapshots of
+        # restated models are removed before they are stored.
         all_snapshots = (
             [s for s in plan.snapshots if s.name in plan.restatements]
             if plan.is_dev
-            else self.state_sync.get_snapshots_by_models(*plan.restatements)
+            else [
+                *self.state_sync.get_snapshots_by_models(*plan.restatements),
+                *(s for s in plan.new_snapshots if s.name in plan.restatements),
+            ]
         )
         self.state_sync.remove_interval(
             [],
@@ -193,7 +439,9 @@ class AirflowPlanEvaluator(PlanEvaluator):
         self.ddl_concurrent_tasks = ddl_concurrent_tasks
         self.users = users or []
 
-    def evaluate(self, plan: Plan) -> None:
+    def evaluate(
+        self, plan: Plan, cancellation_token: t.Optional[CancellationToken] = None
+    ) -> None:
         environment = plan.environment
 
         plan_request_id = random_id()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import typing as t
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from sqlglot import exp, parse_one
@@ -18,13 +18,15 @@ from sqlglot.schema import MappingSchema
 from sqlmesh.core import constants as c
 from sqlmesh.core import dialect as d
 from sqlmesh.core.macros import MacroEvaluator
-from sqlmesh.core.model.kind import TimeColumn
+from sqlmesh.utils import LRUCache
+from sqlmesh.utils.cache import OptimizedQueryCache
 from sqlmesh.utils.date import TimeLike, date_dict, make_inclusive, to_datetime
 from sqlmesh.utils.errors import ConfigError, MacroEvalError, raise_config_error
-from sqlmesh.utils.jinja import JinjaMacroRegistry
+from sqlmesh.utils.jinja import JinjaMacroRegistry, has_jinja
 from sqlmesh.utils.metaprogramming import Executable, prepare_env
 
 if t.TYPE_CHECKING:
+    from sqlmesh.core.model.kind import TimeColumn
     from sqlmesh.core.snapshot import Snapshot
 
 RENDER_OPTIMIZER_RULES = (
@@ -35,6 +37,9 @@ RENDER_OPTIMIZER_RULES = (
     annotate_types,
 )
 
+QUERY_CACHE_SIZE = 128
+"""The maximum number of rendered queries cached per query renderer."""
+
 
 def _dates(
     start: t.Optional[TimeLike] = None,
@@ -65,6 +70,7 @@ class ExpressionRenderer:
         self._jinja_macro_registry = jinja_macro_registry or JinjaMacroRegistry()
         self._python_env = python_env or {}
         self._only_latest = only_latest
+        self.__dialect_expression: t.Optional[exp.Expression] = None
 
     def render(
         self,
@@ -84,7 +90,7 @@ class ExpressionRenderer:
         Returns:
             The rendered expression.
         """
-        expression = self._expression
+        expression = self._dialect_expression
 
         render_kwargs = {
             **date_dict(*_dates(start, end, latest), only_latest=self._only_latest),
@@ -127,6 +133,26 @@ class ExpressionRenderer:
 
         return expression
 
+    @property
+    def _dialect_expression(self) -> exp.Expression:
+        """The expression in the representation of the renderer's dialect.
+
+        Expressions which were parsed in another dialect (e.g. deserialized models) are regenerated and parsed
+        again once, so that macro results can be spliced into them without a round trip on every render.
+        """
+        if self.__dialect_expression is None:
+            self.__dialect_expression = self._expression
+            if not isinstance(self._expression, d.Jinja):
+                sql = self._expression.sql(dialect=self._dialect)
+                try:
+                    expression = parse_one(sql, read=self._dialect)
+                except SqlglotError:
+                    expression = None
+                # Only use the new representation if nothing got lost in the round trip.
+                if expression is not None and expression.sql(dialect=self._dialect) == sql:
+                    self.__dialect_expression = expression
+        return self.__dialect_expression
+
 
 class QueryRenderer(ExpressionRenderer):
     def __init__(
@@ -153,10 +179,16 @@ class QueryRenderer(ExpressionRenderer):
 
         self._time_column = time_column
         self._time_converter = time_converter or (lambda v: exp.convert(v))
+        self._optimized_query_cache: t.Optional[OptimizedQueryCache] = None
 
-        self._query_cache: t.Dict[t.Tuple[datetime, datetime, datetime], exp.Expression] = {}
+        self._query_cache: LRUCache[
+            t.Tuple[datetime, datetime, datetime], exp.Expression
+        ] = LRUCache(maxsize=QUERY_CACHE_SIZE)
         self._schema: t.Optional[MappingSchema] = None
 
+        self._template: t.Optional[_QueryTemplate] = None
+        self._is_template_safe: t.Optional[bool] = None
+
     def render(
         self,
         start: t.Optional[TimeLike] = None,
@@ -199,16 +231,20 @@ class QueryRenderer(ExpressionRenderer):
         # won't be valid
         expand = set(expand) | {name for name in snapshots if name not in mapping}
 
-        query = self._expression
+        query = self._query_cache.get(cache_key)
 
-        if cache_key not in self._query_cache:
-            query = super().render(start=start, end=end, latest=latest, **kwargs)  # type: ignore
-            if not query:
-                raise ConfigError(f"Failed to render query {query}")
+        if query is None:
+            if self._query_cache:
+                # Only bother with a template once the query is rendered for more than one interval.
+                query = self._render_template(dates)
 
-            self._query_cache[cache_key] = self._optimize_query(query) or query
+            if query is None:
+                query = super().render(start=start, end=end, latest=latest, **kwargs)  # type: ignore
+                if not query:
+                    raise ConfigError(f"Failed to render query {query}")
+                query = self._optimize_rendered_query(query)
 
-        query = self._query_cache[cache_key]
+            self._query_cache[cache_key] = query
 
         if expand:
 
@@ -261,10 +297,23 @@ class QueryRenderer(ExpressionRenderer):
         self._schema = schema
 
         if self.contains_star_query and old_schema != schema:
-            new_cache = {}
+            new_cache: LRUCache[t.Tuple[datetime, datetime, datetime], exp.Expression] = LRUCache(
+                maxsize=QUERY_CACHE_SIZE
+            )
             for cached_key, cached_query in self._query_cache.items():
-                new_cache[cached_key] = self._optimize_query(cached_query) or cached_query
+                # Queries whose upstream schemas haven't changed since the last load are found in the persistent
+                # cache and don't need to be optimized again.
+                new_cache[cached_key] = self._optimize_rendered_query(cached_query)
             self._query_cache = new_cache
+            self._template = None
+
+    def set_optimized_query_cache(self, cache: t.Optional[OptimizedQueryCache]) -> None:
+        """Sets the persistent cache which is consulted before optimizing a rendered query.
+
+        Args:
+            cache: The cache to use or None to disable the persistent caching of optimized queries.
+        """
+        self._optimized_query_cache = cache
 
     def update_cache(
         self,
@@ -312,6 +361,99 @@ class QueryRenderer(ExpressionRenderer):
 
         simplify(query)
 
+    @property
+    def is_template_safe(self) -> bool:
+        """Returns True if the standard date macros are the only part of the query which depends on the
+        rendered interval, in which case the query can be rendered once and reused for all intervals."""
+        if self._is_template_safe is None:
+            self._is_template_safe = self._check_template_safe()
+        return self._is_template_safe
+
+    def _check_template_safe(self) -> bool:
+        if self._macro_definitions or isinstance(self._expression, d.Jinja):
+            return False
+
+        date_variables = date_dict(c.EPOCH, c.EPOCH, c.EPOCH, only_latest=self._only_latest)
+        for node, _, _ in self._expression.walk():
+            if isinstance(node, (d.MacroFunc, d.Jinja)):
+                return False
+            if isinstance(node, d.MacroVar) and node.name not in date_variables:
+                return False
+            if isinstance(node, exp.Literal) and node.is_string and has_jinja(node.this):
+                return False
+        return True
+
+    def _render_template(
+        self, dates: t.Tuple[datetime, datetime, datetime]
+    ) -> t.Optional[exp.Expression]:
+        """Renders the query for the given dates by substituting them into a query template which has been
+        rendered and optimized once. Returns None if the query can't be rendered from a template."""
+        if not self.is_template_safe:
+            return None
+
+        if self._template is None:
+            placeholders = _placeholders(
+                date_dict(*dates, only_latest=self._only_latest)  # type: ignore
+            )
+            query = super().render(**placeholders)
+            if not query:
+                return None
+            template = _QueryTemplate(
+                self._optimize_rendered_query(query),
+                placeholders,
+                only_latest=self._only_latest,
+            )
+
+            # Make sure the template reproduces a fully rendered query before relying on it.
+            try:
+                rendered_dates, rendered_query = next(iter(self._query_cache.items()))
+            except (RuntimeError, StopIteration):
+                # The cache has been modified concurrently.
+                return None
+            if template.substitute(rendered_dates) != rendered_query:
+                self._is_template_safe = False
+                return None
+            self._template = template
+
+        return self._template.substitute(dates)
+
+    def _optimize_rendered_query(self, query: exp.Expression) -> exp.Expression:
+        """Optimizes a rendered query, reusing the result from the persistent cache if available."""
+        cache = self._optimized_query_cache
+        if cache is None:
+            return self._optimize_query(query) or query
+
+        # The rendered query captures both the model definition and the render arguments.
+        entry_id = cache.entry_id(
+            self._dialect, query.sql(dialect=self._dialect), self._schema_fingerprint(query)
+        )
+        optimized_query = cache.get(entry_id)
+        if optimized_query is None:
+            optimized_query = self._optimize_query(query)
+            if optimized_query is None:
+                return query
+            cache.put(entry_id, optimized_query)
+        return optimized_query
+
+    def _schema_fingerprint(self, query: exp.Expression) -> str:
+        """Returns a string representation of the known schemas of all tables referenced in the query."""
+        if not self._schema:
+            return ""
+
+        tables = set()
+        for table in query.find_all(exp.Table):
+            try:
+                columns = self._schema.find(table, raise_on_missing=False)
+            except SchemaError:
+                columns = None
+            if columns:
+                column_types = ",".join(
+                    f"{name} {exp.DataType.build(column_type).sql()}"
+                    for name, column_type in columns.items()
+                )
+                tables.add(f"{exp.table_name(table)}({column_types})")
+        return ";".join(sorted(tables))
+
     def _optimize_query(self, query: exp.Expression) -> t.Optional[exp.Expression]:
         try:
             return optimize(
@@ -325,3 +467,52 @@ class QueryRenderer(ExpressionRenderer):
         except SqlglotError as ex:
             raise_config_error(f"Invalid model query. {ex}", self._path)
             raise
+
+
+class _QueryTemplate:
+    """A rendered and optimized query in which the values of the date macros are placeholder literals.
+
+    Args:
+        query: The rendered query.
+        placeholders: The placeholder values the date macros were rendered with.
+        only_latest: Whether only the latest date macros are available.
+    """
+
+    def __init__(
+        self, query: exp.Expression, placeholders: t.Dict[str, t.Any], only_latest: bool = False
+    ):
+        self.query = query
+        self.only_latest = only_latest
+        self._names = {_literal_text(value): name for name, value in placeholders.items()}
+
+    def substitute(self, dates: t.Tuple[datetime, datetime, datetime]) -> exp.Expression:
+        """Returns a copy of the template in which the placeholders are replaced with the given dates."""
+        values = date_dict(*dates, only_latest=self.only_latest)  # type: ignore
+        query = self.query.copy()
+        for literal in query.find_all(exp.Literal):
+            name = self._names.get(literal.this)
+            if name is not None:
+                literal.set("this", _literal_text(values[name]))
+        return query
+
+
+def _placeholders(values: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+    """Returns distinct placeholder values of the same types as the given date macro values, which are
+    outside of the range of realistic dates."""
+    placeholders: t.Dict[str, t.Any] = {}
+    for i, (name, value) in enumerate(sorted(values.items())):
+        if isinstance(value, datetime):
+            placeholders[name] = datetime(2999, 12, 31, tzinfo=timezone.utc) - timedelta(seconds=i)
+        elif isinstance(value, str):
+            placeholders[name] = f"__sqlmesh_{name}__"
+        elif isinstance(value, int):
+            placeholders[name] = 9_000_000_000_000 + i
+        else:
+            placeholders[name] = 9_000_000_000.0 + i
+    return placeholders
+
+
+def _literal_text(value: t.Any) -> str:
+    expression = exp.convert(value)
+    literal = expression if isinstance(expression, exp.Literal) else expression.find(exp.Literal)
+    return literal.this if literal else str(value)
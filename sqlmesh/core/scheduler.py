@@ -2,18 +2,23 @@ from __future__ import annotations
 
 import logging
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 
 from sqlmesh.core import constants as c
+from sqlmesh.core._typing import NotificationTarget
+from sqlmesh.core.audit import BUILT_IN_AUDITS
 from sqlmesh.core.console import Console, get_console
+from sqlmesh.core.notification_target import NotificationStatus
 from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotEvaluator,
     SnapshotId,
     SnapshotIdLike,
 )
-from sqlmesh.core.state_sync import StateSync
 from sqlmesh.utils import format_exception
+from sqlmesh.utils.cancellation import CancellationToken
 from sqlmesh.utils.concurrency import concurrent_apply_to_dag
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
@@ -23,6 +28,10 @@ from sqlmesh.utils.date import (
     validate_date_range,
     yesterday,
 )
+from sqlmesh.utils.tracing import tracer
+
+if t.TYPE_CHECKING:
+    from sqlmesh.core.state_sync import StateSync
 
 logger = logging.getLogger(__name__)
 Interval = t.Tuple[datetime, datetime]
@@ -46,6 +55,7 @@ class Scheduler:
         state_sync: The state sync to pull saved snapshots.
         max_workers: The maximum number of parallel queries to run.
         console: The rich instance used for printing scheduling information.
+        notification_targets: The targets notified about failures of non-blocking audits.
     """
 
     def __init__(
@@ -55,6 +65,7 @@ class Scheduler:
         state_sync: StateSync,
         max_workers: int = 1,
         console: t.Optional[Console] = None,
+        notification_targets: t.Optional[t.List[NotificationTarget]] = None,
     ):
         self.snapshots = {s.snapshot_id: s for s in snapshots}
         self.snapshot_per_version = _resolve_one_snapshot_per_version(snapshots)
@@ -62,6 +73,9 @@ class Scheduler:
         self.state_sync = state_sync
         self.max_workers = max_workers
         self.console: Console = console or get_console()
+        self.notification_targets = notification_targets or []
+        self._audit_executor: t.Optional[ThreadPoolExecutor] = None
+        self._audit_futures: t.List[Future] = []
 
     def batches(
         self,
@@ -96,10 +110,14 @@ class Scheduler:
         end: TimeLike,
         latest: TimeLike,
         is_dev: bool = False,
+        cancellation_token: t.Optional[CancellationToken] = None,
         **kwargs: t.Any,
     ) -> None:
         """Evaluate a snapshot and add the processed interval to the state sync.
 
+        Within `deferred_audits` non-blocking audits are not awaited: they are submitted to a separate pool
+        once the interval has been added, so that downstream snapshots don't wait for them.
+
         Args:
             snapshot: Snapshot to evaluate.
             start: The start datetime to render.
@@ -107,6 +125,7 @@ class Scheduler:
             latest: The latest datetime to use for non-incremental queries.
             is_dev: Indicates whether the evaluation happens in the development mode and temporary
                 tables / table clones should be used where applicable.
+            cancellation_token: The token used to cancel running statements.
             kwargs: Additional kwargs to pass to the renderer.
         """
         validate_date_range(start, end)
@@ -115,27 +134,134 @@ class Scheduler:
             **{p_sid.name: self.snapshots[p_sid] for p_sid in snapshot.parents},
             snapshot.name: snapshot,
         }
+        audit_executor = self._audit_executor
+        defer_audits = audit_executor is not None and _has_non_blocking_audits(snapshot)
+
+        with tracer.span("scheduler.evaluate", snapshot=snapshot.name, start=start, end=end):
+            self.snapshot_evaluator.evaluate(
+                snapshot,
+                start,
+                end,
+                latest,
+                snapshots=snapshots,
+                is_dev=is_dev,
+                cancellation_token=cancellation_token,
+                **kwargs,
+            )
+            self.snapshot_evaluator.audit(
+                snapshot=snapshot,
+                start=start,
+                end=end,
+                latest=latest,
+                snapshots=snapshots,
+                is_dev=is_dev,
+                cancellation_token=cancellation_token,
+                blocking=True if defer_audits else None,
+                **kwargs,
+            )
+            self.state_sync.add_interval(snapshot.snapshot_id, start, end, is_dev=is_dev)
+        if defer_audits:
+            assert audit_executor
+            future = audit_executor.submit(
+                self._run_non_blocking_audits,
+                snapshot,
+                start,
+                end,
+                latest,
+                snapshots,
+                is_dev,
+                cancellation_token,
+                **kwargs,
+            )
+            self._audit_futures.append(future)
+        self.console.update_snapshot_progress(snapshot.name, 1)
 
-        self.snapshot_evaluator.evaluate(
-            snapshot,
-            start,
-            end,
-            latest,
-            snapshots=snapshots,
-            is_dev=is_dev,
-            **kwargs,
-        )
-        self.snapshot_evaluator.audit(
-            snapshot=snapshot,
-            start=start,
-            end=end,
-            latest=latest,
-            snapshots=snapshots,
-            is_dev=is_dev,
-            **kwargs,
+    @contextmanager
+    def deferred_audits(
+        self, cancellation_token: t.Optional[CancellationToken] = None
+    ) -> t.Iterator[None]:
+        """Runs non-blocking audits of snapshots evaluated within this context on a separate bounded pool.
+
+        Failed non-blocking audits are reported to the console and the notification targets. Exiting the
+        context waits for all submitted audits unless the token has been cancelled, in which case pending
+        audits are dropped.
+
+        Args:
+            cancellation_token: The token used to cancel pending audits.
+        """
+        if self._audit_executor is not None:
+            yield
+            return
+
+        self._audit_executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="sqlmesh_audit"
         )
-        self.state_sync.add_interval(snapshot.snapshot_id, start, end, is_dev=is_dev)
-        self.console.update_snapshot_progress(snapshot.name, 1)
+        try:
+            yield
+        finally:
+            executor, self._audit_executor = self._audit_executor, None
+            futures, self._audit_futures = self._audit_futures, []
+            if cancellation_token and cancellation_token.is_cancelled:
+                for future in futures:
+                    future.cancel()
+            executor.shutdown(wait=True)
+
+    def _run_non_blocking_audits(
+        self,
+        snapshot: Snapshot,
+        start: TimeLike,
+        end: TimeLike,
+        latest: TimeLike,
+        snapshots: t.Dict[str, Snapshot],
+        is_dev: bool,
+        cancellation_token: t.Optional[CancellationToken],
+        **kwargs: t.Any,
+    ) -> None:
+        if cancellation_token and cancellation_token.is_cancelled:
+            return
+
+        try:
+            with tracer.span("scheduler.audit", snapshot=snapshot.name, start=start, end=end):
+                results = self.snapshot_evaluator.audit(
+                    snapshot=snapshot,
+                    start=start,
+                    end=end,
+                    latest=latest,
+                    snapshots=snapshots,
+                    is_dev=is_dev,
+                    cancellation_token=cancellation_token,
+                    raise_exception=False,
+                    blocking=False,
+                    **kwargs,
+                )
+        except Exception as ex:
+            formatted_exception = "".join(format_exception(ex))
+            self._notify(
+                NotificationStatus.FAILURE,
+                f"FAILED non-blocking audits of snapshot {snapshot.snapshot_id}\n{formatted_exception}",
+            )
+            return
+
+        for result in results:
+            if result.count:
+                self._notify(
+                    NotificationStatus.WARNING,
+                    f"Audit '{result.audit.name}' for model '{snapshot.name}' failed.\n"
+                    f"Got {result.count} results, expected 0.\n{result.query}\n"
+                    "Audit is warn only so proceeding with execution.",
+                )
+
+    def _notify(self, status: NotificationStatus, message: str) -> None:
+        if status.is_failure:
+            self.console.log_error(message)
+        else:
+            self.console.log_status_update(message)
+
+        for target in self.notification_targets:
+            try:
+                target.send(status, message)
+            except Exception:
+                logger.exception("Failed to send a notification to %s", target)
 
     def run(
         self,
@@ -143,24 +269,30 @@ class Scheduler:
         start: t.Optional[TimeLike] = None,
         end: t.Optional[TimeLike] = None,
         latest: t.Optional[TimeLike] = None,
+        cancellation_token: t.Optional[CancellationToken] = None,
     ) -> bool:
         """Concurrently runs all snapshots in topological order.
 
+        Once the cancellation token is cancelled or the run is interrupted (e.g. with Ctrl-C), running
+        statements are cancelled and pending intervals are skipped.
+
         Args:
             environment: The environment the user is targeting when applying their change.
             start: The start of the run. Defaults to the min model start date.
             end: The end of the run. Defaults to now.
             latest: The latest datetime to use for non-incremental queries.
+            cancellation_token: The token used to cancel the run.
 
         Returns:
             True if the execution was successful and False otherwise.
         """
         validate_date_range(start, end)
+        token = cancellation_token or CancellationToken()
 
         is_dev = environment != c.PROD
         latest = latest or now()
         batches = self.batches(start, end, latest, is_dev=is_dev)
-        dag = self._dag(batches)
+        dag = self.interval_dag(batches)
 
         visited = set()
         for snapshot, _ in dag.sorted():
@@ -173,17 +305,24 @@ class Scheduler:
         def evaluate_node(node: SchedulingUnit) -> None:
             assert latest
             snapshot, (start, end) = node
-            self.evaluate(snapshot, start, end, latest, is_dev=is_dev)
-
-        with self.snapshot_evaluator.concurrent_context():
-            errors, skipped_intervals = concurrent_apply_to_dag(
-                dag,
-                evaluate_node,
-                self.max_workers,
-                raise_on_error=False,
-            )
+            self.evaluate(snapshot, start, end, latest, is_dev=is_dev, cancellation_token=token)
+
+        with self.snapshot_evaluator.concurrent_context(), self.deferred_audits(token):
+            try:
+                errors, skipped_intervals = concurrent_apply_to_dag(
+                    dag,
+                    evaluate_node,
+                    self.max_workers,
+                    raise_on_error=False,
+                    cancellation_token=token,
+                )
+            except KeyboardInterrupt:
+                token.cancel()
+                self.console.stop_snapshot_progress(success=False)
+                raise
 
-        self.console.stop_snapshot_progress(success=not errors)
+        success = not errors and not skipped_intervals
+        self.console.stop_snapshot_progress(success=success)
 
         for error in errors:
             sid = error.node[0]
@@ -194,7 +333,10 @@ class Scheduler:
         for skipped in skipped_snapshots:
             self.console.log_status_update(f"SKIPPED snapshot {skipped}\n")
 
-        return not errors
+        if token.is_cancelled:
+            self.console.log_error("The run has been cancelled.")
+
+        return success
 
     def _interval_params(
         self,
@@ -244,7 +386,7 @@ class Scheduler:
             latest=latest or now(),
         )
 
-    def _dag(self, batches: SnapshotToBatches) -> DAG[SchedulingUnit]:
+    def interval_dag(self, batches: SnapshotToBatches) -> DAG[SchedulingUnit]:
         """Builds a DAG of snapshot intervals to be evaluated.
 
         Args:
@@ -401,6 +543,14 @@ def _batched_intervals(params: SnapshotToBatches) -> SnapshotToBatches:
     return batches
 
 
+def _has_non_blocking_audits(snapshot: Snapshot) -> bool:
+    audits_by_name = {**BUILT_IN_AUDITS, **{a.name: a for a in snapshot.audits}}
+    return any(
+        not audits_by_name[audit_name].blocking and not audits_by_name[audit_name].skip
+        for audit_name, _ in snapshot.model.audits
+    )
+
+
 def _resolve_one_snapshot_per_version(
     snapshots: t.Iterable[Snapshot],
 ) -> t.Dict[t.Tuple[str, str], Snapshot]:
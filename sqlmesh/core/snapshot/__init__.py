@@ -12,7 +12,9 @@ from sqlmesh.core.snapshot.definition import (
     SnapshotNameVersion,
     SnapshotNameVersionLike,
     SnapshotTableInfo,
+    SnapshotVersionInfo,
     fingerprint_from_model,
+    fingerprints_from_models,
     merge_intervals,
     table_name,
     to_table_mapping,
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import typing as t
 
-from sqlmesh.core.config import AutoCategorizationMode, CategorizerConfig
 from sqlmesh.core.snapshot.definition import Snapshot, SnapshotChangeCategory
 from sqlmesh.utils.errors import SQLMeshError
 
+if t.TYPE_CHECKING:
+    from sqlmesh.core.config import CategorizerConfig
+
 
 def categorize_change(
     new: Snapshot, old: Snapshot, config: t.Optional[CategorizerConfig] = None
@@ -24,6 +26,10 @@ def categorize_change(
         The change category or None if the category can't be determined automatically.
 
     """
+    # The config package depends on the engine adapters and on modules which import snapshots,
+    # so it's imported here to keep the snapshot package free of import cycles.
+    from sqlmesh.core.config import AutoCategorizationMode, CategorizerConfig
+
     old_model = old.model
     new_model = new.model
 
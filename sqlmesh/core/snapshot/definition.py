@@ -20,6 +20,7 @@ from sqlmesh.core.model import (
     parse_model_name,
 )
 from sqlmesh.core.model.meta import HookCall
+from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
     TimeLike,
     is_date,
@@ -260,6 +261,32 @@ class SnapshotTableInfo(PydanticModel, SnapshotInfoMixin, frozen=True):
         return self.fingerprint.to_version() == self.version
 
 
+class SnapshotVersionInfo(PydanticModel, frozen=True):
+    """A lightweight projection of a stored snapshot which only contains its versioning information.
+
+    Args:
+        name: The name of the snapshot's model.
+        identifier: The identifier of the snapshot.
+        version: The version of the snapshot.
+        change_category: The change category of the snapshot.
+        previous_versions: The versions of the snapshots this snapshot is based on.
+        indirect_versions: The versions of indirectly modified children of the snapshot by model name.
+        created_ts: The timestamp at which the snapshot was created.
+    """
+
+    name: str
+    identifier: str
+    version: t.Optional[str]
+    change_category: t.Optional[SnapshotChangeCategory]
+    previous_versions: t.Tuple[SnapshotDataVersion, ...] = ()
+    indirect_versions: t.Dict[str, t.Tuple[SnapshotDataVersion, ...]] = {}
+    created_ts: int
+
+    @property
+    def snapshot_id(self) -> SnapshotId:
+        return SnapshotId(name=self.name, identifier=self.identifier)
+
+
 class Snapshot(PydanticModel, SnapshotInfoMixin):
     """A snapshot represents a model at a certain point in time.
 
@@ -645,6 +672,19 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
             is_embedded_kind=self.is_embedded_kind,
         )
 
+    @property
+    def version_info(self) -> SnapshotVersionInfo:
+        """Helper method to get the SnapshotVersionInfo from the Snapshot."""
+        return SnapshotVersionInfo(
+            name=self.name,
+            identifier=self.identifier,
+            version=self.version,
+            change_category=self.change_category,
+            previous_versions=self.previous_versions,
+            indirect_versions=self.indirect_versions,
+            created_ts=self.created_ts,
+        )
+
     @property
     def data_version(self) -> SnapshotDataVersion:
         self._ensure_categorized()
@@ -739,38 +779,105 @@ def fingerprint_from_model(
     Returns:
         The fingerprint.
     """
+    cache = fingerprints_from_models(
+        models if models.get(model.name) is model else {**models, model.name: model},
+        names=[model.name],
+        physical_schema=physical_schema,
+        audits=audits,
+        cache=cache,
+    )
+    return cache[model.name]
+
+
+def fingerprints_from_models(
+    models: t.Dict[str, Model],
+    *,
+    names: t.Optional[t.Iterable[str]] = None,
+    physical_schema: t.Union[str, t.Dict[str, str]] = "",
+    audits: t.Optional[t.Dict[str, Audit]] = None,
+    cache: t.Optional[t.Dict[str, SnapshotFingerprint]] = None,
+) -> t.Dict[str, SnapshotFingerprint]:
+    """Generates fingerprints of multiple models and all models they depend on.
+
+    The hashes of the models themselves are memoized and combined with the hashes of parents in a single
+    pass in topological order.
+
+    Args:
+        models: Dictionary of all models in the graph.
+        names: The names of models to fingerprint. Defaults to all models.
+        physical_schema: The physical schema of snapshots, or a dictionary of physical schemas by model name.
+        audits: Available audits by name.
+        cache: Cache of model name to fingerprints. Only models missing from it are fingerprinted.
+
+    Returns:
+        The cache of model name to fingerprints, including the newly generated fingerprints.
+    """
     cache = {} if cache is None else cache
+    audits = audits or {}
+
+    # Models are tracked by identity since the graph may contain distinct models with the same name.
+    pending: t.Dict[int, Model] = {}
+    parents: t.Dict[int, t.List[Model]] = {}
+    stack = [models[name] for name in (models if names is None else names)]
+    while stack:
+        model = stack.pop()
+        if model.name not in cache and id(model) not in pending:
+            pending[id(model)] = model
+            parents[id(model)] = [
+                models[table]
+                for table in model.depends_on
+                if table in models and models[table] is not model
+            ]
+            stack.extend(parents[id(model)])
 
-    if model.name not in cache:
-        parents = [
-            fingerprint_from_model(
-                models[table],
-                models=models,
-                physical_schema=physical_schema,
-                audits=audits,
-                cache=cache,
-            )
-            for table in model.depends_on
-            if table in models
-        ]
+    if not pending:
+        return cache
 
-        parent_data_hash = _hash(sorted(p.to_version() for p in parents))
+    dag: DAG[int] = DAG()
+    for key in pending:
+        dag.add(key, [id(parent) for parent in parents[key] if id(parent) in pending])
 
-        parent_metadata_hash = _hash(
-            sorted(h for p in parents for h in (p.metadata_hash, p.parent_metadata_hash))
+    fingerprints: t.Dict[int, SnapshotFingerprint] = {}
+    for key in dag.sorted():
+        parent_fingerprints = [
+            fingerprints[id(parent)] if id(parent) in fingerprints else cache[parent.name]
+            for parent in parents[key]
+        ]
+        model = pending[key]
+        schema = (
+            physical_schema
+            if isinstance(physical_schema, str)
+            else physical_schema.get(model.name, "")
         )
-
-        cache[model.name] = SnapshotFingerprint(
-            data_hash=_model_data_hash(model, physical_schema),
-            metadata_hash=_model_metadata_hash(model, audits or {}),
-            parent_data_hash=parent_data_hash,
-            parent_metadata_hash=parent_metadata_hash,
+        fingerprints[key] = cache[model.name] = SnapshotFingerprint(
+            data_hash=_model_data_hash(model, schema),
+            metadata_hash=_model_metadata_hash(model, audits),
+            parent_data_hash=_hash(sorted(p.to_version() for p in parent_fingerprints)),
+            parent_metadata_hash=_hash(
+                sorted(
+                    h
+                    for p in parent_fingerprints
+                    for h in (p.metadata_hash, p.parent_metadata_hash)
+                )
+            ),
         )
 
-    return cache[model.name]
+    return cache
 
 
 def _model_data_hash(model: Model, physical_schema: str) -> str:
+    # Jinja macros are included since, unlike the rest of the model, the registry can be modified in place.
+    inputs = (
+        physical_schema,
+        *model.jinja_macros.root_macros.items(),
+        *(item for package in model.jinja_macros.packages.values() for item in package.items()),
+    )
+    return _memoized_hash(
+        model, "_data_hash", inputs, lambda: _compute_model_data_hash(model, physical_schema)
+    )
+
+
+def _compute_model_data_hash(model: Model, physical_schema: str) -> str:
     def serialize_hooks(hooks: t.List[HookCall]) -> t.Iterable[str]:
         serialized = []
         for hook in hooks:
@@ -815,7 +922,7 @@ def _model_data_hash(model: Model, physical_schema: str) -> str:
             data.append(column_name)
             data.append(str(column_type))
     elif isinstance(model, SeedModel):
-        data.append(model.seed.content)
+        data.append(model.seed.content_hash)
         for column_name, column_type in (model.columns_to_types_ or {}).items():
             data.append(column_name)
             data.append(column_type.sql())
@@ -830,6 +937,13 @@ def _model_data_hash(model: Model, physical_schema: str) -> str:
 
 
 def _model_metadata_hash(model: Model, audits: t.Dict[str, Audit]) -> str:
+    inputs = tuple(audits.get(audit_name) for audit_name, _ in model.audits)
+    return _memoized_hash(
+        model, "_metadata_hash", inputs, lambda: _compute_model_metadata_hash(model, audits)
+    )
+
+
+def _compute_model_metadata_hash(model: Model, audits: t.Dict[str, Audit]) -> str:
     metadata = [
         model.dialect,
         model.owner,
@@ -838,6 +952,9 @@ def _model_metadata_hash(model: Model, audits: t.Dict[str, Audit]) -> str:
         str(model.retention) if model.retention else None,
         str(model.batch_size) if model.batch_size is not None else None,
     ]
+    # Only included when set so that fingerprints of existing models don't change.
+    if model.timeout is not None:
+        metadata.append(str(model.timeout))
 
     for audit_name, audit_args in sorted(model.audits, key=lambda a: a[0]):
         metadata.append(audit_name)
@@ -869,6 +986,21 @@ def _model_metadata_hash(model: Model, audits: t.Dict[str, Audit]) -> str:
     return _hash(metadata)
 
 
+def _memoized_hash(
+    model: Model, attribute: str, inputs: t.Tuple[t.Any, ...], compute: t.Callable[[], str]
+) -> str:
+    """Returns the hash memoized in the given attribute of the model, computing it if the inputs changed."""
+    cached = getattr(model, attribute)
+    if (
+        cached is None
+        or len(cached[0]) != len(inputs)
+        or any(a is not b and a != b for a, b in zip(cached[0], inputs))
+    ):
+        cached = (inputs, compute())
+        setattr(model, attribute, cached)
+    return cached[1]
+
+
 def _hash(data: t.Iterable[t.Optional[str]]) -> str:
     return str(zlib.crc32(";".join("" if d is None else d for d in data).encode("utf-8")))
 
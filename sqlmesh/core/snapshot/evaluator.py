@@ -23,12 +23,13 @@ from __future__ import annotations
 
 import logging
 import typing as t
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 
 from sqlglot import exp, select
 from sqlglot.executor import execute
 
-from sqlmesh.core.audit import BUILT_IN_AUDITS, AuditResult
+from sqlmesh.core.audit import BUILT_IN_AUDITS, Audit, AuditResult
+from sqlmesh.core.audit.fusion import fuse_audit_queries
 from sqlmesh.core.engine_adapter import EngineAdapter, TransactionType
 from sqlmesh.core.snapshot import (
     Snapshot,
@@ -39,9 +40,11 @@ from sqlmesh.core.snapshot import (
 from sqlmesh.utils.concurrency import concurrent_apply_to_snapshots
 from sqlmesh.utils.date import TimeLike
 from sqlmesh.utils.errors import AuditError, ConfigError, SQLMeshError
+from sqlmesh.utils.tracing import tracer
 
 if t.TYPE_CHECKING:
     from sqlmesh.core.engine_adapter._typing import DF, QueryOrDF
+    from sqlmesh.utils.cancellation import CancellationToken
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +75,7 @@ class SnapshotEvaluator:
         snapshots: t.Dict[str, Snapshot],
         limit: t.Optional[int] = None,
         is_dev: bool = False,
+        cancellation_token: t.Optional[CancellationToken] = None,
         **kwargs: t.Any,
     ) -> t.Optional[DF]:
         """Evaluate a snapshot, creating its schema and table if it doesn't exist and then inserting it.
@@ -85,8 +89,28 @@ class SnapshotEvaluator:
             limit: If limit is > 0, the query will not be persisted but evaluated and returned as a dataframe.
             is_dev: Indicates whether the evaluation happens in the development mode and temporary
                 tables / table clones should be used where applicable.
+            cancellation_token: The token used to cancel running statements. Statements are also cancelled
+                once the model's timeout expires.
             kwargs: Additional kwargs to pass to the renderer.
         """
+        with tracer.span(
+            "snapshot_evaluator.evaluate", snapshot=snapshot.name, start=start, end=end
+        ), self._cancellable(cancellation_token, timeout=snapshot.model.timeout):
+            return self._evaluate(
+                snapshot, start, end, latest, snapshots, limit=limit, is_dev=is_dev, **kwargs
+            )
+
+    def _evaluate(
+        self,
+        snapshot: Snapshot,
+        start: TimeLike,
+        end: TimeLike,
+        latest: TimeLike,
+        snapshots: t.Dict[str, Snapshot],
+        limit: t.Optional[int] = None,
+        is_dev: bool = False,
+        **kwargs: t.Any,
+    ) -> t.Optional[DF]:
         if snapshot.is_embedded_kind:
             return None
 
@@ -125,6 +149,8 @@ class SnapshotEvaluator:
                         time_formatter=model.convert_to_time_column,
                         time_column=model.time_column,
                         columns_to_types=columns_to_types,
+                        partitioned_by=model.partitioned_by,
+                        partition_interval_unit=model.interval_unit(),
                     )
                 elif snapshot.is_incremental_by_unique_key_kind:
                     self.adapter.merge(
@@ -174,7 +200,10 @@ class SnapshotEvaluator:
                                 limit,
                                 execute(exp.select(existing_limit.expression)).rows[0][0],
                             )
-                    return query_or_df.head(limit) if hasattr(query_or_df, "head") else self.adapter._fetch_native_df(query_or_df.limit(limit))  # type: ignore
+                    if hasattr(query_or_df, "head"):
+                        return query_or_df.head(limit)
+                    with self.adapter.pinned_connection():
+                        return self.adapter._fetch_native_df(query_or_df.limit(limit))  # type: ignore
 
                 apply(query_or_df, index)
 
@@ -207,7 +236,7 @@ class SnapshotEvaluator:
         with self.concurrent_context():
             concurrent_apply_to_snapshots(
                 target_snapshots,
-                lambda s: self._promote_snapshot(s, environment, is_dev, on_complete),
+                lambda s: self.promote_snapshot(s, environment, is_dev, on_complete),
                 self.ddl_concurrent_tasks,
             )
 
@@ -244,7 +273,7 @@ class SnapshotEvaluator:
         with self.concurrent_context():
             concurrent_apply_to_snapshots(
                 target_snapshots,
-                lambda s: self._create_snapshot(s, snapshots),
+                lambda s: self.create_snapshot(s, snapshots),
                 self.ddl_concurrent_tasks,
             )
 
@@ -285,6 +314,8 @@ class SnapshotEvaluator:
         latest: t.Optional[TimeLike] = None,
         raise_exception: bool = True,
         is_dev: bool = False,
+        cancellation_token: t.Optional[CancellationToken] = None,
+        blocking: t.Optional[bool] = None,
         **kwargs: t.Any,
     ) -> t.List[AuditResult]:
         """Execute a snapshot's model's audit queries.
@@ -299,6 +330,8 @@ class SnapshotEvaluator:
                 AuditError is thrown or if we just warn with logger
             is_dev: Indicates whether the auditing happens in the development mode and temporary
                 tables / table clones should be used where applicable.
+            cancellation_token: The token used to cancel running audit queries.
+            blocking: If set, only the audits whose `blocking` flag matches this value are executed.
             kwargs: Additional kwargs to pass to the renderer.
         """
         if snapshot.is_temporary_table(is_dev):
@@ -314,9 +347,12 @@ class SnapshotEvaluator:
 
         audits_by_name = {**BUILT_IN_AUDITS, **{a.name: a for a in snapshot.audits}}
 
-        results = []
+        results: t.List[t.Optional[AuditResult]] = []
+        pending: t.List[t.Tuple[int, str, Audit, exp.Subqueryable]] = []
         for audit_name, audit_args in snapshot.model.audits:
             audit = audits_by_name[audit_name]
+            if blocking is not None and audit.blocking != blocking:
+                continue
             if audit.skip:
                 results.append(AuditResult(audit=audit, skipped=True))
                 continue
@@ -331,15 +367,40 @@ class SnapshotEvaluator:
                 **audit_args,
                 **kwargs,
             )
-            count, *_ = self.adapter.fetchone(select("COUNT(*)").from_(query.subquery("audit")))
+            pending.append((len(results), audit_name, audit, query))
+            results.append(None)
+
+        # Audits which scan the same interval of the model are computed with a single query.
+        fused, unfused = fuse_audit_queries([query for *_, query in pending])
+        batches = [
+            *fused,
+            *((select("COUNT(*)").from_(pending[i][3].subquery("audit")), [i]) for i in unfused),
+        ]
+
+        counts: t.Dict[int, int] = {}
+        for batch_query, indices in batches:
+            with tracer.span(
+                "snapshot_evaluator.audit",
+                snapshot=snapshot.name,
+                audit=",".join(pending[i][1] for i in indices),
+                start=start,
+                end=end,
+            ) as span, self._cancellable(cancellation_token):
+                row = self.adapter.fetchone(batch_query)
+                if span:
+                    span.set("count", sum(row))
+            counts.update(zip(indices, row))
+
+        for i, (position, audit_name, audit, query) in enumerate(pending):
+            count = counts[i]
             if count and raise_exception:
                 message = f"Audit '{audit_name}' for model '{snapshot.model.name}' failed.\nGot {count} results, expected 0.\n{query}"
                 if audit.blocking:
                     raise AuditError(message)
                 else:
                     logger.warning(f"{message}\nAudit is warn only so proceeding with execution.")
-            results.append(AuditResult(audit=audit, count=count, query=query))
-        return results
+            results[position] = AuditResult(audit=audit, count=count, query=query)
+        return [result for result in results if result is not None]
 
     @contextmanager
     def concurrent_context(self) -> t.Iterator[None]:
@@ -349,8 +410,8 @@ class SnapshotEvaluator:
             self.recycle()
 
     def recycle(self) -> None:
-        """Closes all open connections and releases all allocated resources associated with any thread
-        except the calling one."""
+        """Releases connections associated with any thread except the calling one so that they can be
+        reused by subsequent operations."""
         try:
             self.adapter.recycle()
         except Exception:
@@ -363,7 +424,25 @@ class SnapshotEvaluator:
         except Exception:
             logger.exception("Failed to close Snapshot Evaluator")
 
-    def _create_snapshot(self, snapshot: Snapshot, snapshots: t.Dict[SnapshotId, Snapshot]) -> None:
+    def _cancellable(
+        self,
+        cancellation_token: t.Optional[CancellationToken],
+        timeout: t.Optional[float] = None,
+    ) -> t.ContextManager[None]:
+        if cancellation_token is None and timeout is None:
+            return nullcontext()
+        return self.adapter.cancellable(cancellation_token, timeout=timeout)
+
+    def create_snapshot(self, snapshot: Snapshot, snapshots: t.Dict[SnapshotId, Snapshot]) -> None:
+        """Creates a physical schema and table for a single snapshot.
+
+        Unlike `create`, connections of other threads are not recycled, so this method can be called
+        from within a task that runs concurrently with other evaluations.
+
+        Args:
+            snapshot: The target snapshot.
+            snapshots: All snapshots (by ID) which include the target snapshot's parents.
+        """
         if snapshot.is_embedded_kind:
             return
 
@@ -417,13 +496,21 @@ class SnapshotEvaluator:
         logger.info(f"Altering table '{target_table_name}'")
         self.adapter.alter_table(target_table_name, tmp_table_name)
 
-    def _promote_snapshot(
+    def promote_snapshot(
         self,
         snapshot: SnapshotInfoLike,
         environment: str,
         is_dev: bool,
-        on_complete: t.Optional[t.Callable[[SnapshotInfoLike], None]],
+        on_complete: t.Optional[t.Callable[[SnapshotInfoLike], None]] = None,
     ) -> None:
+        """Promotes a single snapshot in the target environment.
+
+        Args:
+            snapshot: The snapshot to promote.
+            environment: The target environment.
+            is_dev: Indicates whether the promotion happens in the development mode.
+            on_complete: a callback to call once the snapshot has been promoted.
+        """
         qualified_view_name = snapshot.qualified_view_name
         schema = qualified_view_name.schema_for_environment(environment=environment)
         if schema is not None:
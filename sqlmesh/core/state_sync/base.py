@@ -19,11 +19,13 @@ from sqlmesh.core.snapshot import (
     SnapshotInfoLike,
     SnapshotNameVersionLike,
     SnapshotTableInfo,
+    SnapshotVersionInfo,
 )
 from sqlmesh.utils import major_minor
 from sqlmesh.utils.date import TimeLike, now, to_datetime
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
+from sqlmesh.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,25 @@ class StateReader(abc.ABC):
             A dictionary of snapshot ids to snapshots for ones that could be found.
         """
 
+    def get_snapshot_versions(
+        self, snapshot_ids: t.Iterable[SnapshotIdLike]
+    ) -> t.Dict[SnapshotId, SnapshotVersionInfo]:
+        """Bulk fetches the versioning information of snapshots given the corresponding snapshot ids.
+
+        Unlike get_snapshots, this doesn't require the entire snapshots to be fetched and deserialized,
+        which makes it suitable for checking which snapshots exist and what their versions are.
+
+        Args:
+            snapshot_ids: Iterable of snapshot ids to get.
+
+        Returns:
+            A dictionary of snapshot ids to version information for snapshots that could be found.
+        """
+        return {
+            snapshot_id: snapshot.version_info
+            for snapshot_id, snapshot in self.get_snapshots(snapshot_ids).items()
+        }
+
     @abc.abstractmethod
     def get_snapshots_with_same_version(
         self, snapshots: t.Iterable[SnapshotNameVersionLike]
@@ -116,6 +137,7 @@ class StateReader(abc.ABC):
             The list of snapshots.
         """
 
+    @traced("state_sync.missing_intervals")
     def missing_intervals(
         self,
         env_or_snapshots: str | Environment | t.Iterable[Snapshot],
@@ -260,6 +282,25 @@ class StateSync(StateReader, abc.ABC):
             snapshots: A list of snapshots to save in the state sync.
         """
 
+    @abc.abstractmethod
+    def push_seed_contents(self, contents: t.Dict[str, str]) -> None:
+        """Stores the content of seeds which are not in the state sync yet.
+
+        Args:
+            contents: A mapping from the hash of a seed's content to the content itself.
+        """
+
+    @abc.abstractmethod
+    def get_seed_contents(self, content_hashes: t.Iterable[str]) -> t.Dict[str, str]:
+        """Fetches the content of seeds.
+
+        Args:
+            content_hashes: Hashes of the contents to fetch.
+
+        Returns:
+            A mapping from content hashes to contents for the ones that could be found.
+        """
+
     @abc.abstractmethod
     def delete_snapshots(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> None:
         """Delete snapshots from the state sync.
@@ -19,6 +19,7 @@ from sqlmesh.core.snapshot import (
 from sqlmesh.core.state_sync.base import StateSync
 from sqlmesh.utils.date import TimeLike, now, now_timestamp, to_datetime
 from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -41,19 +42,23 @@ def transactional(
 
 
 class CommonStateSyncMixin(StateSync):
+    @traced("state_sync.get_snapshots")
     def get_snapshots(
         self, snapshot_ids: t.Optional[t.Iterable[SnapshotIdLike]]
     ) -> t.Dict[SnapshotId, Snapshot]:
         return self._get_snapshots(snapshot_ids)
 
+    @traced("state_sync.get_snapshots_with_same_version")
     def get_snapshots_with_same_version(
         self, snapshots: t.Iterable[SnapshotNameVersionLike]
     ) -> t.List[Snapshot]:
         return self._get_snapshots_with_same_version(snapshots)
 
+    @traced("state_sync.get_environment")
     def get_environment(self, environment: str) -> t.Optional[Environment]:
         return self._get_environment(environment)
 
+    @traced("state_sync.get_snapshots_by_models")
     def get_snapshots_by_models(
         self, *names: str, lock_for_update: bool = False
     ) -> t.List[Snapshot]:
@@ -69,6 +74,7 @@ class CommonStateSyncMixin(StateSync):
             if snapshot.name in names
         ]
 
+    @traced("state_sync.promote")
     @transactional()
     def promote(
         self, environment: Environment, no_gaps: bool = False
@@ -129,6 +135,7 @@ class CommonStateSyncMixin(StateSync):
         self._update_environment(environment)
         return table_infos, [existing_table_infos[name] for name in missing_models]
 
+    @traced("state_sync.finalize")
     @transactional()
     def finalize(self, environment: Environment) -> None:
         """Finalize the target environment, indicating that this environment has been
@@ -149,6 +156,7 @@ class CommonStateSyncMixin(StateSync):
         environment.finalized_ts = now_timestamp()
         self._update_environment(environment)
 
+    @traced("state_sync.delete_expired_snapshots")
     @transactional()
     def delete_expired_snapshots(self) -> t.List[Snapshot]:
         current_time = now()
@@ -184,6 +192,7 @@ class CommonStateSyncMixin(StateSync):
 
         return expired_snapshots
 
+    @traced("state_sync.add_interval")
     @transactional()
     def add_interval(
         self,
@@ -202,6 +211,7 @@ class CommonStateSyncMixin(StateSync):
         stored_snapshot.add_interval(start, end, is_dev=is_dev)
         self._update_snapshot(stored_snapshot)
 
+    @traced("state_sync.remove_interval")
     @transactional()
     def remove_interval(
         self,
@@ -218,6 +228,7 @@ class CommonStateSyncMixin(StateSync):
             snapshot.remove_interval(start, end)
             self._update_snapshot(snapshot)
 
+    @traced("state_sync.unpause_snapshots")
     @transactional()
     def unpause_snapshots(
         self, snapshots: t.Iterable[SnapshotInfoLike], unpaused_dt: TimeLike
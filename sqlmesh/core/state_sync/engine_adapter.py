@@ -29,7 +29,7 @@ from sqlmesh.core.audit import Audit
 from sqlmesh.core.dialect import select_from_values
 from sqlmesh.core.engine_adapter import EngineAdapter, TransactionType
 from sqlmesh.core.environment import Environment
-from sqlmesh.core.model import Model
+from sqlmesh.core.model import Model, SeedModel
 from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotChangeCategory,
@@ -38,6 +38,7 @@ from sqlmesh.core.snapshot import (
     SnapshotId,
     SnapshotIdLike,
     SnapshotNameVersionLike,
+    SnapshotVersionInfo,
     fingerprint_from_model,
 )
 from sqlmesh.core.snapshot.definition import _parents_from_model
@@ -45,6 +46,7 @@ from sqlmesh.core.state_sync.base import SCHEMA_VERSION, StateSync, Versions
 from sqlmesh.core.state_sync.common import CommonStateSyncMixin, transactional
 from sqlmesh.utils.date import now_timestamp
 from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +72,8 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         self.snapshots_table = f"{schema}._snapshots"
         self.environments_table = f"{schema}._environments"
         self.versions_table = f"{schema}._versions"
+        self.seeds_table = f"{schema}._seeds"
+        self._seed_content_loader = _SeedContentLoader(self)
 
     @property
     def snapshot_columns_to_types(self) -> t.Dict[str, exp.DataType]:
@@ -78,6 +82,10 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             "identifier": exp.DataType.build("text"),
             "version": exp.DataType.build("text"),
             "snapshot": exp.DataType.build("text"),
+            "change_category": exp.DataType.build("int"),
+            "previous_versions": exp.DataType.build("text"),
+            "indirect_versions": exp.DataType.build("text"),
+            "created_ts": exp.DataType.build("bigint"),
         }
 
     @property
@@ -100,6 +108,14 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             "sqlglot_version": exp.DataType.build("text"),
         }
 
+    @property
+    def seed_columns_to_types(self) -> t.Dict[str, exp.DataType]:
+        return {
+            "content_hash": exp.DataType.build("text"),
+            "content": exp.DataType.build("text"),
+        }
+
+    @traced("state_sync.push_snapshots")
     @transactional()
     def push_snapshots(self, snapshots: t.Iterable[Snapshot]) -> None:
         """Pushes snapshots to the state store, merging them with existing ones.
@@ -130,10 +146,12 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             self._push_snapshots(snapshots)
 
     def _push_snapshots(self, snapshots: t.Iterable[Snapshot], overwrite: bool = False) -> None:
+        snapshots = tuple(snapshots)
         if overwrite:
-            snapshots = tuple(snapshots)
             self.delete_snapshots(snapshots)
 
+        self._push_seeds(snapshots)
+
         self.engine_adapter.insert_append(
             self.snapshots_table,
             next(
@@ -144,15 +162,108 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
                             snapshot.identifier,
                             snapshot.version,
                             snapshot.json(),
+                            *self._snapshot_version_columns(snapshot).values(),
                         )
                         for snapshot in snapshots
                     ],
                     columns_to_types=self.snapshot_columns_to_types,
                 )
             ),
+            columns_to_types=self.snapshot_columns_to_types,
+            contains_json=True,
+        )
+
+    def _push_seeds(self, snapshots: t.Iterable[Snapshot]) -> None:
+        """Stores the content of seeds which are not in the state yet. The content is only loaded
+        for seeds that are missing."""
+        seeds = {
+            snapshot.model.seed.content_hash: snapshot.model.seed
+            for snapshot in snapshots
+            if isinstance(snapshot.model, SeedModel)
+        }
+        stored_hashes = self._stored_seed_hashes(seeds)
+        self._insert_seed_contents(
+            {
+                content_hash: seed.content
+                for content_hash, seed in seeds.items()
+                if content_hash not in stored_hashes
+            }
+        )
+
+    @traced("state_sync.push_seed_contents")
+    @transactional()
+    def push_seed_contents(self, contents: t.Dict[str, str]) -> None:
+        stored_hashes = self._stored_seed_hashes(contents)
+        self._insert_seed_contents(
+            {
+                content_hash: content
+                for content_hash, content in contents.items()
+                if content_hash not in stored_hashes
+            }
+        )
+
+    @traced("state_sync.get_seed_contents")
+    def get_seed_contents(self, content_hashes: t.Iterable[str]) -> t.Dict[str, str]:
+        content_hashes = set(content_hashes)
+        if not content_hashes:
+            return {}
+
+        return {
+            row[0]: row[1]
+            for row in self.engine_adapter.fetchall(
+                exp.select("content_hash", "content")
+                .from_(self.seeds_table)
+                .where(self._seed_hash_filter(content_hashes))
+            )
+        }
+
+    def _stored_seed_hashes(self, content_hashes: t.Iterable[str]) -> t.Set[str]:
+        content_hashes = set(content_hashes)
+        if not content_hashes:
+            return set()
+
+        return {
+            row[0]
+            for row in self.engine_adapter.fetchall(
+                exp.select("content_hash")
+                .from_(self.seeds_table)
+                .where(self._seed_hash_filter(content_hashes))
+            )
+        }
+
+    def _insert_seed_contents(self, contents: t.Dict[str, str]) -> None:
+        if not contents:
+            return
+
+        self.engine_adapter.insert_append(
+            self.seeds_table,
+            next(
+                select_from_values(
+                    list(contents.items()),
+                    columns_to_types=self.seed_columns_to_types,
+                )
+            ),
+            columns_to_types=self.seed_columns_to_types,
             contains_json=True,
         )
 
+    def _snapshot_version_columns(self, snapshot: Snapshot) -> t.Dict[str, t.Any]:
+        """Returns the values of the columns which duplicate the versioning information of the snapshot,
+        so that it can be fetched without deserializing entire snapshots."""
+        return {
+            "change_category": snapshot.change_category,
+            "previous_versions": json.dumps(
+                [version.dict() for version in snapshot.previous_versions]
+            ),
+            "indirect_versions": json.dumps(
+                {
+                    name: [version.dict() for version in versions]
+                    for name, versions in snapshot.indirect_versions.items()
+                }
+            ),
+            "created_ts": snapshot.created_ts,
+        }
+
     def _update_versions(
         self,
         schema_version: int = SCHEMA_VERSION,
@@ -170,6 +281,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             ),
         )
 
+    @traced("state_sync.delete_expired_environments")
     def delete_expired_environments(self) -> t.List[Environment]:
         now_ts = now_timestamp()
         filter_expr = exp.LTE(
@@ -193,11 +305,13 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
 
         return environments
 
+    @traced("state_sync.delete_snapshots")
     def delete_snapshots(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> None:
         self.engine_adapter.delete_from(
             self.snapshots_table, where=self._snapshot_id_filter(snapshot_ids)
         )
 
+    @traced("state_sync.snapshots_exist")
     def snapshots_exist(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> t.Set[SnapshotId]:
         return {
             SnapshotId(name=name, identifier=identifier)
@@ -208,11 +322,43 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             )
         }
 
+    @traced("state_sync.get_snapshot_versions")
+    def get_snapshot_versions(
+        self, snapshot_ids: t.Iterable[SnapshotIdLike]
+    ) -> t.Dict[SnapshotId, SnapshotVersionInfo]:
+        columns = [
+            "name",
+            "identifier",
+            "version",
+            "change_category",
+            "previous_versions",
+            "indirect_versions",
+            "created_ts",
+        ]
+        result = {}
+        for row in self.engine_adapter.fetchall(
+            exp.select(*columns)
+            .from_(self.snapshots_table)
+            .where(self._snapshot_id_filter(snapshot_ids)),
+            ignore_unsupported_errors=True,
+        ):
+            fields = dict(zip(columns, row))
+            info = SnapshotVersionInfo(
+                **{
+                    **fields,
+                    "previous_versions": json.loads(fields["previous_versions"] or "[]"),
+                    "indirect_versions": json.loads(fields["indirect_versions"] or "{}"),
+                }
+            )
+            result[info.snapshot_id] = info
+        return result
+
     def reset(self) -> None:
         """Resets the state store to the state when it was first initialized."""
         self.engine_adapter.drop_table(self.snapshots_table)
         self.engine_adapter.drop_table(self.environments_table)
         self.engine_adapter.drop_table(self.versions_table)
+        self.engine_adapter.drop_table(self.seeds_table)
         self.migrate()
 
     def _update_environment(self, environment: Environment) -> None:
@@ -250,11 +396,12 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
     def _update_snapshot(self, snapshot: Snapshot) -> None:
         self.engine_adapter.update_table(
             self.snapshots_table,
-            {"snapshot": snapshot.json()},
+            {"snapshot": snapshot.json(), **self._snapshot_version_columns(snapshot)},
             where=self._snapshot_id_filter([snapshot.snapshot_id]),
             contains_json=True,
         )
 
+    @traced("state_sync.get_environments")
     def get_environments(self) -> t.List[Environment]:
         """Fetches all environments.
 
@@ -311,7 +458,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         duplicates: t.Dict[SnapshotId, Snapshot] = {}
 
         for row in self.engine_adapter.fetchall(query, ignore_unsupported_errors=True):
-            snapshot = Snapshot.parse_raw(row[0])
+            snapshot = self._snapshot_from_json(row[0])
             snapshot_id = snapshot.snapshot_id
             if snapshot_id in snapshots:
                 other = duplicates.get(snapshot_id, snapshots[snapshot_id])
@@ -356,7 +503,13 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             query = query.lock(copy=False)
 
         snapshot_rows = self.engine_adapter.fetchall(query, ignore_unsupported_errors=True)
-        return [Snapshot(**json.loads(row[0])) for row in snapshot_rows]
+        return [self._snapshot_from_json(row[0]) for row in snapshot_rows]
+
+    def _snapshot_from_json(self, payload: str) -> Snapshot:
+        snapshot = Snapshot.parse_raw(payload)
+        if isinstance(snapshot.model, SeedModel):
+            snapshot.model.seed.set_content_loader(self._seed_content_loader)
+        return snapshot
 
     def _get_versions(self, lock_for_update: bool = False) -> Versions:
         if not self.engine_adapter.table_exists(self.versions_table):
@@ -397,6 +550,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         env = self._environment_from_row(row)
         return env
 
+    @traced("state_sync.migrate")
     @transactional()
     def migrate(self) -> None:
         super().migrate()
@@ -580,7 +734,27 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             )
         )
 
+    def _seed_hash_filter(self, content_hashes: t.Iterable[str]) -> exp.In:
+        return exp.In(
+            this=exp.to_column("content_hash"),
+            expressions=[exp.Literal.string(content_hash) for content_hash in content_hashes],
+        )
+
     @contextlib.contextmanager
     def _transaction(self, transaction_type: TransactionType) -> t.Generator[None, None, None]:
         with self.engine_adapter.transaction(transaction_type=transaction_type):
             yield
+
+
+class _SeedContentLoader:
+    """Loads the content of seeds from the state once it's needed."""
+
+    def __init__(self, state_sync: EngineAdapterStateSync):
+        self.state_sync = state_sync
+
+    def __call__(self, content_hash: str) -> t.Optional[str]:
+        return self.state_sync.get_seed_contents([content_hash]).get(content_hash)
+
+    def __deepcopy__(self, memo: t.Dict[int, t.Any]) -> _SeedContentLoader:
+        # Snapshots are deep copied during migrations, the state sync should be shared instead.
+        return self
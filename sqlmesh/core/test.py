@@ -1,10 +1,15 @@
 import difflib
 import fnmatch
+import hashlib
 import itertools
+import json
 import pathlib
+import threading
 import types
 import typing as t
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import pandas as pd
 import ruamel
@@ -13,6 +18,7 @@ from sqlglot import Expression, exp, parse_one
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.model import Model
 from sqlmesh.utils import unique
+from sqlmesh.utils.cache import FileCache
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
 from sqlmesh.utils.yaml import load as yaml_load
@@ -35,6 +41,34 @@ class TestError(SQLMeshError):
     """Test error"""
 
 
+class _TestFixture(t.NamedTuple):
+    df: pd.DataFrame
+    columns_to_types: t.Dict[str, exp.DataType]
+
+
+class FixtureCache:
+    """Caches dataframes and column types of test inputs.
+
+    Inputs are keyed by the identity of their parsed YAML rows, so tests which share inputs through
+    YAML anchors, or are run more than once, only convert them once. The cache is safe to share
+    between threads.
+    """
+
+    def __init__(self) -> None:
+        self._fixtures: t.Dict[int, t.Tuple[t.List[t.Dict[str, t.Any]], _TestFixture]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, rows: t.List[t.Dict[str, t.Any]]) -> _TestFixture:
+        """Returns the dataframe and column types of the given input rows."""
+        with self._lock:
+            cached = self._fixtures.get(id(rows))
+            if cached is None:
+                # The rows are kept alive by the cache so that their id can't be reused.
+                cached = (rows, _to_fixture(rows))
+                self._fixtures[id(rows)] = cached
+            return cached[1]
+
+
 class ModelTest(unittest.TestCase):
     view_names: t.List[str] = []
 
@@ -45,6 +79,8 @@ class ModelTest(unittest.TestCase):
         models: t.Dict[str, Model],
         engine_adapter: EngineAdapter,
         path: t.Optional[pathlib.Path],
+        fixture_schema_suffix: str = "",
+        fixture_cache: t.Optional[FixtureCache] = None,
     ) -> None:
         """ModelTest encapsulates a unit test for a model.
 
@@ -54,12 +90,17 @@ class ModelTest(unittest.TestCase):
             models: All models to use for expansion and mapping of physical locations.
             engine_adapter: The engine adapter to use.
             path: An optional path to the test definition yaml file
+            fixture_schema_suffix: The suffix appended to the names of schemas in which input fixtures
+                are created. Used to isolate tests which run concurrently.
+            fixture_cache: The cache of input fixtures which can be shared between tests.
         """
         self.body = body
         self.path = path
 
         self.test_name = test_name
         self.engine_adapter = engine_adapter
+        self.fixture_schema_suffix = fixture_schema_suffix
+        self.fixture_cache = fixture_cache or FixtureCache()
 
         if "model" not in body:
             self._raise_error("Incomplete test, missing model name")
@@ -80,7 +121,7 @@ class ModelTest(unittest.TestCase):
 
         self.query = self.model.render_query(**self.body.get("vars", {}))
         # For tests we just use the model name for the table reference and we don't want to expand
-        mapping = {name: _test_fixture_name(name) for name in models}
+        mapping = {name: _test_fixture_name(name, fixture_schema_suffix) for name in models}
         if mapping:
             self.query = exp.replace_tables(self.query, mapping)
 
@@ -93,19 +134,16 @@ class ModelTest(unittest.TestCase):
         inputs = {name: table["rows"] for name, table in self.body.get("inputs", {}).items()}
 
         for table, rows in inputs.items():
-            df = pd.DataFrame.from_records(rows)  # noqa
-            columns_to_types: t.Dict[str, exp.DataType] = {}
-            for i, v in rows[0].items():
-                # convert ruamel into python
-                v = v.real if hasattr(v, "real") else v
-                columns_to_types[i] = parse_one(type(v).__name__, into=exp.DataType)  # type: ignore
-            self.engine_adapter.create_schema(table)
-            self.engine_adapter.create_view(_test_fixture_name(table), df, columns_to_types)
+            fixture = self.fixture_cache.get(rows)
+            fixture_name = _test_fixture_name(table, self.fixture_schema_suffix)
+            if "." in fixture_name:
+                self.engine_adapter.create_schema(fixture_name)
+            self.engine_adapter.register_df_view(fixture_name, fixture.df, fixture.columns_to_types)
 
     def tearDown(self) -> None:
         """Drop all input tables"""
         for table in self.body.get("inputs", {}):
-            self.engine_adapter.drop_view(table)
+            self.engine_adapter.drop_view(_test_fixture_name(table, self.fixture_schema_suffix))
 
     def assert_equal(self, df1: pd.DataFrame, df2: pd.DataFrame) -> None:
         """Compare two DataFrames"""
@@ -174,6 +212,154 @@ class ModelTextTestResult(unittest.TextTestResult):
         return super().addFailure(test, (exctype, value, None))  # type: ignore
 
 
+class _CachedModelTest(unittest.TestCase):
+    """Reports a test which is skipped because it has passed before and nothing it depends on has
+    changed since."""
+
+    def __init__(self, metadata: ModelTestMetadata) -> None:
+        self.metadata = metadata
+        super().__init__()
+
+    def runTest(self) -> None:
+        self.skipTest("passed previously and is unchanged")
+
+    def __str__(self) -> str:
+        metadata = self.metadata
+        return f"{metadata.test_name} ({metadata.path}:{metadata.body.lc.line})"  # type: ignore
+
+
+class _PassedModelTest(PydanticModel):
+    test_name: str
+
+
+class ModelTestResultCache:
+    """Persists which tests have passed, so that unchanged tests don't need to run again.
+
+    A result is identified by the test definition, the fingerprint of the tested model, which covers
+    all models upstream of it, and the dialect of the test engine. Changing any of them invalidates
+    the result.
+
+    Args:
+        path: The path to the cache folder.
+        fingerprints: Fingerprints of models by model name.
+        dialect: The dialect of the engine which tests are run against.
+    """
+
+    def __init__(self, path: pathlib.Path, fingerprints: t.Dict[str, str], dialect: str):
+        self._file_cache = FileCache(path, _PassedModelTest, prefix="model_test_results")
+        self._fingerprints = fingerprints
+        self._dialect = dialect
+
+    def passed(self, tests: t.Iterable[ModelTestMetadata]) -> t.List[ModelTestMetadata]:
+        """Returns the given tests which have passed before."""
+        entry_ids = {}
+        for test in tests:
+            entry_id = self._entry_id(test)
+            if entry_id:
+                entry_ids[test] = entry_id
+
+        passed = self._file_cache.get_many(
+            {test.fully_qualified_test_name: entry_id for test, entry_id in entry_ids.items()}
+        )
+        return [test for test in entry_ids if test.fully_qualified_test_name in passed]
+
+    def put(self, tests: t.Iterable[ModelTestMetadata]) -> None:
+        """Records that the given tests have passed."""
+        entries = []
+        for test in tests:
+            entry_id = self._entry_id(test)
+            if entry_id:
+                entries.append(
+                    (
+                        test.fully_qualified_test_name,
+                        entry_id,
+                        _PassedModelTest(test_name=test.test_name),
+                    )
+                )
+        self._file_cache.put_many(entries)
+
+    def _entry_id(self, test: ModelTestMetadata) -> t.Optional[str]:
+        fingerprint = self._fingerprints.get(test.body.get("model"))
+        if fingerprint is None:
+            return None
+        body = json.dumps(test.body, sort_keys=True, default=str)
+        return hashlib.sha256(
+            "\0".join((body, fingerprint, self._dialect)).encode("utf-8")
+        ).hexdigest()
+
+
+class _RecordedTestResult(unittest.TestResult):
+    """Records the outcome of a single test so that it can be reported to a result shared by
+    multiple threads once the test has finished."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._events: t.List[t.Tuple[str, t.Tuple[t.Any, ...]]] = []
+
+    def startTest(self, test: unittest.TestCase) -> None:
+        self._events.append(("startTest", (test,)))
+
+    def stopTest(self, test: unittest.TestCase) -> None:
+        self._events.append(("stopTest", (test,)))
+
+    def addSuccess(self, test: unittest.TestCase) -> None:
+        self._events.append(("addSuccess", (test,)))
+
+    def addFailure(self, test: unittest.TestCase, err: t.Any) -> None:
+        self._events.append(("addFailure", (test, err)))
+
+    def addError(self, test: unittest.TestCase, err: t.Any) -> None:
+        self._events.append(("addError", (test, err)))
+
+    def addSkip(self, test: unittest.TestCase, reason: str) -> None:
+        self._events.append(("addSkip", (test, reason)))
+
+    def addExpectedFailure(self, test: unittest.TestCase, err: t.Any) -> None:
+        self._events.append(("addExpectedFailure", (test, err)))
+
+    def addUnexpectedSuccess(self, test: unittest.TestCase) -> None:
+        self._events.append(("addUnexpectedSuccess", (test,)))
+
+    def addSubTest(self, test: unittest.TestCase, subtest: unittest.TestCase, err: t.Any) -> None:
+        self._events.append(("addSubTest", (test, subtest, err)))
+
+    def replay(self, result: unittest.TestResult) -> None:
+        """Reports the recorded outcome to the given result."""
+        for method, args in self._events:
+            getattr(result, method)(*args)
+
+
+class _ShardedTestSuite(unittest.TestSuite):
+    """A test suite which runs each shard of tests in a separate thread.
+
+    Tests of a shard run sequentially. Outcomes are reported to the result one test at a time, so
+    the output of concurrently running tests doesn't interleave.
+    """
+
+    def __init__(self, shards: t.List[t.List[unittest.TestCase]]) -> None:
+        super().__init__(test for shard in shards for test in shard)
+        self._shards = shards
+        self._result_lock = threading.Lock()
+
+    def run(self, result: unittest.TestResult, debug: bool = False) -> unittest.TestResult:
+        with ThreadPoolExecutor(
+            max_workers=len(self._shards), thread_name_prefix="sqlmesh_test"
+        ) as executor:
+            futures = [executor.submit(self._run_shard, shard, result) for shard in self._shards]
+            for future in futures:
+                future.result()
+        return result
+
+    def _run_shard(self, shard: t.List[unittest.TestCase], result: unittest.TestResult) -> None:
+        for test in shard:
+            if result.shouldStop:
+                break
+            recorded = _RecordedTestResult()
+            test(recorded)
+            with self._result_lock:
+                recorded.replay(result)
+
+
 def load_model_test_file(
     path: pathlib.Path,
 ) -> t.Dict[str, ModelTestMetadata]:
@@ -248,6 +434,9 @@ def run_tests(
     models: t.Dict[str, Model],
     engine_adapter: EngineAdapter,
     verbosity: int = 1,
+    jobs: int = 1,
+    engine_adapter_factory: t.Optional[t.Callable[[], EngineAdapter]] = None,
+    result_cache: t.Optional[ModelTestResultCache] = None,
 ) -> unittest.result.TestResult:
     """Create a test suite of ModelTest objects and run it.
 
@@ -257,18 +446,60 @@ def run_tests(
         engine_adapter: The engine adapter to use.
         patterns: A list of patterns to match against.
         verbosity: The verbosity level.
+        jobs: The number of tests to run concurrently. Tests are split into this many shards, each of
+            which runs in its own thread with its own engine adapter and fixture schemas.
+        engine_adapter_factory: The factory used to create engine adapters for additional shards.
+            Required if the number of jobs is greater than 1. Created engine adapters are closed
+            once all tests have finished.
+        result_cache: The cache of passed tests. Tests which have passed before are reported as
+            skipped instead of being run, and tests which pass are added to the cache.
     """
-    suite = unittest.TestSuite(
-        ModelTest(
-            body=metadata.body,
-            test_name=metadata.test_name,
-            models=models,
-            engine_adapter=engine_adapter,
-            path=metadata.path,
+    passed = set(result_cache.passed(model_test_metadata)) if result_cache else set()
+    cached = [metadata for metadata in model_test_metadata if metadata in passed]
+    to_run = [metadata for metadata in model_test_metadata if metadata not in passed]
+
+    jobs = max(min(jobs, len(to_run)), 1)
+    if jobs > 1 and engine_adapter_factory is None:
+        raise SQLMeshError("An engine adapter factory is required to run tests concurrently.")
+
+    fixture_cache = FixtureCache()
+    engine_adapters = [engine_adapter]
+    try:
+        engine_adapters.extend(engine_adapter_factory() for _ in range(jobs - 1))  # type: ignore
+        model_tests: t.Dict[int, ModelTestMetadata] = {}
+        shards: t.List[t.List[unittest.TestCase]] = [[] for _ in range(jobs)]
+        for index, metadata in enumerate(to_run):
+            shard = index % jobs
+            test = ModelTest(
+                body=metadata.body,
+                test_name=metadata.test_name,
+                models=models,
+                engine_adapter=engine_adapters[shard],
+                path=metadata.path,
+                fixture_schema_suffix=f"__test_{shard}" if jobs > 1 else "",
+                fixture_cache=fixture_cache,
+            )
+            model_tests[id(test)] = metadata
+            shards[shard].append(test)
+        shards[0][:0] = [_CachedModelTest(metadata) for metadata in cached]
+
+        runner = unittest.TextTestRunner(verbosity=verbosity, resultclass=ModelTextTestResult)
+        result = runner.run(
+            _ShardedTestSuite(shards) if jobs > 1 else unittest.TestSuite(shards[0])
         )
-        for metadata in model_test_metadata
-    )
-    return unittest.TextTestRunner(verbosity=verbosity, resultclass=ModelTextTestResult).run(suite)
+    finally:
+        for adapter in engine_adapters[1:]:
+            adapter.close()
+
+    if result_cache and not result.shouldStop:
+        failed = {
+            id(getattr(test, "test_case", test))
+            for test, _ in itertools.chain(result.failures, result.errors, result.skipped)
+        }
+        result_cache.put(
+            metadata for test_id, metadata in model_tests.items() if test_id not in failed
+        )
+    return result
 
 
 def get_all_model_tests(
@@ -290,6 +521,9 @@ def run_model_tests(
     engine_adapter: EngineAdapter,
     verbosity: int = 1,
     patterns: t.Optional[t.List[str]] = None,
+    jobs: int = 1,
+    engine_adapter_factory: t.Optional[t.Callable[[], EngineAdapter]] = None,
+    result_cache: t.Optional[ModelTestResultCache] = None,
 ) -> unittest.result.TestResult:
     """Load and run tests.
 
@@ -299,6 +533,32 @@ def run_model_tests(
         engine_adapter: The engine adapter to use.
         patterns: A list of patterns to match against.
         verbosity: The verbosity level.
+        jobs: The number of tests to run concurrently.
+        engine_adapter_factory: The factory used to create engine adapters for concurrently running tests.
+        result_cache: The cache of passed tests.
+    """
+    return run_tests(
+        load_model_tests(tests, patterns=patterns),
+        models,
+        engine_adapter,
+        verbosity,
+        jobs=jobs,
+        engine_adapter_factory=engine_adapter_factory,
+        result_cache=result_cache,
+    )
+
+
+def load_model_tests(
+    tests: t.List[str], patterns: t.Optional[t.List[str]] = None
+) -> t.List[ModelTestMetadata]:
+    """Load the given tests.
+
+    Args
+        tests: A list of tests to load, e.g. [tests/test_orders.yaml::test_single_order]
+        patterns: A list of patterns to match against.
+
+    Returns:
+        A list of ModelTestMetadata named tuples.
     """
     loaded_tests = []
     for test in tests:
@@ -310,8 +570,25 @@ def run_model_tests(
             loaded_tests.extend(load_model_test_file(path).values())
     if patterns:
         loaded_tests = filter_tests_by_patterns(loaded_tests, patterns)
-    return run_tests(loaded_tests, models, engine_adapter, verbosity)
+    return loaded_tests
+
+
+def _to_fixture(rows: t.List[t.Dict[str, t.Any]]) -> _TestFixture:
+    columns_to_types: t.Dict[str, exp.DataType] = {}
+    for column, value in rows[0].items():
+        # convert ruamel into python
+        value = value.real if hasattr(value, "real") else value
+        columns_to_types[column] = _python_type_to_data_type(type(value).__name__).copy()
+    return _TestFixture(df=pd.DataFrame.from_records(rows), columns_to_types=columns_to_types)
+
+
+@lru_cache()
+def _python_type_to_data_type(type_name: str) -> exp.DataType:
+    return parse_one(type_name, into=exp.DataType)  # type: ignore
 
 
-def _test_fixture_name(name: str) -> str:
+def _test_fixture_name(name: str, schema_suffix: str = "") -> str:
+    if schema_suffix:
+        schema, _, table = name.rpartition(".")
+        name = f"{schema or 'sqlmesh'}{schema_suffix}.{table}"
     return f"{name}__fixture"
@@ -1,13 +1,16 @@
 import typing as t
 from enum import Enum
+from pathlib import Path
 
 from sqlmesh.core.environment import Environment
+from sqlmesh.core.model import SeedModel, SqlModel
 from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotEvaluator,
     SnapshotId,
     SnapshotTableInfo,
 )
+from sqlmesh.utils.cache import OptimizedQueryCache
 from sqlmesh.utils.date import TimeLike
 from sqlmesh.utils.pydantic import PydanticModel
 
@@ -34,6 +37,8 @@ class EvaluateCommandPayload(PydanticModel):
     end: TimeLike
     latest: TimeLike
     is_dev: bool
+    seed_contents: t.Dict[str, str] = {}
+    optimized_query_cache_path: t.Optional[str] = None
 
 
 class PromoteCommandPayload(PydanticModel):
@@ -55,6 +60,7 @@ class CleanupCommandPayload(PydanticModel):
 class CreateTablesCommandPayload(PydanticModel):
     target_snapshot_ids: t.List[SnapshotId]
     snapshots: t.List[Snapshot]
+    seed_contents: t.Dict[str, str] = {}
 
 
 class MigrateTablesCommandPayload(PydanticModel):
@@ -67,6 +73,14 @@ def evaluate(
     if isinstance(command_payload, str):
         command_payload = EvaluateCommandPayload.parse_raw(command_payload)
 
+    _set_seed_content_loaders([command_payload.snapshot], command_payload.seed_contents)
+    if command_payload.optimized_query_cache_path and isinstance(
+        command_payload.snapshot.model, SqlModel
+    ):
+        command_payload.snapshot.model.set_optimized_query_cache(
+            OptimizedQueryCache(Path(command_payload.optimized_query_cache_path))
+        )
+
     parent_snapshots = command_payload.parent_snapshots
     parent_snapshots[command_payload.snapshot.name] = command_payload.snapshot
 
@@ -125,6 +139,7 @@ def create_tables(
     if isinstance(command_payload, str):
         command_payload = CreateTablesCommandPayload.parse_raw(command_payload)
 
+    _set_seed_content_loaders(command_payload.snapshots, command_payload.seed_contents)
     snapshots_by_id = {s.snapshot_id: s for s in command_payload.snapshots}
     target_snapshots = [snapshots_by_id[sid] for sid in command_payload.target_snapshot_ids]
     evaluator.create(target_snapshots, snapshots_by_id)
@@ -139,6 +154,15 @@ def migrate_tables(
     evaluator.migrate(command_payload.snapshots)
 
 
+def _set_seed_content_loaders(
+    snapshots: t.Iterable[Snapshot], seed_contents: t.Dict[str, str]
+) -> None:
+    for snapshot in snapshots:
+        model = snapshot.model
+        if isinstance(model, SeedModel) and model.seed.content_hash in seed_contents:
+            model.seed.set_content_loader(seed_contents.get)
+
+
 COMMAND_HANDLERS: t.Dict[CommandType, t.Callable[[SnapshotEvaluator, str], None]] = {
     CommandType.EVALUATE: evaluate,
     CommandType.PROMOTE: promote,
@@ -190,6 +190,18 @@ class SQLMeshMagics(Magics):
         action="store_true",
         help="Skip the unit tests defined for the model.",
     )
+    @argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="The number of unit tests to run concurrently.",
+    )
+    @argument(
+        "--run-all-tests",
+        action="store_true",
+        help="Run all unit tests, including tests of unchanged models and tests which have passed before.",
+    )
     @argument(
         "--restate-model",
         "-r",
@@ -246,6 +258,8 @@ class SQLMeshMagics(Magics):
             latest=args.latest,
             create_from=args.create_from,
             skip_tests=args.skip_tests,
+            test_jobs=args.jobs,
+            run_all_tests=args.run_all_tests,
             restate_models=args.restate_model,
             no_gaps=args.no_gaps,
             skip_backfill=args.skip_backfill,
@@ -0,0 +1,63 @@
+"""Store the versioning information of snapshots in dedicated columns."""
+import json
+
+from sqlglot import exp
+
+from sqlmesh.core.dialect import select_from_values
+
+
+def migrate(state_sync):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    snapshots_table = f"{state_sync.schema}._snapshots"
+
+    new_columns = {
+        "change_category": exp.DataType.build("int"),
+        "previous_versions": exp.DataType.build("text"),
+        "indirect_versions": exp.DataType.build("text"),
+        "created_ts": exp.DataType.build("bigint"),
+    }
+
+    for column_name, column_type in new_columns.items():
+        engine_adapter.execute(
+            exp.AlterTable(
+                this=exp.to_table(snapshots_table),
+                actions=[exp.ColumnDef(this=exp.to_column(column_name), kind=column_type)],
+            )
+        )
+
+    new_rows = []
+    for name, identifier, version, snapshot in engine_adapter.fetchall(
+        exp.select("name", "identifier", "version", "snapshot").from_(snapshots_table)
+    ):
+        parsed_snapshot = json.loads(snapshot)
+        new_rows.append(
+            (
+                name,
+                identifier,
+                version,
+                snapshot,
+                parsed_snapshot.get("change_category"),
+                json.dumps(parsed_snapshot.get("previous_versions", [])),
+                json.dumps(parsed_snapshot.get("indirect_versions", {})),
+                parsed_snapshot["created_ts"],
+            )
+        )
+
+    if not new_rows:
+        return
+
+    columns_to_types = {
+        "name": exp.DataType.build("text"),
+        "identifier": exp.DataType.build("text"),
+        "version": exp.DataType.build("text"),
+        "snapshot": exp.DataType.build("text"),
+        **new_columns,
+    }
+
+    engine_adapter.delete_from(snapshots_table, "TRUE")
+    engine_adapter.insert_append(
+        snapshots_table,
+        next(select_from_values(new_rows, columns_to_types=columns_to_types)),
+        columns_to_types=columns_to_types,
+        contains_json=True,
+    )
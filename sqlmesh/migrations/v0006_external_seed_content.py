@@ -0,0 +1,84 @@
+"""Move the content of seeds out of snapshots into a table keyed by the hash of the content."""
+import hashlib
+import json
+
+from sqlglot import exp
+
+from sqlmesh.core.dialect import select_from_values
+
+
+def migrate(state_sync):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    snapshots_table = f"{state_sync.schema}._snapshots"
+    seeds_table = f"{state_sync.schema}._seeds"
+
+    seed_columns_to_types = {
+        "content_hash": exp.DataType.build("text"),
+        "content": exp.DataType.build("text"),
+    }
+    engine_adapter.create_state_table(
+        seeds_table, seed_columns_to_types, primary_key=("content_hash",)
+    )
+
+    snapshot_columns_to_types = {
+        "name": exp.DataType.build("text"),
+        "identifier": exp.DataType.build("text"),
+        "version": exp.DataType.build("text"),
+        "snapshot": exp.DataType.build("text"),
+        "change_category": exp.DataType.build("int"),
+        "previous_versions": exp.DataType.build("text"),
+        "indirect_versions": exp.DataType.build("text"),
+        "created_ts": exp.DataType.build("bigint"),
+    }
+
+    seeds = {}
+    new_rows = []
+    for (
+        name,
+        identifier,
+        version,
+        snapshot,
+        change_category,
+        previous_versions,
+        indirect_versions,
+        created_ts,
+    ) in engine_adapter.fetchall(exp.select(*snapshot_columns_to_types).from_(snapshots_table)):
+        parsed_snapshot = json.loads(snapshot)
+        seed = parsed_snapshot["model"].get("seed")
+        if seed and "content" in seed:
+            content = seed.pop("content")
+            content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            seed["content_hash"] = content_hash
+            seeds[content_hash] = content
+            snapshot = json.dumps(parsed_snapshot)
+
+        new_rows.append(
+            (
+                name,
+                identifier,
+                version,
+                snapshot,
+                change_category,
+                previous_versions,
+                indirect_versions,
+                created_ts,
+            )
+        )
+
+    if not seeds:
+        return
+
+    engine_adapter.insert_append(
+        seeds_table,
+        next(select_from_values(list(seeds.items()), columns_to_types=seed_columns_to_types)),
+        columns_to_types=seed_columns_to_types,
+        contains_json=True,
+    )
+
+    engine_adapter.delete_from(snapshots_table, "TRUE")
+    engine_adapter.insert_append(
+        snapshots_table,
+        next(select_from_values(new_rows, columns_to_types=snapshot_columns_to_types)),
+        columns_to_types=snapshot_columns_to_types,
+        contains_json=True,
+    )
@@ -10,6 +10,7 @@ from requests.models import Response
 from sqlmesh.core._typing import NotificationTarget
 from sqlmesh.core.console import Console
 from sqlmesh.core.environment import Environment
+from sqlmesh.core.model import SeedModel
 from sqlmesh.core.snapshot import Snapshot, SnapshotId, SnapshotNameVersion
 from sqlmesh.core.state_sync import Versions
 from sqlmesh.core.user import User
@@ -57,8 +58,9 @@ class AirflowClient:
         is_dev: bool = False,
         forward_only: bool = False,
     ) -> None:
+        new_snapshots = list(new_snapshots)
         request = common.PlanApplicationRequest(
-            new_snapshots=list(new_snapshots),
+            new_snapshots=new_snapshots,
             environment=environment,
             no_gaps=no_gaps,
             skip_backfill=skip_backfill,
@@ -70,6 +72,11 @@ class AirflowClient:
             users=users or [],
             is_dev=is_dev,
             forward_only=forward_only,
+            seed_contents={
+                s.model.seed.content_hash: s.model.seed.content
+                for s in new_snapshots
+                if isinstance(s.model, SeedModel)
+            },
         )
 
         response = self._session.post(
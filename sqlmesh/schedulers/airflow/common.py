@@ -50,6 +50,7 @@ class PlanApplicationRequest(PydanticModel):
     users: t.List[User]
     is_dev: bool
     forward_only: bool
+    seed_contents: t.Dict[str, str] = {}
 
 
 class BackfillIntervalsPerSnapshot(PydanticModel):
@@ -58,12 +58,14 @@ class SnapshotDagGenerator:
         ddl_engine_operator: t.Type[BaseOperator],
         ddl_engine_operator_args: t.Optional[t.Dict[str, t.Any]],
         snapshots: t.Dict[SnapshotId, Snapshot],
+        optimized_query_cache_path: t.Optional[str] = None,
     ):
         self._engine_operator = engine_operator
         self._engine_operator_args = engine_operator_args or {}
         self._ddl_engine_operator = ddl_engine_operator
         self._ddl_engine_operator_args = ddl_engine_operator_args or {}
         self._snapshots = snapshots
+        self._optimized_query_cache_path = optimized_query_cache_path
 
     def generate_cadence_dags(self) -> t.List[DAG]:
         return [
@@ -471,6 +473,7 @@ class SnapshotDagGenerator:
                 start=start,
                 end=end,
                 is_dev=is_dev,
+                optimized_query_cache_path=self._optimized_query_cache_path,
             ),
             task_id=task_id,
         )
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import typing as t
 from datetime import datetime, timedelta
+from pathlib import Path
 
 from airflow import DAG
 from airflow.models import BaseOperator, TaskInstance, Variable
@@ -56,6 +57,8 @@ class SQLMeshAirflow:
             deletion from Airflow. Default: 1 hour.
         plan_application_dag_ttl: Determines the time-to-live period for finished plan application DAGs.
             Once this period is exceeded, finished plan application DAGs are deleted by the janitor. Default: 2 days.
+        optimized_query_cache_path: The path to a folder on the worker's local disk in which optimized model queries
+            are cached between tasks. If not specified, queries are optimized from scratch in every task.
     """
 
     def __init__(
@@ -66,6 +69,7 @@ class SQLMeshAirflow:
         ddl_engine_operator_args: t.Optional[t.Dict[str, t.Any]] = None,
         janitor_interval: timedelta = timedelta(hours=1),
         plan_application_dag_ttl: timedelta = timedelta(days=2),
+        optimized_query_cache_path: t.Optional[t.Union[str, Path]] = None,
     ):
         if isinstance(engine_operator, str):
             if not ddl_engine_operator:
@@ -88,6 +92,10 @@ class SQLMeshAirflow:
         self._janitor_interval = janitor_interval
         self._plan_application_dag_ttl = plan_application_dag_ttl
 
+        self._optimized_query_cache_path = (
+            str(optimized_query_cache_path) if optimized_query_cache_path else None
+        )
+
     @property
     def dags(self) -> t.List[DAG]:
         """Returns all DAG instances that must be registered with the Airflow scheduler
@@ -105,6 +113,7 @@ class SQLMeshAirflow:
             self._ddl_engine_operator,
             self._ddl_engine_operator_args,
             stored_snapshots,
+            optimized_query_cache_path=self._optimized_query_cache_path,
         )
 
         cadence_dags = dag_generator.generate_cadence_dags()
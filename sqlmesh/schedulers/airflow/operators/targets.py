@@ -7,6 +7,7 @@ from airflow.utils.session import provide_session
 from sqlalchemy.orm import Session
 
 from sqlmesh.core.engine_adapter import create_engine_adapter
+from sqlmesh.core.model import SeedModel
 from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotEvaluator,
@@ -107,6 +108,7 @@ class SnapshotEvaluationTarget(BaseTarget[commands.EvaluateCommandPayload], Pyda
         latest: The latest time used for non incremental datasets.
         is_dev: Indicates whether the evaluation happens in the development mode and temporary
             tables / table clones should be used where applicable.
+        optimized_query_cache_path: The path to the folder in which optimized model queries are cached.
     """
 
     command_type: commands.CommandType = commands.CommandType.EVALUATE
@@ -121,6 +123,7 @@ class SnapshotEvaluationTarget(BaseTarget[commands.EvaluateCommandPayload], Pyda
     end: t.Optional[TimeLike]
     latest: t.Optional[TimeLike]
     is_dev: bool
+    optimized_query_cache_path: t.Optional[str] = None
 
     def post_hook(
         self,
@@ -143,6 +146,8 @@ class SnapshotEvaluationTarget(BaseTarget[commands.EvaluateCommandPayload], Pyda
             end=self._get_end(context),
             latest=self._get_latest(context),
             is_dev=self.is_dev,
+            seed_contents=_get_seed_contents([self.snapshot]),
+            optimized_query_cache_path=self.optimized_query_cache_path,
         )
 
     def _get_start(self, context: Context) -> TimeLike:
@@ -274,6 +279,7 @@ class SnapshotCreateTablesTarget(BaseTarget[commands.CreateTablesCommandPayload]
         return commands.CreateTablesCommandPayload(
             target_snapshot_ids=[s.snapshot_id for s in self.new_snapshots],
             snapshots=stored_snapshots + self.new_snapshots,
+            seed_contents=_get_seed_contents(self.new_snapshots),
         )
 
     def _get_stored_snapshots(self, snapshot_ids: t.Set[SnapshotId]) -> t.List[Snapshot]:
@@ -311,3 +317,14 @@ def _delete_xcom(key: str, task_id: str, context: Context, session: Session) ->
         run_id=ti.run_id,
         session=session,
     )
+
+
+def _get_seed_contents(snapshots: t.Iterable[Snapshot]) -> t.Dict[str, str]:
+    content_hashes = {
+        s.model.seed.content_hash for s in snapshots if isinstance(s.model, SeedModel)
+    }
+    if not content_hashes:
+        return {}
+
+    with util.scoped_state_sync() as state_sync:
+        return state_sync.get_seed_contents(content_hashes)
@@ -25,6 +25,9 @@ def create_plan_dag_spec(
             "Make sure your code base is up to date and try re-creating the plan"
         )
 
+    # Seeds are only referenced by the hash of their content, which is stored separately.
+    state_sync.push_seed_contents(request.seed_contents)
+
     if request.environment.end_at:
         end = request.environment.end_at
         unpaused_dt = None
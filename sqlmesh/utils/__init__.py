@@ -7,6 +7,7 @@ import traceback
 import types
 import typing as t
 import uuid
+from collections import OrderedDict
 from contextlib import contextmanager
 from functools import wraps
 from pathlib import Path
@@ -64,6 +65,35 @@ class AttributeDict(dict, t.Mapping[KEY, VALUE]):
     __getattr__ = dict.get
 
 
+class LRUCache(OrderedDict, t.MutableMapping[KEY, VALUE]):
+    """Dict that evicts the least recently used entries once it holds more than `maxsize` entries."""
+
+    def __init__(self, *args: t.Any, maxsize: int = 128, **kwargs: VALUE) -> None:
+        self.maxsize = maxsize
+        super().__init__(*args, **kwargs)
+
+    def __getitem__(self, k: KEY) -> VALUE:
+        v = super().__getitem__(k)
+        try:
+            self.move_to_end(k)
+        except KeyError:
+            # The entry has been evicted by another thread in the meantime.
+            pass
+        return v
+
+    def __setitem__(self, k: KEY, v: VALUE) -> None:
+        super().__setitem__(k, v)
+        self.move_to_end(k)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def get(self, k: KEY, default: t.Any = None) -> t.Any:
+        try:
+            return self[k]
+        except KeyError:
+            return default
+
+
 class registry_decorator:
     """A decorator that registers itself."""
 
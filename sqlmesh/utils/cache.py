@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import pickle
+import sqlite3
+import threading
+import time
 import typing as t
 from pathlib import Path
 
 from sqlglot import __version__ as SQLGLOT_VERSION
+from sqlglot import exp
 
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
@@ -19,15 +24,32 @@ SQLGLOT_VERSION_TUPLE = tuple(SQLGLOT_VERSION.split("."))
 SQLGLOT_MAJOR_VERSION = SQLGLOT_VERSION_TUPLE[0]
 SQLGLOT_MINOR_VERSION = SQLGLOT_VERSION_TUPLE[1]
 
+FILE_CACHE_DB_NAME = "cache.db"
+"""The name of the database file which stores the entries of file caches."""
+
+FILE_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+"""The default maximum total size of all file cache entries in bytes."""
+
+FILE_CACHE_MMAP_SIZE = 256 * 1024 * 1024
+"""The maximum number of bytes of the file cache database which are read through memory mapping."""
+
+OPTIMIZED_QUERY_CACHE_MAX_SIZE = 256 * 1024 * 1024
+"""The default maximum total size of the optimized query cache in bytes."""
+
 
 class FileCache(t.Generic[T]):
     """Generic file-based cache implementation.
 
+    All entries are stored in a single SQLite database inside the cache folder, which can be shared
+    between concurrent processes. Each write is atomic. Once the total size of all entries exceeds
+    `max_size`, the least recently used entries are removed.
+
     Args:
         path: The path to the cache folder.
         entry_class: The type of cached entries.
         prefix: The prefix shared between all entries to distinguish them from other entries
             stored in the same cache folder.
+        max_size: The maximum total size of all entries stored in the cache folder in bytes.
     """
 
     def __init__(
@@ -35,9 +57,15 @@ class FileCache(t.Generic[T]):
         path: Path,
         entry_class: t.Type[T],
         prefix: t.Optional[str] = None,
+        max_size: int = FILE_CACHE_MAX_SIZE,
     ):
-        self._path = path / prefix if prefix else path
+        self._path = path
+        self._prefix = prefix or ""
         self._entry_class = entry_class
+        self.max_size = max_size
+        self._size: t.Optional[int] = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
 
     def get_or_load(self, name: str, entry_id: str, loader: t.Callable[[], T]) -> T:
         """Returns an existing cached entry or loads and caches a new one.
@@ -68,15 +96,51 @@ class FileCache(t.Generic[T]):
         Returns:
             The entry or None if no entry was found in the cache.
         """
-        cache_entry_path = self._cache_entry_path(name, entry_id)
-        if cache_entry_path.exists():
-            with open(cache_entry_path, "rb") as fd:
-                try:
-                    return self._entry_class.parse_obj(pickle.load(fd))
-                except Exception as ex:
-                    logger.warning("Failed to load a cache entry '%s': %s", name, ex)
+        return self.get_many({name: entry_id}).get(name)
+
+    def get_many(self, entry_ids: t.Dict[str, str]) -> t.Dict[str, T]:
+        """Returns all cached entries that exist.
+
+        Args:
+            entry_ids: The unique entry identifiers by entry names.
+
+        Returns:
+            The found entries by their names.
+        """
+        if not entry_ids or not self._db_path.exists():
+            return {}
+
+        names = list(entry_ids)
+        rows: t.List[t.Tuple[str, str, bytes]] = []
+        connection = self._connection()
+        # Stay well below SQLite's limit of host parameters per statement.
+        for i in range(0, len(names), 500):
+            batch = names[i : i + 500]
+            rows.extend(
+                connection.execute(
+                    f"SELECT name, entry_id, value FROM entries WHERE prefix = ? AND name IN ({', '.join('?' * len(batch))})",
+                    (self._prefix, *batch),
+                )
+            )
+
+        entries = {}
+        for name, entry_id, value in rows:
+            if entry_id != self._versioned_entry_id(entry_ids[name]):
+                continue
+            try:
+                entries[name] = self._entry_class.parse_obj(pickle.loads(value))
+            except Exception as ex:
+                logger.warning("Failed to load a cache entry '%s': %s", name, ex)
 
-        return None
+        if entries:
+            # Record the access for the least recently used eviction.
+            self._write(
+                lambda connection: connection.executemany(
+                    "UPDATE entries SET accessed_at = ? WHERE prefix = ? AND name = ?",
+                    [(time.time(), self._prefix, name) for name in entries],
+                )
+            )
+        return entries
 
     def put(self, name: str, entry_id: str, value: T) -> None:
         """Stores the given value in the cache.
@@ -86,23 +150,175 @@ class FileCache(t.Generic[T]):
             entry_id: The unique entry identifier. Used for cache invalidation.
             value: The value to store in the cache.
         """
-        if not self._path.exists():
-            self._path.mkdir(parents=True)
-        if not self._path.is_dir():
-            raise SQLMeshError(f"Cache path '{self._path}' is not a directory.")
+        self.put_many([(name, entry_id, value)])
 
-        for obsolete_cache_file in self._path.glob(f"{name}__*"):
-            obsolete_cache_file.unlink()
+    def put_many(self, entries: t.Iterable[t.Tuple[str, str, T]]) -> None:
+        """Stores the given values in the cache in a single transaction.
 
-        with open(self._cache_entry_path(name, entry_id), "wb") as fd:
-            pickle.dump(value.dict(), fd)
+        An existing entry with the same name is replaced regardless of its identifier.
 
-    def _cache_entry_path(self, name: str, entry_id: str) -> Path:
+        Args:
+            entries: Tuples of an entry name, its unique identifier and the value to store.
+        """
+        now = time.time()
+        rows = [
+            (
+                self._prefix,
+                name,
+                self._versioned_entry_id(entry_id),
+                pickle.dumps(value.dict(), protocol=pickle.HIGHEST_PROTOCOL),
+                now,
+            )
+            for name, entry_id, value in entries
+        ]
+        if not rows:
+            return
+
+        self._write(
+            lambda connection: connection.executemany(
+                "INSERT OR REPLACE INTO entries (prefix, name, entry_id, value, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        )
+
+        with self._lock:
+            size = sum(len(row[3]) for row in rows)
+            self._size = self._total_size() if self._size is None else self._size + size
+            if self._size > self.max_size:
+                self._evict()
+
+    @property
+    def _db_path(self) -> Path:
+        return self._path / FILE_CACHE_DB_NAME
+
+    def _versioned_entry_id(self, entry_id: str) -> str:
+        major, minor = _sqlmesh_version()
+        return f"{major}__{minor}__{SQLGLOT_MAJOR_VERSION}__{SQLGLOT_MINOR_VERSION}__{entry_id}"
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections can't be shared between threads.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            if not self._path.exists():
+                self._path.mkdir(parents=True, exist_ok=True)
+            if not self._path.is_dir():
+                raise SQLMeshError(f"Cache path '{self._path}' is not a directory.")
+
+            connection = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute(f"PRAGMA mmap_size = {FILE_CACHE_MMAP_SIZE}")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (prefix TEXT NOT NULL, name TEXT NOT NULL, entry_id TEXT NOT NULL, value BLOB NOT NULL, accessed_at REAL NOT NULL, PRIMARY KEY (prefix, name))"
+            )
+            self._local.connection = connection
+        return connection
+
+    def _write(self, fn: t.Callable[[sqlite3.Connection], t.Any]) -> None:
+        connection = self._connection()
         try:
-            from sqlmesh._version import __version_tuple__
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                fn(connection)
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except sqlite3.Error as ex:
+            logger.warning("Failed to write to the cache at '%s': %s", self._db_path, ex)
+
+    def _evict(self) -> None:
+        # Leave some headroom so that eviction doesn't happen on every subsequent write.
+        excess = self._total_size() - self.max_size * 0.8
+
+        def _delete_least_recently_used(connection: sqlite3.Connection) -> None:
+            nonlocal excess
+            evicted = []
+            for rowid, size in connection.execute(
+                "SELECT rowid, LENGTH(value) FROM entries ORDER BY accessed_at"
+            ):
+                if excess <= 0:
+                    break
+                evicted.append((rowid,))
+                excess -= size
+            connection.executemany("DELETE FROM entries WHERE rowid = ?", evicted)
+
+        if excess > 0:
+            self._write(_delete_least_recently_used)
+        self._size = self._total_size()
+
+    def _total_size(self) -> int:
+        return (
+            self._connection()
+            .execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM entries")
+            .fetchone()[0]
+        )
+
+
+class _OptimizedQueryCacheEntry(PydanticModel):
+    query: t.Dict
+
+
+class OptimizedQueryCache:
+    """Content-addressed cache of optimized query expressions which can be shared between processes.
+
+    Entries are stored in a file cache of their own inside the cache folder, so that the maximum size of
+    this cache doesn't affect other cached entries.
+
+    Args:
+        path: The path to the cache folder.
+        max_size: The maximum total size of all entries in bytes.
+    """
+
+    def __init__(self, path: Path, max_size: int = OPTIMIZED_QUERY_CACHE_MAX_SIZE):
+        self._file_cache: FileCache[_OptimizedQueryCacheEntry] = FileCache(
+            path / "optimized_query", _OptimizedQueryCacheEntry, max_size=max_size
+        )
+
+    @staticmethod
+    def entry_id(*parts: str) -> str:
+        """Returns the entry identifier for the given parts. The identifier also covers the versions of
+        SQLMesh and SQLGlot since the optimizer output depends on them."""
+        major, minor = _sqlmesh_version()
+        digest = hashlib.sha256(f"{major}.{minor}:{SQLGLOT_VERSION}".encode("utf-8"))
+        for part in parts:
+            digest.update(b"\0")
+            digest.update(part.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, entry_id: str) -> t.Optional[exp.Expression]:
+        """Returns a cached expression if exists.
+
+        Args:
+            entry_id: The entry identifier.
+
+        Returns:
+            The expression or None if no entry was found in the cache.
+        """
+        entry = self._file_cache.get(entry_id, entry_id)
+        if not entry:
+            return None
+
+        try:
+            return exp.Expression.load(entry.query)
+        except Exception as ex:
+            logger.warning("Failed to load an optimized query cache entry '%s': %s", entry_id, ex)
+            return None
+
+    def put(self, entry_id: str, expression: exp.Expression) -> None:
+        """Stores the given expression in the cache.
+
+        Args:
+            entry_id: The entry identifier.
+            expression: The expression to store.
+        """
+        self._file_cache.put(entry_id, entry_id, _OptimizedQueryCacheEntry(query=expression.dump()))
+
+
+def _sqlmesh_version() -> t.Tuple[int, int]:
+    try:
+        from sqlmesh._version import __version_tuple__
 
-            major, minor = __version_tuple__[0], __version_tuple__[1]
-        except ImportError:
-            major, minor = 0, 0
-        entry_file_name = f"{name}__{major}__{minor}__{SQLGLOT_MAJOR_VERSION}__{SQLGLOT_MINOR_VERSION}__{entry_id}"
-        return self._path / entry_file_name
+        return int(__version_tuple__[0]), int(__version_tuple__[1])
+    except ImportError:
+        return 0, 0
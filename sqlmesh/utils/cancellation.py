@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import logging
+import threading
+import typing as t
+
+from sqlmesh.utils.errors import ExecutionCancelledError
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationToken:
+    """A thread-safe token used to cooperatively cancel a running operation.
+
+    Long-running operations check the token between units of work and stop once it has been cancelled.
+    Operations which block on external systems (e.g. queries executed by an engine adapter) register a
+    callback which interrupts them as soon as the cancellation is requested.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: t.Dict[int, t.Callable[[], None]] = {}
+        self._next_callback_id = 0
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Cancels the token and invokes all registered callbacks. Subsequent calls have no effect."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            _invoke(callback)
+
+    def on_cancel(self, callback: t.Callable[[], None]) -> t.Callable[[], None]:
+        """Registers a callback which is invoked once the token is cancelled. If the token has already been
+        cancelled, the callback is invoked immediately.
+
+        Args:
+            callback: The function to invoke.
+
+        Returns:
+            A function which unregisters the callback.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                callback_id = self._next_callback_id
+                self._next_callback_id += 1
+                self._callbacks[callback_id] = callback
+                return lambda: self._unregister(callback_id)
+
+        _invoke(callback)
+        return lambda: None
+
+    def raise_if_cancelled(self) -> None:
+        """Raises ExecutionCancelledError if the token has been cancelled."""
+        if self._event.is_set():
+            raise ExecutionCancelledError("The execution has been cancelled.")
+
+    def wait(self, timeout: t.Optional[float] = None) -> bool:
+        """Blocks until the token is cancelled or the timeout expires.
+
+        Returns:
+            True if the token has been cancelled, False otherwise.
+        """
+        return self._event.wait(timeout)
+
+    def _unregister(self, callback_id: int) -> None:
+        with self._lock:
+            self._callbacks.pop(callback_id, None)
+
+
+def _invoke(callback: t.Callable[[], None]) -> None:
+    try:
+        callback()
+    except Exception:
+        logger.exception("Cancellation callback failed")
@@ -1,19 +1,22 @@
+from __future__ import annotations
+
 import typing as t
 from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from threading import Lock
 
-from sqlmesh.core.snapshot import SnapshotId, SnapshotInfoLike
+from sqlmesh.utils.cancellation import CancellationToken
 from sqlmesh.utils.dag import DAG
-from sqlmesh.utils.errors import ConfigError, SQLMeshError
-
-H = t.TypeVar("H", bound=t.Hashable)
-S = t.TypeVar("S", bound=SnapshotInfoLike)
+from sqlmesh.utils.errors import (
+    ConfigError,
+    ExecutionCancelledError,
+    NodeExecutionFailedError,
+)
 
+if t.TYPE_CHECKING:
+    from sqlmesh.core.snapshot import SnapshotId, SnapshotInfoLike
 
-class NodeExecutionFailedError(t.Generic[H], SQLMeshError):
-    def __init__(self, node: H):
-        self.node = node
-        super().__init__(f"Execution failed for node {node}")
+H = t.TypeVar("H", bound=t.Hashable)
+S = t.TypeVar("S", bound="SnapshotInfoLike")
 
 
 class ConcurrentDAGExecutor(t.Generic[H]):
@@ -21,6 +24,9 @@ class ConcurrentDAGExecutor(t.Generic[H]):
 
     If `raise_on_error` is set to False maintains a state of execution errors as well as of skipped nodes.
 
+    Once the cancellation token is cancelled no new nodes are started and all pending nodes are marked as
+    skipped. Interrupting the executor (e.g. with Ctrl-C) cancels the token as well.
+
     Args:
         dag: The target DAG.
         fn: The function that will be applied concurrently to each snapshot.
@@ -28,6 +34,7 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        cancellation_token: The token used to cancel the execution.
     """
 
     def __init__(
@@ -36,11 +43,13 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         fn: t.Callable[[H], None],
         tasks_num: int,
         raise_on_error: bool,
+        cancellation_token: t.Optional[CancellationToken] = None,
     ):
         self.dag = dag
         self.fn = fn
         self.tasks_num = tasks_num
         self.raise_on_error = raise_on_error
+        self.cancellation_token = cancellation_token
 
         self._init_state()
 
@@ -49,6 +58,7 @@ class ConcurrentDAGExecutor(t.Generic[H]):
 
         Raises:
             NodeExecutionFailedError if `raise_on_error` was set to True and execution fails for any snapshot.
+            ExecutionCancelledError if `raise_on_error` was set to True and the execution was cancelled.
 
         Returns:
             A pair which contains a list of node errors and a list of skipped nodes.
@@ -59,10 +69,23 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         with ThreadPoolExecutor(max_workers=self.tasks_num) as pool:
             with self._unprocessed_nodes_lock:
                 self._submit_next_nodes(pool)
-            self._finished_future.result()
+            try:
+                self._finished_future.result()
+            except KeyboardInterrupt:
+                # Interrupt the nodes that are in flight and skip the pending ones, otherwise
+                # shutting down the pool would wait for the whole DAG to be processed.
+                self._cancellation_token.cancel()
+                raise
         return self._node_errors, self._skipped_nodes
 
     def _process_node(self, node: H, executor: Executor) -> None:
+        if self._cancellation_token.is_cancelled:
+            with self._unprocessed_nodes_lock:
+                self._unprocessed_nodes_num -= 1
+                self._skipped_nodes.append(node)
+                self._skip_pending_nodes()
+            return
+
         try:
             self.fn(node)
 
@@ -81,10 +104,16 @@ class ConcurrentDAGExecutor(t.Generic[H]):
                 self._unprocessed_nodes_num -= 1
                 self._node_errors.append(error)
                 self._skip_next_nodes(node)
+                if self._cancellation_token.is_cancelled:
+                    self._skip_pending_nodes()
 
     def _submit_next_nodes(self, executor: Executor, processed_node: t.Optional[H] = None) -> None:
         if not self._unprocessed_nodes_num:
-            self._finished_future.set_result(None)
+            self._finish()
+            return
+
+        if self._cancellation_token.is_cancelled:
+            self._skip_pending_nodes()
             return
 
         submitted_nodes = []
@@ -100,7 +129,7 @@ class ConcurrentDAGExecutor(t.Generic[H]):
 
     def _skip_next_nodes(self, parent: H) -> None:
         if not self._unprocessed_nodes_num:
-            self._finished_future.set_result(None)
+            self._finish()
             return
 
         skipped_nodes = [node for node, deps in self._unprocessed_nodes.items() if parent in deps]
@@ -112,11 +141,31 @@ class ConcurrentDAGExecutor(t.Generic[H]):
             self._unprocessed_nodes.pop(skipped_node)
             self._skip_next_nodes(skipped_node)
 
+    def _skip_pending_nodes(self) -> None:
+        self._skipped_nodes.extend(self._unprocessed_nodes)
+        self._unprocessed_nodes_num -= len(self._unprocessed_nodes)
+        self._unprocessed_nodes.clear()
+
+        if not self._unprocessed_nodes_num:
+            self._finish()
+
+    def _finish(self) -> None:
+        if self._finished_future.done():
+            return
+
+        if self.raise_on_error and self._skipped_nodes and self._cancellation_token.is_cancelled:
+            self._finished_future.set_exception(
+                ExecutionCancelledError("The execution has been cancelled.")
+            )
+        else:
+            self._finished_future.set_result(None)
+
     def _init_state(self) -> None:
         self._unprocessed_nodes = self.dag.graph
         self._unprocessed_nodes_num = len(self._unprocessed_nodes)
         self._unprocessed_nodes_lock = Lock()
         self._finished_future = Future()  # type: ignore
+        self._cancellation_token = self.cancellation_token or CancellationToken()
 
         self._node_errors: t.List[NodeExecutionFailedError[H]] = []
         self._skipped_nodes: t.List[H] = []
@@ -128,6 +177,7 @@ def concurrent_apply_to_snapshots(
     tasks_num: int,
     reverse_order: bool = False,
     raise_on_error: bool = True,
+    cancellation_token: t.Optional[CancellationToken] = None,
 ) -> t.Tuple[t.List[NodeExecutionFailedError[SnapshotId]], t.List[SnapshotId]]:
     """Applies a function to the given collection of snapshots concurrently while
     preserving the topological order between snapshots.
@@ -140,16 +190,19 @@ def concurrent_apply_to_snapshots(
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        cancellation_token: The token used to cancel the execution. Pending nodes are skipped once
+            it has been cancelled.
 
     Raises:
         NodeExecutionFailedError if `raise_on_error` is set to True and execution fails for any snapshot.
+        ExecutionCancelledError if `raise_on_error` is set to True and the execution was cancelled.
 
     Returns:
         A pair which contains a list of errors and a list of skipped snapshot IDs.
     """
     snapshots_by_id = {s.snapshot_id: s for s in snapshots}
 
-    dag: DAG[SnapshotId] = DAG[SnapshotId]()
+    dag: DAG[SnapshotId] = DAG()
     for snapshot in snapshots:
         dag.add(
             snapshot.snapshot_id,
@@ -161,6 +214,7 @@ def concurrent_apply_to_snapshots(
         lambda s_id: fn(snapshots_by_id[s_id]),
         tasks_num,
         raise_on_error=raise_on_error,
+        cancellation_token=cancellation_token,
     )
 
 
@@ -169,6 +223,7 @@ def concurrent_apply_to_dag(
     fn: t.Callable[[H], None],
     tasks_num: int,
     raise_on_error: bool = True,
+    cancellation_token: t.Optional[CancellationToken] = None,
 ) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
     """Applies a function to the given DAG concurrently while preserving the topological
     order between snapshots.
@@ -180,9 +235,12 @@ def concurrent_apply_to_dag(
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        cancellation_token: The token used to cancel the execution. Pending nodes are skipped once
+            it has been cancelled.
 
     Raises:
         NodeExecutionFailedError if `raise_on_error` is set to True and execution fails for any snapshot.
+        ExecutionCancelledError if `raise_on_error` is set to True and the execution was cancelled.
 
     Returns:
         A pair which contains a list of node errors and a list of skipped nodes.
@@ -191,13 +249,14 @@ def concurrent_apply_to_dag(
         raise ConfigError(f"Invalid number of concurrent tasks {tasks_num}")
 
     if tasks_num == 1:
-        return sequential_apply_to_dag(dag, fn, raise_on_error)
+        return sequential_apply_to_dag(dag, fn, raise_on_error, cancellation_token)
 
     return ConcurrentDAGExecutor(
         dag,
         fn,
         tasks_num,
         raise_on_error,
+        cancellation_token=cancellation_token,
     ).run()
 
 
@@ -205,6 +264,7 @@ def sequential_apply_to_dag(
     dag: DAG[H],
     fn: t.Callable[[H], None],
     raise_on_error: bool = True,
+    cancellation_token: t.Optional[CancellationToken] = None,
 ) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
     dependencies = dag.graph
 
@@ -214,6 +274,12 @@ def sequential_apply_to_dag(
     failed_or_skipped_nodes: t.Set[H] = set()
 
     for node in dag.sorted():
+        if cancellation_token and cancellation_token.is_cancelled:
+            if raise_on_error:
+                cancellation_token.raise_if_cancelled()
+            skipped_nodes.append(node)
+            continue
+
         if not failed_or_skipped_nodes.isdisjoint(dependencies[node]):
             skipped_nodes.append(node)
             failed_or_skipped_nodes.add(node)
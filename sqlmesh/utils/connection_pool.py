@@ -1,7 +1,12 @@
 import abc
 import logging
+import time
 import typing as t
-from threading import Lock, get_ident
+from threading import Condition, Lock
+from threading import enumerate as enumerate_threads
+from threading import get_ident
+
+from sqlmesh.utils.errors import ConnectionPoolTimeoutError
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +69,27 @@ class ConnectionPool(abc.ABC):
                 with the calling thread.
         """
 
+    def release_all(self, exclude_calling_thread: bool = False) -> None:
+        """Releases all connections held by threads so that they can no longer be used by these threads.
+
+        Pools which don't support connection reuse close connections instead.
+
+        Args:
+            exclude_calling_thread: If set to True excludes the connection associated with the calling thread.
+        """
+        self.close_all(exclude_calling_thread=exclude_calling_thread)
+
+    def release(self, failed: bool = False) -> None:
+        """Returns the connection held by the calling thread back into the pool so that other threads can use it.
+
+        The connection stays with the calling thread while it's part of an active transaction. Pools which don't
+        share connections between threads keep the connection as is.
+
+        Args:
+            failed: Whether a statement executed with this connection has failed, in which case the connection
+                is health checked before it's reused.
+        """
+
 
 class _TransactionManagementMixin(ConnectionPool):
     def _do_begin(self) -> None:
@@ -164,6 +190,248 @@ class ThreadLocalConnectionPool(_TransactionManagementMixin):
             self._thread_transactions.discard(thread_id)
 
 
+class _PooledConnection:
+    def __init__(self, connection: t.Any):
+        self.connection = connection
+        self.cursor: t.Optional[t.Any] = None
+        self.last_used_at = time.monotonic()
+        self.needs_health_check = False
+
+    def close_cursor(self) -> None:
+        _try_close(self.cursor, "cursor")
+        self.cursor = None
+
+    def close(self) -> None:
+        _try_close(self.connection, "connection")
+        self.cursor = None
+
+
+class BoundedConnectionPool(_TransactionManagementMixin):
+    """A connection pool which shares a bounded number of connections between threads.
+
+    A thread checks out a connection the first time it needs one and keeps using it until the connection is
+    released back into the pool (see `release` and `release_all`). Released connections are reused by other
+    threads, which avoids paying the connection setup cost for every statement. A connection that is part of
+    an active transaction stays pinned to its thread until the transaction completes.
+
+    When all connections are checked out, connections held by threads that are no longer alive are reclaimed.
+    If there are none, the calling thread blocks until another connection is released or until the checkout
+    timeout expires.
+
+    Args:
+        connection_factory: A callable which produces a new connection on every call.
+        max_connections: The maximum number of open connections. Unbounded if not set.
+        idle_timeout: The number of seconds after which an idle connection is closed instead of being reused.
+        health_check: A callable which returns True if an idle connection is still usable. It is invoked
+            before an idle connection is handed out to a thread if the connection has been idle for longer than
+            `health_check_interval` or if a statement executed with it has failed.
+        health_check_interval: The number of seconds a connection can stay idle before it's health checked.
+        checkout_timeout: The maximum number of seconds a thread waits for a connection to become available.
+            Waits indefinitely if not set.
+    """
+
+    def __init__(
+        self,
+        connection_factory: t.Callable[[], t.Any],
+        max_connections: t.Optional[int] = None,
+        idle_timeout: t.Optional[float] = 600.0,
+        health_check: t.Optional[t.Callable[[t.Any], bool]] = None,
+        health_check_interval: float = 60.0,
+        checkout_timeout: t.Optional[float] = 300.0,
+    ):
+        if max_connections is not None and max_connections <= 0:
+            raise ValueError(f"Invalid maximum number of connections {max_connections}")
+        self._connection_factory = connection_factory
+        self._max_connections = max_connections
+        self._idle_timeout = idle_timeout
+        self._health_check = health_check or _is_connection_alive
+        self._health_check_interval = health_check_interval
+        self._checkout_timeout = checkout_timeout
+        self._idle_connections: t.List[_PooledConnection] = []
+        self._thread_connections: t.Dict[t.Hashable, _PooledConnection] = {}
+        self._thread_transactions: t.Set[t.Hashable] = set()
+        self._pending_connections = 0
+        self._condition = Condition()
+
+    @property
+    def size(self) -> int:
+        """The number of open connections, both idle and checked out."""
+        with self._condition:
+            return len(self._idle_connections) + len(self._thread_connections)
+
+    def get_cursor(self) -> t.Any:
+        pooled = self._checkout()
+        if pooled.cursor is None:
+            pooled.cursor = pooled.connection.cursor()
+        return pooled.cursor
+
+    def get(self) -> t.Any:
+        return self._checkout().connection
+
+    def begin(self) -> None:
+        self._do_begin()
+        with self._condition:
+            self._thread_transactions.add(get_ident())
+
+    def commit(self) -> None:
+        self._do_commit()
+        self._discard_transaction(get_ident())
+
+    def rollback(self) -> None:
+        self._do_rollback()
+        self._discard_transaction(get_ident())
+
+    @property
+    def is_transaction_active(self) -> bool:
+        with self._condition:
+            return get_ident() in self._thread_transactions
+
+    def close_cursor(self) -> None:
+        with self._condition:
+            pooled = self._thread_connections.get(get_ident())
+        if pooled is not None:
+            pooled.close_cursor()
+
+    def close(self) -> None:
+        with self._condition:
+            pooled = self._pop_thread_connection(get_ident())
+            self._condition.notify()
+        if pooled is not None:
+            pooled.close()
+
+    def close_all(self, exclude_calling_thread: bool = False) -> None:
+        calling_thread_id = get_ident()
+        with self._condition:
+            to_close = self._idle_connections
+            self._idle_connections = []
+            for thread_id in list(self._thread_connections):
+                if not exclude_calling_thread or thread_id != calling_thread_id:
+                    pooled = self._pop_thread_connection(thread_id)
+                    if pooled is not None:
+                        to_close.append(pooled)
+            self._condition.notify_all()
+        for pooled in to_close:
+            pooled.close()
+
+    def release_all(self, exclude_calling_thread: bool = False) -> None:
+        calling_thread_id = get_ident()
+        with self._condition:
+            for thread_id in list(self._thread_connections):
+                if thread_id in self._thread_transactions:
+                    continue
+                if not exclude_calling_thread or thread_id != calling_thread_id:
+                    self._release_thread_connection(thread_id)
+            self._condition.notify_all()
+
+    def release(self, failed: bool = False) -> None:
+        thread_id = get_ident()
+        with self._condition:
+            if thread_id not in self._thread_transactions:
+                self._release_thread_connection(thread_id, failed=failed)
+                self._condition.notify()
+
+    def _checkout(self) -> _PooledConnection:
+        thread_id = get_ident()
+        with self._condition:
+            pooled = self._thread_connections.get(thread_id)
+            if pooled is not None:
+                return pooled
+
+        deadline = (
+            time.monotonic() + self._checkout_timeout
+            if self._checkout_timeout is not None
+            else None
+        )
+        while True:
+            with self._condition:
+                candidate = self._idle_connections.pop() if self._idle_connections else None
+                if candidate is None and self._is_full:
+                    if not self._reclaim_dead_threads():
+                        remaining = deadline - time.monotonic() if deadline is not None else None
+                        if remaining is not None and remaining <= 0:
+                            raise ConnectionPoolTimeoutError(
+                                f"Timed out after {self._checkout_timeout:.1f} seconds waiting for one of "
+                                f"{self._max_connections} connections to become available."
+                            )
+                        # Wake up periodically to reclaim connections of threads that are no longer alive.
+                        self._condition.wait(
+                            timeout=min(remaining, 1.0) if remaining is not None else 1.0
+                        )
+                    continue
+                # Reserve a slot while the connection is checked or opened outside the lock.
+                self._pending_connections += 1
+
+            # Health checks and opening new connections are slow, so they happen outside the lock.
+            pooled = None
+            try:
+                if candidate is None:
+                    pooled = _PooledConnection(self._connection_factory())
+                elif self._is_usable(candidate):
+                    pooled = candidate
+                else:
+                    logger.debug("Discarding a stale connection")
+                    candidate.close()
+            finally:
+                with self._condition:
+                    self._pending_connections -= 1
+                    if pooled is not None:
+                        self._thread_connections[thread_id] = pooled
+                    else:
+                        self._condition.notify()
+            if pooled is not None:
+                return pooled
+
+    def _is_usable(self, pooled: _PooledConnection) -> bool:
+        idle_time = time.monotonic() - pooled.last_used_at
+        if self._idle_timeout is not None and idle_time > self._idle_timeout:
+            return False
+        # Checking every reused connection would cost an extra round trip per statement.
+        if pooled.needs_health_check or idle_time > self._health_check_interval:
+            return self._health_check(pooled.connection)
+        return True
+
+    @property
+    def _is_full(self) -> bool:
+        return (
+            self._max_connections is not None
+            and len(self._idle_connections)
+            + len(self._thread_connections)
+            + self._pending_connections
+            >= self._max_connections
+        )
+
+    def _reclaim_dead_threads(self) -> bool:
+        alive_thread_ids = {thread.ident for thread in enumerate_threads()}
+        dead_thread_ids = [
+            thread_id for thread_id in self._thread_connections if thread_id not in alive_thread_ids
+        ]
+        for thread_id in dead_thread_ids:
+            if thread_id in self._thread_transactions:
+                # The transaction can't be completed by a thread that is gone.
+                pooled = self._pop_thread_connection(thread_id)
+                if pooled is not None:
+                    pooled.close()
+            else:
+                # The thread may have died in the middle of a statement.
+                self._release_thread_connection(thread_id, failed=True)
+        return bool(dead_thread_ids)
+
+    def _release_thread_connection(self, thread_id: t.Hashable, failed: bool = False) -> None:
+        pooled = self._pop_thread_connection(thread_id)
+        if pooled is not None:
+            pooled.last_used_at = time.monotonic()
+            pooled.needs_health_check = failed
+            self._idle_connections.append(pooled)
+
+    def _pop_thread_connection(self, thread_id: t.Hashable) -> t.Optional[_PooledConnection]:
+        self._thread_transactions.discard(thread_id)
+        return self._thread_connections.pop(thread_id, None)
+
+    def _discard_transaction(self, thread_id: t.Hashable) -> None:
+        with self._condition:
+            self._thread_transactions.discard(thread_id)
+
+
 class SingletonConnectionPool(_TransactionManagementMixin):
     def __init__(self, connection_factory: t.Callable[[], t.Any]):
         self._connection_factory = connection_factory
@@ -213,10 +481,12 @@ class SingletonConnectionPool(_TransactionManagementMixin):
 
 
 def create_connection_pool(
-    connection_factory: t.Callable[[], t.Any], multithreaded: bool
+    connection_factory: t.Callable[[], t.Any],
+    multithreaded: bool,
+    max_connections: t.Optional[int] = None,
 ) -> ConnectionPool:
     return (
-        ThreadLocalConnectionPool(connection_factory)
+        BoundedConnectionPool(connection_factory, max_connections=max_connections)
         if multithreaded
         else SingletonConnectionPool(connection_factory)
     )
@@ -229,3 +499,17 @@ def _try_close(closeable: t.Any, kind: str) -> None:
         closeable.close()
     except Exception:
         logger.exception("Failed to close %s", kind)
+
+
+def _is_connection_alive(connection: t.Any) -> bool:
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        return True
+    except Exception:
+        return False
+    finally:
+        if cursor is not None:
+            _try_close(cursor, "cursor")
@@ -10,7 +10,6 @@ warnings.filterwarnings(
 )
 from datetime import date, datetime, timedelta, timezone
 
-import dateparser
 from sqlglot import exp
 
 UTC = timezone.utc
@@ -123,6 +122,9 @@ def to_datetime(value: TimeLike, relative_base: t.Optional[datetime] = None) ->
             epoch = None
 
         if epoch is None:
+            # Importing dateparser is slow, so it's deferred until a relative date needs to be parsed.
+            import dateparser
+
             dt = dateparser.parse(str(value), settings={"RELATIVE_BASE": relative_base or now()})
         else:
             try:
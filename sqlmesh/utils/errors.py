@@ -6,6 +6,8 @@ from pathlib import Path
 
 from sqlglot.helper import AutoName
 
+H = t.TypeVar("H", bound=t.Hashable)
+
 
 class ErrorLevel(AutoName):
     IGNORE = auto()
@@ -53,6 +55,24 @@ class AuditError(SQLMeshError):
     pass
 
 
+class ExecutionCancelledError(SQLMeshError):
+    pass
+
+
+class NodeExecutionFailedError(t.Generic[H], SQLMeshError):
+    def __init__(self, node: H):
+        self.node = node
+        super().__init__(f"Execution failed for node {node}")
+
+
+class QueryTimeoutError(SQLMeshError):
+    pass
+
+
+class ConnectionPoolTimeoutError(SQLMeshError):
+    pass
+
+
 class NotificationTargetError(SQLMeshError):
     pass
 
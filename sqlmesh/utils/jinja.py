@@ -3,20 +3,81 @@ from __future__ import annotations
 import importlib
 import typing as t
 from collections import defaultdict
+from types import CodeType
 
 from jinja2 import Environment, Template, nodes
 from pydantic import validator
 from sqlglot import Dialect, Parser, TokenType
 
-from sqlmesh.utils import AttributeDict
+from sqlmesh.utils import AttributeDict, LRUCache
 from sqlmesh.utils.pydantic import PydanticModel
 
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+"""The maximum number of compiled Jinja templates cached per process."""
+
+_compiled_templates: LRUCache[t.Tuple[t.Hashable, str], CodeType] = LRUCache(
+    maxsize=COMPILED_TEMPLATE_CACHE_SIZE
+)
+_macro_templates: LRUCache[t.Tuple[t.Optional[str], str, str], Template] = LRUCache(
+    maxsize=COMPILED_TEMPLATE_CACHE_SIZE
+)
+
+
+class _CachingEnvironment(Environment):
+    """A Jinja environment which shares compiled templates with all environments of the same configuration.
+
+    New environments are built for every render, so without this templates would be compiled from scratch
+    each time.
+    """
+
+    def from_string(
+        self,
+        source: t.Union[str, nodes.Template],
+        globals: t.Optional[t.MutableMapping[str, t.Any]] = None,
+        template_class: t.Optional[t.Type[Template]] = None,
+    ) -> Template:
+        if not isinstance(source, str):
+            return super().from_string(source, globals=globals, template_class=template_class)
+
+        cache_key = (self._compile_options(), source)
+        code = _compiled_templates.get(cache_key)
+        if code is None:
+            code = t.cast(CodeType, self.compile(source))
+            _compiled_templates[cache_key] = code
+
+        cls = template_class or self.template_class
+        return cls.from_code(self, code, self.make_globals(globals), None)
+
+    def _compile_options(self) -> t.Hashable:
+        """Returns all options which affect the code generated for a template."""
+        return (
+            self.block_start_string,
+            self.block_end_string,
+            self.variable_start_string,
+            self.variable_end_string,
+            self.comment_start_string,
+            self.comment_end_string,
+            self.line_statement_prefix,
+            self.line_comment_prefix,
+            self.trim_blocks,
+            self.lstrip_blocks,
+            self.newline_sequence,
+            self.keep_trailing_newline,
+            self.optimized,
+            self.is_async,
+            self.autoescape if isinstance(self.autoescape, bool) else id(self.autoescape),
+            id(self.finalize) if self.finalize else None,
+            frozenset(self.extensions),
+            frozenset(self.filters),
+            frozenset(self.tests),
+        )
+
 
 def environment(**kwargs: t.Any) -> Environment:
     extensions = kwargs.pop("extensions", [])
     extensions.append("jinja2.ext.do")
     extensions.append("jinja2.ext.loopcontrols")
-    return Environment(extensions=extensions, **kwargs)
+    return _CachingEnvironment(extensions=extensions, **kwargs)
 
 
 ENVIRONMENT = environment()
@@ -48,6 +109,21 @@ class MacroReturnVal(Exception):
         self.value = val
 
 
+class _LazyMacroCallable:
+    """A macro callable which is only built once it's called for the first time."""
+
+    __slots__ = ("_factory", "_callable")
+
+    def __init__(self, factory: t.Callable[[], t.Callable]):
+        self._factory = factory
+        self._callable: t.Optional[t.Callable] = None
+
+    def __call__(self, *args: t.Any, **kwargs: t.Any) -> t.Any:
+        if self._callable is None:
+            self._callable = self._factory()
+        return self._callable(*args, **kwargs)
+
+
 def macro_return(macro: t.Callable) -> t.Callable:
     """Decorator to pass data back to the caller"""
 
@@ -121,6 +197,15 @@ def call_name(node: nodes.Expr) -> t.Tuple[str, ...]:
     return ()
 
 
+JINJA_DELIMITERS = ("{{", "{%", "{#")
+
+
+def has_jinja(value: str) -> bool:
+    """Returns True if rendering the given string with Jinja could change it."""
+    # Jinja strips a single trailing newline from the rendered templates.
+    return value.endswith("\n") or any(delimiter in value for delimiter in JINJA_DELIMITERS)
+
+
 def render_jinja(query: str, methods: t.Optional[t.Dict[str, t.Any]] = None) -> str:
     return ENVIRONMENT.from_string(query).render(methods or {})
 
@@ -179,9 +264,6 @@ class JinjaMacroRegistry(PydanticModel):
     global_objs: t.Dict[str, JinjaGlobalAttribute] = {}
     create_builtins_module: t.Optional[str] = None
 
-    _parser_cache: t.Dict[t.Tuple[t.Optional[str], str], Template] = {}
-    __environment: t.Optional[Environment] = None
-
     @validator("global_objs", pre=True)
     def _validate_attribute_dict(cls, value: t.Any) -> t.Any:
         def _attribute_dict(val: t.Dict[str, t.Any]) -> AttributeDict:
@@ -235,18 +317,24 @@ class JinjaMacroRegistry(PydanticModel):
 
         callable_cache: t.Dict[t.Tuple[t.Optional[str], str], t.Callable] = {}
 
+        def _lazy_callable(name: str, package: t.Optional[str]) -> _LazyMacroCallable:
+            return _LazyMacroCallable(
+                lambda: self._make_callable(name, package, callable_cache, global_vars)
+            )
+
+        # Most renders only use a few of the available macros, so callables are only built once they're called.
         root_macros = {
-            name: self._make_callable(name, None, callable_cache, global_vars)
-            for name, macro in self.root_macros.items()
+            name: _lazy_callable(name, None)
+            for name in self.root_macros
             if not _is_private_macro(name)
         }
 
         package_macros: t.Dict[str, t.Any] = defaultdict(AttributeDict)
         for package_name, macros in self.packages.items():
-            for macro_name, macro in macros.items():
+            for macro_name in macros:
                 if not _is_private_macro(macro_name):
-                    package_macros[package_name][macro_name] = self._make_callable(
-                        macro_name, package_name, callable_cache, global_vars
+                    package_macros[package_name][macro_name] = _lazy_callable(
+                        macro_name, package_name
                     )
 
         env = environment()
@@ -354,24 +442,24 @@ class JinjaMacroRegistry(PydanticModel):
         return macro_callable
 
     def _parse_macro(self, name: str, package: t.Optional[str]) -> Template:
-        cache_key = (package, name)
-        if cache_key not in self._parser_cache:
-            macro = self._get_macro(name, package)
-
+        macro = self._get_macro(name, package)
+        # Macro templates don't depend on the registry they belong to, so they are shared by all registries
+        # with the same builtins.
+        cache_key = (self.create_builtins_module, name, macro.definition)
+        template = _macro_templates.get(cache_key)
+        if template is None:
             definition: t.Union[str, nodes.Template] = macro.definition
             if _is_private_macro(name):
                 # A workaround to expose private jinja macros.
                 definition = self._to_non_private_macro_def(name, macro.definition)
 
-            self._parser_cache[cache_key] = self._environment.from_string(definition)
-        return self._parser_cache[cache_key]
+            template = self._environment.from_string(definition)
+            _macro_templates[cache_key] = template
+        return template
 
     @property
     def _environment(self) -> Environment:
-        if self.__environment is None:
-            self.__environment = environment()
-            self.__environment.filters.update(self._create_builtin_filters())
-        return self.__environment
+        return _builtins_environment(self.create_builtins_module)
 
     def _trim_macros(self, names: t.Set[str], package: t.Optional[str]) -> JinjaMacroRegistry:
         macros = self.packages.get(package, {}) if package is not None else self.root_macros
@@ -427,13 +515,27 @@ class JinjaMacroRegistry(PydanticModel):
                 return module.create_builtin_globals(self, global_vars, engine_adapter)
         return global_vars
 
-    def _create_builtin_filters(self) -> t.Dict[str, t.Any]:
-        """Creates Jinja builtin filters using a factory function defined in the provided module."""
-        if self.create_builtins_module is not None:
-            module = importlib.import_module(self.create_builtins_module)
-            if hasattr(module, "create_builtin_filters"):
-                return module.create_builtin_filters()
-        return {}
+
+_builtins_environments: t.Dict[t.Optional[str], Environment] = {}
+
+
+def _builtins_environment(create_builtins_module: t.Optional[str]) -> Environment:
+    """Returns the environment with the builtin filters defined in the given module."""
+    env = _builtins_environments.get(create_builtins_module)
+    if env is None:
+        env = environment()
+        env.filters.update(_create_builtin_filters(create_builtins_module))
+        _builtins_environments[create_builtins_module] = env
+    return env
+
+
+def _create_builtin_filters(create_builtins_module: t.Optional[str]) -> t.Dict[str, t.Any]:
+    """Creates Jinja builtin filters using a factory function defined in the provided module."""
+    if create_builtins_module is not None:
+        module = importlib.import_module(create_builtins_module)
+        if hasattr(module, "create_builtin_filters"):
+            return module.create_builtin_filters()
+    return {}
 
 
 def _is_private_macro(name: str) -> bool:
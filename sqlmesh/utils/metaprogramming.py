@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ast
 import dis
+import hashlib
 import importlib
 import inspect
 import linecache
@@ -16,7 +17,7 @@ from pathlib import Path
 
 from astor import to_source
 
-from sqlmesh.utils import format_exception, unique
+from sqlmesh.utils import LRUCache, format_exception, unique
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
 
@@ -380,6 +381,10 @@ def prepare_env(
     The Python ENV is stored in a json serializable format.
     Functions and imports are stored as a special data class.
 
+    The code of the python env is compiled once per process and cached by the content of the python env.
+    It is still executed in the given environment on every call, so functions use that environment as their
+    globals and no state is shared between prepared environments.
+
     Args:
         python_env: The dictionary containing the serialized python environment.
         env: The dictionary to execute code in.
@@ -389,18 +394,56 @@ def prepare_env(
     """
     env = {} if env is None else env
 
-    for name, executable in sorted(
-        python_env.items(), key=lambda item: 0 if item[1].is_import else 1
-    ):
-        if executable.is_value:
+    for name, executable, code in _compile_env(python_env):
+        if code is None:
             env[name] = ast.literal_eval(executable.payload)
         else:
-            exec(executable.payload, env)
+            exec(code, env)
             if executable.alias and executable.name:
                 env[executable.alias] = env[executable.name]
     return env
 
 
+COMPILED_ENV_CACHE_SIZE = 512
+"""The maximum number of compiled python environments cached per process."""
+
+_CompiledEnv = t.List[t.Tuple[str, Executable, t.Optional[types.CodeType]]]
+
+_compiled_envs: LRUCache[str, _CompiledEnv] = LRUCache(maxsize=COMPILED_ENV_CACHE_SIZE)
+
+
+def _compile_env(python_env: t.Dict[str, Executable]) -> _CompiledEnv:
+    key = _python_env_hash(python_env)
+    compiled = _compiled_envs.get(key)
+    if compiled is None:
+        compiled = _compiled_envs[key] = [
+            (
+                name,
+                executable,
+                None if executable.is_value else compile(executable.payload, "<string>", "exec"),
+            )
+            for name, executable in sorted(
+                python_env.items(), key=lambda item: 0 if item[1].is_import else 1
+            )
+        ]
+    return compiled
+
+
+def _python_env_hash(python_env: t.Dict[str, Executable]) -> str:
+    digest = hashlib.sha256()
+    for name, executable in sorted(python_env.items()):
+        for part in (
+            name,
+            executable.kind.value,
+            executable.name,
+            executable.alias,
+            executable.payload,
+        ):
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
 def print_exception(
     exception: Exception,
     python_env: t.Dict[str, Executable],
@@ -0,0 +1,260 @@
+"""
+# Tracing
+
+Lightweight instrumentation of the time spent in SQLMesh operations such as statement execution, snapshot
+evaluation and state sync calls.
+
+Instrumented code opens spans using the module-level `tracer`. A span records the operation name, arbitrary
+attributes (e.g. the snapshot, the interval or the hash of the executed SQL) and its duration. Finished spans
+are emitted to all registered sinks. When no sinks are registered tracing is disabled and opening a span is
+a no-op.
+
+```python
+from sqlmesh.utils.tracing import InMemoryTraceSink, tracer
+
+sink = InMemoryTraceSink()
+tracer.add_sink(sink)
+context.run()
+tracer.remove_sink(sink)
+
+for span in sink.spans:
+    print(span.name, span.duration_ms)
+```
+"""
+from __future__ import annotations
+
+import abc
+import json
+import logging
+import threading
+import time
+import typing as t
+from functools import wraps
+from pathlib import Path
+
+from sqlmesh.utils import random_id
+
+logger = logging.getLogger(__name__)
+
+F = t.TypeVar("F", bound=t.Callable[..., t.Any])
+
+
+class Span:
+    """A single timed operation.
+
+    Args:
+        name: The name of the operation.
+        attributes: Additional attributes that describe the operation.
+        parent_id: The ID of the enclosing span opened by the same thread, if any.
+    """
+
+    __slots__ = ("span_id", "parent_id", "name", "attributes", "started_at", "duration_ms", "error")
+
+    def __init__(
+        self,
+        name: str,
+        attributes: t.Dict[str, t.Any],
+        parent_id: t.Optional[str] = None,
+    ):
+        self.span_id = random_id()
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.started_at = time.time()
+        self.duration_ms: t.Optional[float] = None
+        self.error: t.Optional[str] = None
+
+    def set(self, key: str, value: t.Any) -> None:
+        """Sets an attribute of this span."""
+        self.attributes[key] = value
+
+    def dict(self) -> t.Dict[str, t.Any]:
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            **self.attributes,
+        }
+
+
+class TraceSink(abc.ABC):
+    """Receives finished spans."""
+
+    @abc.abstractmethod
+    def emit(self, span: Span) -> None:
+        """Emits a finished span."""
+
+    def close(self) -> None:
+        """Releases resources associated with this sink."""
+
+
+class InMemoryTraceSink(TraceSink):
+    """Collects spans in memory. Useful for tests."""
+
+    def __init__(self) -> None:
+        self.spans: t.List[Span] = []
+        self._lock = threading.Lock()
+
+    def emit(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def by_name(self, name: str) -> t.List[Span]:
+        """Returns all collected spans with the given name."""
+        with self._lock:
+            return [span for span in self.spans if span.name == name]
+
+
+class LoggingTraceSink(TraceSink):
+    """Writes spans to a logger.
+
+    Args:
+        logger: The target logger. Defaults to the logger of this module.
+        level: The level at which spans are logged.
+    """
+
+    def __init__(self, logger: logging.Logger = logger, level: int = logging.INFO):
+        self.logger = logger
+        self.level = level
+
+    def emit(self, span: Span) -> None:
+        attributes = " ".join(f"{k}={v}" for k, v in span.attributes.items())
+        self.logger.log(
+            self.level, "%s took %.2f ms %s", span.name, span.duration_ms or 0.0, attributes
+        )
+
+
+class JsonlTraceSink(TraceSink):
+    """Appends spans to a file, one JSON object per line.
+
+    Args:
+        path: The path to the target file.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file: t.Optional[t.TextIO] = None
+        self._lock = threading.Lock()
+
+    def emit(self, span: Span) -> None:
+        line = json.dumps(span.dict(), default=str)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class _NoopSpanContext:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args: t.Any) -> None:
+        return None
+
+
+_NOOP_SPAN_CONTEXT = _NoopSpanContext()
+
+
+class _SpanContext:
+    def __init__(self, tracer: Tracer, name: str, attributes: t.Dict[str, t.Any]):
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._span: t.Optional[Span] = None
+        self._start = 0.0
+
+    def __enter__(self) -> Span:
+        stack = self._tracer._stack()
+        self._span = Span(self._name, self._attributes, stack[-1].span_id if stack else None)
+        stack.append(self._span)
+        self._start = time.perf_counter()
+        return self._span
+
+    def __exit__(self, exc_type: t.Any, exc_value: t.Any, traceback: t.Any) -> None:
+        assert self._span is not None
+        self._span.duration_ms = (time.perf_counter() - self._start) * 1000
+        if exc_value is not None:
+            self._span.error = repr(exc_value)
+        self._tracer._stack().pop()
+        self._tracer._emit(self._span)
+
+
+class Tracer:
+    """Creates spans and dispatches them to the registered sinks."""
+
+    def __init__(self) -> None:
+        self._sinks: t.List[TraceSink] = []
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._sinks)
+
+    def add_sink(self, sink: TraceSink) -> None:
+        self._sinks = [*self._sinks, sink]
+
+    def remove_sink(self, sink: TraceSink) -> None:
+        self._sinks = [s for s in self._sinks if s is not sink]
+        sink.close()
+
+    def clear(self) -> None:
+        """Removes and closes all registered sinks."""
+        sinks, self._sinks = self._sinks, []
+        for sink in sinks:
+            sink.close()
+
+    def span(self, name: str, **attributes: t.Any) -> t.ContextManager[t.Optional[Span]]:
+        """Returns a context manager which times the enclosed block.
+
+        The context manager yields the span so that attributes known only after the operation has completed
+        can be added to it. If tracing is disabled, None is yielded instead.
+
+        Args:
+            name: The name of the operation.
+            attributes: Additional attributes that describe the operation.
+        """
+        if not self._sinks:
+            return _NOOP_SPAN_CONTEXT
+        return _SpanContext(self, name, attributes)
+
+    def _stack(self) -> t.List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _emit(self, span: Span) -> None:
+        for sink in self._sinks:
+            try:
+                sink.emit(span)
+            except Exception:
+                logger.exception("Failed to emit span '%s'", span.name)
+
+
+tracer = Tracer()
+
+
+def traced(name: str) -> t.Callable[[F], F]:
+    """A decorator which records each call of the decorated function as a span with the given name."""
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(name):
+                return func(*args, **kwargs)
+
+        return t.cast(F, wrapper)
+
+    return decorator
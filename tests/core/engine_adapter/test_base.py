@@ -1,4 +1,5 @@
 # type: ignore
+import threading
 import typing as t
 from unittest.mock import call
 
@@ -10,6 +11,8 @@ from sqlglot import parse_one
 
 from sqlmesh.core.engine_adapter import EngineAdapter, EngineAdapterWithIndexSupport
 from sqlmesh.core.schema_diff import SchemaDiffer, TableAlterOperation
+from sqlmesh.utils.cancellation import CancellationToken
+from sqlmesh.utils.errors import ExecutionCancelledError, QueryTimeoutError
 
 
 def test_create_view(mocker: MockerFixture):
@@ -685,3 +688,130 @@ def test_rename_table(mocker: MockerFixture):
     adapter.rename_table("old_table", "new_table")
 
     cursor_mock.execute.assert_called_once_with("ALTER TABLE old_table RENAME TO new_table")
+
+
+def test_execute_statement_timeout(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+
+    cancelled = threading.Event()
+    cursor_mock.cancel.side_effect = cancelled.set
+
+    def execute(sql: str) -> None:
+        if sql == "SELECT slow" and cancelled.wait(5):
+            raise RuntimeError("Query was cancelled")
+
+    cursor_mock.execute.side_effect = execute
+
+    adapter = EngineAdapter(lambda: connection_mock, "", statement_timeout=0.05)  # type: ignore
+    adapter.execute("SELECT fast")
+    with pytest.raises(QueryTimeoutError):
+        adapter.execute("SELECT slow")
+
+    cursor_mock.cancel.assert_called_once()
+
+
+def test_execute_cancellable(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+
+    started = threading.Event()
+    cancelled = threading.Event()
+    cursor_mock.cancel.side_effect = cancelled.set
+
+    def execute(sql: str) -> None:
+        started.set()
+        if cancelled.wait(5):
+            raise RuntimeError("Query was cancelled")
+
+    cursor_mock.execute.side_effect = execute
+
+    adapter = EngineAdapter(lambda: connection_mock, "")  # type: ignore
+    cancellation_token = CancellationToken()
+
+    def cancel() -> None:
+        started.wait(5)
+        cancellation_token.cancel()
+
+    thread = threading.Thread(target=cancel)
+    thread.start()
+    with adapter.cancellable(cancellation_token):
+        with pytest.raises(ExecutionCancelledError):
+            adapter.execute("SELECT slow")
+
+        # Statements are not started once the token has been cancelled.
+        with pytest.raises(ExecutionCancelledError):
+            adapter.execute("SELECT 1")
+    thread.join()
+
+    assert cursor_mock.execute.call_count == 1
+    cursor_mock.cancel.assert_called_once()
+
+
+def test_cancellable_timeout(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+
+    adapter = EngineAdapter(lambda: connection_mock, "")  # type: ignore
+    with adapter.cancellable(timeout=0):
+        with pytest.raises(QueryTimeoutError):
+            adapter.execute("SELECT 1")
+    adapter.execute("SELECT 1")
+
+    cursor_mock.execute.assert_called_once_with("SELECT 1")
+
+
+def test_connection_released_after_statement(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+    cursor_mock.fetchall.return_value = [(1,)]
+
+    adapter = EngineAdapter(lambda: connection_mock, "", multithreaded=True, max_connections=1)
+    pool = adapter._connection_pool
+
+    adapter.execute("SELECT 1")
+    assert not pool._thread_connections
+
+    with adapter.pinned_connection():
+        assert adapter.fetchall("SELECT 1") == [(1,)]
+        assert pool._thread_connections
+    assert not pool._thread_connections
+
+    with adapter.transaction():
+        adapter.execute("SELECT 1")
+        assert pool._thread_connections
+    assert not pool._thread_connections
+    assert len(pool._idle_connections) == 1
+
+
+def test_connection_reuse_statement_count(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+
+    adapter = EngineAdapter(lambda: connection_mock, "", multithreaded=True, max_connections=1)
+    for i in range(3):
+        adapter.execute(f"SELECT {i}")
+
+    # Reusing a pooled connection doesn't issue a health check query.
+    assert [call[0][0] for call in cursor_mock.execute.call_args_list] == [
+        "SELECT 0",
+        "SELECT 1",
+        "SELECT 2",
+    ]
+
+    cursor_mock.execute.side_effect = [RuntimeError("connection lost"), None, None]
+    with pytest.raises(RuntimeError):
+        adapter.execute("SELECT 3")
+    adapter.execute("SELECT 4")
+
+    # The connection is health checked before it's reused after a failed statement.
+    assert [call[0][0] for call in cursor_mock.execute.call_args_list[3:]] == [
+        "SELECT 3",
+        "SELECT 1",
+        "SELECT 4",
+    ]
@@ -1,9 +1,11 @@
 # type: ignore
 import pandas as pd
+import pytest
 from pytest_mock.plugin import MockerFixture
-from sqlglot import parse_one
+from sqlglot import exp, parse_one
 
 from sqlmesh.core.engine_adapter.base_spark import BaseSparkEngineAdapter
+from sqlmesh.core.model.meta import IntervalUnit
 
 
 def test_replace_query(mocker: MockerFixture):
@@ -31,3 +33,82 @@ def test_replace_query_pandas(mocker: MockerFixture):
     cursor_mock.execute.assert_called_once_with(
         "INSERT OVERWRITE TABLE test_table (a, b) SELECT CAST(a AS INT) AS a, CAST(b AS INT) AS b FROM VALUES (CAST(1 AS INT), CAST(4 AS INT)), (2, 5), (3, 6) AS test_table(a, b)"
     )
+
+
+def test_insert_overwrite_by_time_partition_dynamic(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+
+    adapter = BaseSparkEngineAdapter(lambda: connection_mock, "spark")
+    adapter.insert_overwrite_by_time_partition(
+        "test_table",
+        parse_one("SELECT a, ds FROM tbl"),
+        start="2022-01-01",
+        end="2022-01-02",
+        time_formatter=lambda x: exp.Literal.string(x.strftime("%Y-%m-%d")),
+        time_column="ds",
+        columns_to_types={"a": exp.DataType.build("int"), "ds": exp.DataType.build("string")},
+        partitioned_by=["ds"],
+        partition_interval_unit=IntervalUnit.DAY,
+    )
+
+    assert [call[0][0] for call in cursor_mock.execute.call_args_list] == [
+        "SET spark.sql.sources.partitionOverwriteMode=dynamic",
+        "INSERT OVERWRITE TABLE test_table (a, ds) SELECT a, ds FROM tbl",
+        "RESET spark.sql.sources.partitionOverwriteMode",
+    ]
+
+
+def test_insert_overwrite_by_time_partition_dynamic_resets_mode_on_failure(
+    mocker: MockerFixture,
+):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+    cursor_mock.execute.side_effect = lambda sql: None if "INSERT" not in sql else 1 / 0
+
+    adapter = BaseSparkEngineAdapter(lambda: connection_mock, "spark")
+    with pytest.raises(ZeroDivisionError):
+        adapter.insert_overwrite_by_time_partition(
+            "test_table",
+            parse_one("SELECT a, ds FROM tbl"),
+            start="2022-01-01",
+            end="2022-01-02",
+            time_formatter=lambda x: exp.Literal.string(x.strftime("%Y-%m-%d")),
+            time_column="ds",
+            columns_to_types={"a": exp.DataType.build("int"), "ds": exp.DataType.build("string")},
+            partitioned_by=["ds"],
+            partition_interval_unit=IntervalUnit.DAY,
+        )
+
+    assert cursor_mock.execute.call_args_list[-1][0][0] == (
+        "RESET spark.sql.sources.partitionOverwriteMode"
+    )
+
+
+def test_insert_overwrite_by_time_partition_multiple_partition_columns(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+
+    adapter = BaseSparkEngineAdapter(lambda: connection_mock, "spark")
+    adapter.insert_overwrite_by_time_partition(
+        "test_table",
+        parse_one("SELECT a, b, ds FROM tbl"),
+        start="2022-01-01",
+        end="2022-01-02",
+        time_formatter=lambda x: exp.Literal.string(x.strftime("%Y-%m-%d")),
+        time_column="ds",
+        columns_to_types={
+            "a": exp.DataType.build("int"),
+            "b": exp.DataType.build("int"),
+            "ds": exp.DataType.build("string"),
+        },
+        partitioned_by=["ds", "b"],
+        partition_interval_unit=IntervalUnit.DAY,
+    )
+
+    cursor_mock.execute.assert_called_once_with(
+        "INSERT OVERWRITE TABLE test_table (a, b, ds) SELECT a, b, ds FROM tbl"
+    )
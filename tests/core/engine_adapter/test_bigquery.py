@@ -181,3 +181,50 @@ def test_create_table_time_partition(mocker: MockerFixture):
     assert sql_calls == [
         "CREATE TABLE IF NOT EXISTS `test_table` (`a` int, `b` int) PARTITION BY TIMESTAMP_TRUNC(`ds`, HOUR)"
     ]
+
+
+def test_insert_overwrite_by_time_partition_partitioned_table(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+
+    adapter = BigQueryEngineAdapter(lambda: connection_mock)
+    execute_mock = mocker.patch(
+        "sqlmesh.core.engine_adapter.bigquery.BigQueryEngineAdapter.execute"
+    )
+    adapter.insert_overwrite_by_time_partition(
+        "test_schema.test_table",
+        parse_one("SELECT a, ds FROM tbl"),
+        start="2022-01-01",
+        end="2022-01-03",
+        time_formatter=lambda x: exp.Literal.string(x.strftime("%Y-%m-%d")),
+        time_column="ds",
+        columns_to_types={
+            "a": exp.DataType.build("int"),
+            "ds": exp.DataType.build("date"),
+        },
+        partitioned_by=["ds"],
+        partition_interval_unit=IntervalUnit.DAY,
+    )
+
+    sql_calls = [
+        call[0][0].sql(dialect="bigquery", identify=True)
+        if isinstance(call[0][0], exp.Expression)
+        else call[0][0]
+        for call in execute_mock.call_args_list
+    ]
+    assert sql_calls == [
+        "MERGE INTO `test_schema`.`test_table` AS `__MERGE_TARGET__` USING (SELECT `a`, `ds` FROM `tbl`) AS __MERGE_SOURCE__ ON FALSE WHEN NOT MATCHED BY SOURCE AND `ds` BETWEEN '2022-01-01' AND '2022-01-03' THEN DELETE WHEN NOT MATCHED THEN INSERT (`a`, `ds`) VALUES (`a`, `ds`)",
+    ]
+    cursor_mock.connection._client.copy_table.assert_not_called()
+
+
+def test_cancel_query(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+
+    adapter = BigQueryEngineAdapter(lambda: connection_mock)
+    adapter._cancel_query(cursor_mock)
+
+    cursor_mock._query_job.cancel.assert_called_once()
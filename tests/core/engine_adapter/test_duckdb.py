@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 from sqlglot import expressions as exp
 from sqlglot import parse_one
@@ -20,6 +21,24 @@ def test_create_view(adapter: EngineAdapter, duck_conn):
         adapter.create_view("test_view", parse_one("SELECT a FROM tbl"), replace=False)  # type: ignore
 
 
+def test_register_df_view(adapter: EngineAdapter, duck_conn):
+    df = pd.DataFrame({"a": [1, 2], "b": ["2022-01-01", "2022-01-02"]})
+    columns_to_types = {"a": exp.DataType.build("TEXT"), "b": exp.DataType.build("DATE")}
+
+    adapter.create_schema("test_schema")
+    adapter.register_df_view("test_schema.test_view", df, columns_to_types)
+    assert adapter.fetchall("DESCRIBE test_schema.test_view") == [
+        ("a", "VARCHAR", "YES", None, None, None),
+        ("b", "DATE", "YES", None, None, None),
+    ]
+    assert adapter.fetchall("SELECT a FROM test_schema.test_view") == [("1",), ("2",)]
+
+    adapter.drop_view("test_schema.test_view")
+    assert not adapter.table_exists("test_schema.test_view")
+    with pytest.raises(Exception):
+        adapter.fetchall("SELECT * FROM __sqlmesh_df__test_schema_test_view")
+
+
 def test_create_schema(adapter: EngineAdapter, duck_conn):
     adapter.create_schema("test_schema")
     adapter.create_schema("test_schema")
@@ -46,3 +46,16 @@ def test_replace_query_does_not_exist(mocker: MockerFixture):
     cursor_mock.execute.assert_called_once_with(
         """CREATE TABLE db.table AS SELECT col FROM db.other_table"""
     )
+
+
+def test_cancel_query(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    cursor_mock.connection = connection_mock
+    connection_mock.cursor.return_value = cursor_mock
+
+    adapter = PostgresEngineAdapter(lambda: connection_mock, "postgres")
+    adapter._cancel_query(cursor_mock)
+
+    connection_mock.cancel.assert_called_once()
+    cursor_mock.cancel.assert_not_called()
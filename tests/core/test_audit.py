@@ -2,6 +2,7 @@ import pytest
 from sqlglot import exp, parse, parse_one
 
 from sqlmesh.core.audit import Audit, builtin
+from sqlmesh.core.audit.fusion import fuse_audit_queries
 from sqlmesh.core.model import IncrementalByTimeRangeKind, Model, create_sql_model
 from sqlmesh.utils.errors import AuditConfigError
 
@@ -237,3 +238,65 @@ def test_forall_audit(model: Model):
         rendered_query_a.sql()
         == "SELECT * FROM (SELECT * FROM db.test_model AS test_model WHERE test_model.ds <= '1970-01-01' AND test_model.ds >= '1970-01-01') AS _q_0 WHERE NOT (_q_0.a >= _q_0.b) OR NOT (_q_0.c + _q_0.d - _q_0.e < 1.0)"
     )
+
+
+def test_fuse_audit_queries(model: Model, duck_conn):
+    duck_conn.execute("CREATE SCHEMA db")
+    duck_conn.execute(
+        """
+        CREATE TABLE db.test_model AS
+        SELECT * FROM (VALUES
+            (1, 'x', '1970-01-01'),
+            (1, NULL, '1970-01-01'),
+            (-2, 'z', '1970-01-01'),
+            (3, 'y', '1970-01-02')
+        ) AS t(a, b, ds)
+        """
+    )
+    queries = [
+        builtin.not_null_audit.render_query(model, columns=[exp.to_column("b")]),
+        builtin.unique_values_audit.render_query(model, columns=[exp.to_column("a")]),
+        builtin.accepted_values_audit.render_query(
+            model, column=exp.to_column("b"), is_in=["x", "y"]
+        ),
+        builtin.number_of_rows_audit.render_query(model, threshold=3),
+        builtin.forall_audit.render_query(model, criteria=[parse_one("a > 0")]),
+        builtin.unique_values_audit.render_query(model, columns=[exp.to_column("b")]),
+    ]
+
+    fused, unfused = fuse_audit_queries(queries)
+    assert not unfused
+    assert len(fused) == 1
+
+    fused_query, indices = fused[0]
+    assert indices == list(range(len(queries)))
+    assert duck_conn.execute(fused_query.sql(dialect="duckdb")).fetchone() == tuple(
+        duck_conn.execute(
+            exp.select("COUNT(*)").from_(query.subquery("audit")).sql(dialect="duckdb")
+        ).fetchone()[0]
+        for query in queries
+    )
+
+
+def test_fuse_audit_queries_unsupported(model: Model):
+    audit = Audit(
+        name="duplicate_a",
+        query="SELECT a FROM @this_model GROUP BY a HAVING COUNT(*) > 1",
+    )
+    not_null_query = builtin.not_null_audit.render_query(model, columns=[exp.to_column("b")])
+    assert isinstance(not_null_query, exp.Select)
+
+    queries = [
+        builtin.not_null_audit.render_query(model, columns=[exp.to_column("a")]),
+        audit.render_query(model),
+        builtin.accepted_values_audit.render_query(
+            model, column=exp.to_column("b"), is_in=["x", "y"]
+        ),
+        parse_one("SELECT * FROM db.other WHERE a IS NULL"),
+        not_null_query.where("a IN (SELECT a FROM db.other)"),
+        parse_one("SELECT 1 WHERE FALSE"),
+    ]
+
+    fused, unfused = fuse_audit_queries(queries)
+    assert [indices for _, indices in fused] == [[0, 2]]
+    assert unfused == [1, 3, 4, 5]
@@ -1,4 +1,7 @@
+import os
 import pathlib
+import shutil
+import typing as t
 from datetime import date
 
 import pytest
@@ -6,10 +9,12 @@ from pytest_mock.plugin import MockerFixture
 from sqlglot import parse_one
 
 import sqlmesh.core.constants
+import sqlmesh.core.context
+import sqlmesh.core.loader
 from sqlmesh.core.config import Config, ModelDefaultsConfig
 from sqlmesh.core.context import Context
 from sqlmesh.core.dialect import parse
-from sqlmesh.core.model import load_model
+from sqlmesh.core.model import SqlModel, load_model
 from sqlmesh.core.plan import BuiltInPlanEvaluator, Plan
 from sqlmesh.utils.date import yesterday_ds
 from sqlmesh.utils.errors import ConfigError
@@ -320,3 +325,204 @@ def test_plan_apply(sushi_context) -> None:
     )
     sushi_context.apply(plan)
     assert sushi_context.state_reader.get_environment("dev")
+
+
+def test_load_models_in_processes(tmp_path: pathlib.Path):
+    shutil.copytree("examples/sushi", tmp_path / "sushi", ignore=shutil.ignore_patterns(".cache"))
+
+    serial_context = Context(paths=str(tmp_path / "sushi"), config=Config())
+    shutil.rmtree(tmp_path / "sushi" / ".cache")
+
+    context = Context(paths=str(tmp_path / "sushi"), config=Config(model_load_processes=2))
+    assert list(context.models) == list(serial_context.models)
+    for name, model in context.models.items():
+        assert model.dict() == serial_context.models[name].dict()
+        assert model._path == serial_context.models[name]._path
+        if hasattr(model, "render_query"):
+            assert model.render_query() == serial_context.models[name].render_query()
+
+    assert "add_one" in context.macros
+
+    # Models loaded in processes are stored in the model cache as well.
+    context.load()
+    assert list(context.models) == list(serial_context.models)
+
+
+def test_load_update_paths(tmp_path: pathlib.Path, mocker: MockerFixture):
+    project_path = tmp_path / "sushi"
+    shutil.copytree("examples/sushi", project_path, ignore=shutil.ignore_patterns(".cache"))
+
+    context = Context(paths=str(project_path), config=Config())
+    models = dict(context.models)
+
+    load_model_spy = mocker.spy(sqlmesh.core.loader, "load_model")
+    update_schemas_spy = mocker.spy(sqlmesh.core.loader, "update_model_schemas")
+
+    waiters_path = project_path / "models" / "waiters.sql"
+    waiters_path.write_text(
+        waiters_path.read_text().replace("ds::TEXT AS ds", "ds::TEXT AS ds, 1 AS one")
+    )
+    context.load(update_paths=[waiters_path])
+
+    assert load_model_spy.call_count == 1
+    assert "one" in context.models["sushi.waiters"].columns_to_types
+    assert update_schemas_spy.call_args.kwargs["model_names"] == {
+        "sushi.waiters",
+        *context.dag.downstream("sushi.waiters"),
+    }
+    assert context.models["sushi.orders"] is models["sushi.orders"]
+    assert context.models["sushi.customers"] is models["sushi.customers"]
+
+    # Only models which use a modified macro are reloaded.
+    load_model_spy.reset_mock()
+    macros_path = project_path / "macros" / "macros.py"
+    macros_path.write_text(macros_path.read_text().replace("high=MacroVar", "high = MacroVar"))
+    context.load(update_paths=[macros_path])
+
+    assert [call.kwargs["path"] for call in load_model_spy.call_args_list] == [waiters_path]
+    assert context.models["sushi.customers"] is models["sushi.customers"]
+
+    new_model_path = project_path / "models" / "new_model.sql"
+    new_model_path.write_text("MODEL (name sushi.new_model); SELECT waiter_id FROM sushi.waiters")
+    context.load(update_paths=[new_model_path])
+    assert context.dag.upstream("sushi.new_model") == ["sushi.orders", "sushi.waiters"]
+
+    new_model_path.unlink()
+    context.load(update_paths=[new_model_path])
+    assert "sushi.new_model" not in context.models
+    assert set(context.models) == set(models)
+
+    # A configuration change causes the entire project to be reloaded.
+    full_load_spy = mocker.spy(context._loader, "load")
+    context.load(update_paths=[project_path / "config.py"])
+    full_load_spy.assert_called_once_with(context)
+
+
+def test_model_cache_content_hashes(tmp_path: pathlib.Path, mocker: MockerFixture):
+    project_path = tmp_path / "sushi"
+    shutil.copytree("examples/sushi", project_path, ignore=shutil.ignore_patterns(".cache"))
+    Context(paths=str(project_path), config=Config())
+
+    def loaded_models() -> t.List[str]:
+        load_model_spy = mocker.spy(sqlmesh.core.loader, "load_model")
+        Context(paths=str(project_path), config=Config())
+        mocker.stop(load_model_spy)
+        # Seed models are never cached.
+        return sorted(
+            call.kwargs["path"].name
+            for call in load_model_spy.call_args_list
+            if call.kwargs["path"].name != "waiter_names.sql"
+        )
+
+    # Modification times don't affect the cache, e.g. after a fresh clone.
+    for path in project_path.glob("**/*"):
+        os.utime(path, (0, 0))
+    assert loaded_models() == []
+
+    # Only models which use a modified macro are invalidated.
+    macros_path = project_path / "macros" / "macros.py"
+    macros_path.write_text(macros_path.read_text().replace("high=MacroVar", "high = MacroVar"))
+    assert loaded_models() == ["waiters.sql"]
+
+    customers_path = project_path / "models" / "customers.sql"
+    customers_path.write_text(customers_path.read_text() + "\n")
+    assert loaded_models() == ["customers.sql"]
+
+
+def test_snapshots_memoized(sushi_context: Context, mocker: MockerFixture):
+    snapshots = sushi_context.snapshots
+    from_model_spy = mocker.spy(sqlmesh.core.context.Snapshot, "from_model")
+
+    def rebuilt() -> t.Set[str]:
+        fingerprints = {name: s.fingerprint for name, s in sushi_context.snapshots.items()}
+        names = {call.args[0].name for call in from_model_spy.call_args_list}
+
+        # Memoized snapshots match the ones built from scratch.
+        sushi_context._clear_snapshot_cache()
+        assert fingerprints == {name: s.fingerprint for name, s in sushi_context.snapshots.items()}
+
+        from_model_spy.reset_mock()
+        return names
+
+    assert rebuilt() == set()
+    assert sushi_context.snapshots["sushi.orders"] is not snapshots["sushi.orders"]
+    assert sushi_context.snapshots["sushi.orders"] == snapshots["sushi.orders"]
+
+    # Upserting a model only rebuilds the snapshots of the model and its descendants.
+    sushi_context.upsert_model("sushi.waiters", stamp="1")
+    assert rebuilt() == {"sushi.waiters", *sushi_context.dag.downstream("sushi.waiters")}
+    assert rebuilt() == set()
+
+    sushi_context.load()
+    assert rebuilt() == set(sushi_context.models)
+
+
+def test_context_diff_fetches_only_modified_snapshots(
+    sushi_context: Context, mocker: MockerFixture
+):
+    sushi_context.upsert_model("sushi.customers", stamp="1")
+    get_snapshots_spy = mocker.spy(sushi_context.state_reader, "get_snapshots")
+
+    context_diff = sushi_context._context_diff("prod")
+
+    assert context_diff.modified_snapshots
+    assert set(context_diff.snapshots) == set(sushi_context.models)
+    assert {
+        snapshot_id.name for snapshot_id in get_snapshots_spy.call_args_list[-1].args[0]
+    } == set(context_diff.modified_snapshots)
+
+
+def test_plan_runs_tests_of_changed_models(sushi_context: Context, mocker: MockerFixture):
+    run_tests = mocker.spy(sqlmesh.core.context, "run_tests")
+
+    def test_names() -> t.List[str]:
+        return [test.test_name for test in run_tests.call_args.args[0]]
+
+    sushi_context.plan("dev", no_prompts=True)
+    assert test_names() == []
+
+    # The tested model is affected by a change of an upstream model.
+    sushi_context.upsert_model("sushi.orders", stamp="1")
+    sushi_context.plan("dev", no_prompts=True)
+    assert test_names() == ["test_customer_revenue_by_day"]
+    assert run_tests.spy_return.testsRun == 1
+    assert not run_tests.spy_return.skipped
+
+    # The test has passed before and nothing has changed since.
+    sushi_context.plan("dev", no_prompts=True)
+    assert test_names() == ["test_customer_revenue_by_day"]
+    assert len(run_tests.spy_return.skipped) == 1
+
+    sushi_context.plan("dev", no_prompts=True, run_all_tests=True)
+    assert test_names() == ["test_customer_revenue_by_day"]
+    assert run_tests.call_args.kwargs["result_cache"] is None
+    assert not run_tests.spy_return.skipped
+
+    # Metadata changes don't affect tests.
+    sushi_context.upsert_model("sushi.orders", stamp="1", owner="someone")
+    sushi_context.upsert_model("sushi.customer_revenue_by_day", owner="someone")
+    assert sushi_context._context_diff("dev").metadata_updated("sushi.customer_revenue_by_day")
+    sushi_context.plan("dev", no_prompts=True)
+    assert len(run_tests.spy_return.skipped) == 1
+
+
+def test_optimized_query_cache_per_project(tmp_path: pathlib.Path):
+    contexts = []
+    for project in ("a", "b"):
+        models_dir = tmp_path / project / "models"
+        models_dir.mkdir(parents=True)
+        (models_dir / "model.sql").write_text(
+            "MODEL(name db.model, kind full); SELECT 1::INT AS col"
+        )
+        contexts.append(Context(paths=str(tmp_path / project), config=Config()))
+
+    # Each context keeps using the cache of its own project, even after other contexts have been created.
+    for context in contexts:
+        model = context.models["db.model"]
+        assert isinstance(model, SqlModel)
+        cache = model._query_renderer._optimized_query_cache
+        assert cache is not None
+        assert (
+            cache._file_cache._path
+            == context.path / sqlmesh.core.constants.CACHE / "optimized_query"
+        )
@@ -164,3 +164,21 @@ def test_ast_correctness(macro_evaluator):
 def test_macro_functions(macro_evaluator, assert_exp_eq, sql, expected, args):
     macro_evaluator.locals = args or {}
     assert_exp_eq(macro_evaluator.transform(parse_one(sql)), expected)
+
+
+def test_transform_splices_without_reparse(macro_evaluator, mocker):
+    parse_spy = mocker.spy(macro_evaluator, "parse_one")
+    jinja_spy = mocker.spy(macro_evaluator.jinja_env, "from_string")
+
+    macro_evaluator.locals = {"x": 1, "y": "a", "z": True}
+    expression = macro_evaluator.transform(
+        parse_one("SELECT @x AS x, 'b' AS b FROM t WHERE y = @y AND @z")
+    )
+    assert expression == parse_one("SELECT 1 AS x, 'b' AS b FROM t WHERE y = 'a' AND TRUE")
+    assert not parse_spy.called
+    assert not jinja_spy.called
+
+    # Spliced expressions that could be parsed differently in their context are parsed again.
+    macro_evaluator.locals = {"x": parse_one("a + b")}
+    assert macro_evaluator.transform(parse_one("SELECT @x * 2")) == parse_one("SELECT a + b * 2")
+    assert parse_spy.called
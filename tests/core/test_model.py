@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 from pytest_mock.plugin import MockerFixture
 from sqlglot import exp, parse, parse_one
+from sqlglot.schema import MappingSchema
 
 import sqlmesh.core.dialect as d
 from sqlmesh.core.config import Config
@@ -11,9 +12,11 @@ from sqlmesh.core.context import Context, ExecutionContext
 from sqlmesh.core.hooks import hook
 from sqlmesh.core.model import (
     IncrementalByTimeRangeKind,
+    Model,
     ModelCache,
     ModelMeta,
     SeedKind,
+    SeedModel,
     SqlModel,
     TimeColumn,
     create_seed_model,
@@ -421,6 +424,12 @@ def test_seed_model_diff(tmp_path):
     diff = model_a.text_diff(model_b)
     assert diff.endswith("-1,value_a\n+2,value_b")
 
+    # Content hashes are diffed instead if the content of a seed isn't available.
+    model_c = SeedModel.parse_raw(model_b.json())
+    diff = model_a.text_diff(model_c)
+    assert diff.endswith(f"-{model_a.seed.content_hash}\n+{model_b.seed.content_hash}")
+    assert model_c.is_breaking_change(model_a) is None
+
 
 def test_audits():
     expressions = parse(
@@ -568,6 +577,106 @@ def test_render_query(assert_exp_eq):
     )
 
 
+def test_render_query_template(mocker: MockerFixture):
+    from sqlmesh.core import renderer
+
+    expressions = d.parse(
+        """
+        MODEL (
+            name db.table,
+            kind INCREMENTAL_BY_TIME_RANGE(
+                time_column ds
+            )
+        );
+
+        SELECT @start_date AS start_date, @end_epoch AS end_epoch, ds
+        FROM db.source
+        WHERE ds BETWEEN @start_ds AND @end_ds
+    """
+    )
+    model = load_model(expressions)
+    reference = load_model(expressions)
+    assert isinstance(model, SqlModel)
+    assert isinstance(reference, SqlModel)
+    render_spy = mocker.spy(renderer.ExpressionRenderer, "render")
+
+    for day in ("2023-01-01", "2023-01-02", "2023-03-15"):
+        reference._query_renderer._query_cache.clear()
+        assert model.render_query(start=day, end=day) == reference.render_query(start=day, end=day)
+
+    assert model._query_renderer._template is not None
+    # The template is rendered once, all other intervals are substituted into it.
+    assert [
+        call.args[0] for call in render_spy.call_args_list if call.args[0] is model._query_renderer
+    ] == [model._query_renderer]
+
+    macro_model = load_model(
+        d.parse(
+            """
+            MODEL (
+                name db.table,
+                kind INCREMENTAL_BY_TIME_RANGE(
+                    time_column ds
+                )
+            );
+
+            @DEF(x, 1);
+            SELECT @x AS x, ds FROM db.source WHERE ds BETWEEN @start_ds AND @end_ds
+        """
+        )
+    )
+    assert isinstance(macro_model, SqlModel)
+    macro_model.render_query(start="2023-01-01", end="2023-01-01")
+    macro_model.render_query(start="2023-01-02", end="2023-01-02")
+    assert macro_model._query_renderer._template is None
+    assert not macro_model._query_renderer.is_template_safe
+
+    mocker.patch.object(renderer, "QUERY_CACHE_SIZE", 2)
+    model = load_model(expressions)
+    assert isinstance(model, SqlModel)
+    for day in ("2023-01-01", "2023-01-02", "2023-01-03"):
+        model.render_query(start=day, end=day)
+    assert len(model._query_renderer._query_cache) == 2
+
+
+def test_render_query_optimized_query_cache(tmp_path: Path, mocker: MockerFixture):
+    from sqlmesh.core import renderer
+    from sqlmesh.utils.cache import OptimizedQueryCache
+
+    expressions = d.parse(
+        """
+        MODEL (
+            name db.table,
+            kind FULL
+        );
+
+        SELECT a::INT AS a FROM db.source
+    """
+    )
+
+    cache = OptimizedQueryCache(tmp_path)
+    optimize_spy = mocker.spy(renderer.QueryRenderer, "_optimize_query")
+
+    model = load_model(expressions, optimized_query_cache=cache)
+    assert optimize_spy.call_count == 1
+
+    # A new model instance, e.g. in another process, reuses the optimized query.
+    cached_model = load_model(expressions, optimized_query_cache=OptimizedQueryCache(tmp_path))
+    assert optimize_spy.call_count == 1
+    assert cached_model.render_query() == model.render_query()
+    assert cached_model.columns_to_types == {"a": exp.DataType.build("int")}
+
+    # A change of the upstream schema invalidates the cached query.
+    schema = MappingSchema()
+    schema.add_table("db.source", {"a": exp.DataType.build("text")})
+    cached_model = load_model(expressions, optimized_query_cache=cache)
+    assert isinstance(cached_model, SqlModel)
+    cached_model._query_renderer._schema = schema
+    cached_model._query_renderer._query_cache.clear()
+    cached_model.render_query()
+    assert optimize_spy.call_count == 2
+
+
 def test_time_column():
     expressions = parse(
         """
@@ -964,6 +1073,41 @@ def test_star_expansion(assert_exp_eq) -> None:
     )
 
 
+def test_update_model_schemas(tmp_path: Path, mocker: MockerFixture):
+    from sqlmesh.core import renderer
+    from sqlmesh.core.loader import update_model_schemas
+    from sqlmesh.utils import UniqueKeyDict
+    from sqlmesh.utils.cache import OptimizedQueryCache
+    from sqlmesh.utils.dag import DAG
+
+    def load_models() -> UniqueKeyDict[str, Model]:
+        models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
+        for sql in (
+            "MODEL (name db.a); SELECT 1::INT AS x",
+            "MODEL (name db.b); SELECT * FROM db.a",
+            "MODEL (name db.c); SELECT * FROM db.a",
+            "MODEL (name db.d); SELECT * FROM db.b AS b CROSS JOIN (SELECT x AS y FROM db.c) AS c",
+        ):
+            model = load_model(d.parse(sql), optimized_query_cache=OptimizedQueryCache(tmp_path))
+            models[model.name] = model
+        return models
+
+    models = load_models()
+    dag: DAG[str] = DAG({name: model.depends_on for name, model in models.items()})
+    update_model_schemas(dag, models)
+
+    assert list(models["db.b"].columns_to_types) == ["x"]
+    assert list(models["db.c"].columns_to_types) == ["x"]
+    assert list(models["db.d"].columns_to_types) == ["x", "y"]
+
+    # Models whose upstream schemas didn't change are not optimized again after a reload.
+    optimize_spy = mocker.spy(renderer.QueryRenderer, "_optimize_query")
+    models = load_models()
+    update_model_schemas(dag, models)
+    assert list(models["db.d"].columns_to_types) == ["x", "y"]
+    assert not optimize_spy.called
+
+
 def test_batch_size_validation():
     expressions = parse(
         """
@@ -986,6 +1130,27 @@ def test_batch_size_validation():
         load_model(expressions, path=Path("./examples/sushi/models/test_model.sql"))
 
 
+def test_timeout():
+    expressions = parse(
+        """
+        MODEL (
+            name db.table,
+            timeout 600,
+        );
+
+        SELECT 1 AS a
+    """
+    )
+
+    model = load_model(expressions)
+    assert model.timeout == 600
+    assert "timeout 600" in model.render_definition()[0].sql(pretty=True)
+    assert load_model(parse("MODEL (name db.table); SELECT 1 AS a")).timeout is None
+
+    with pytest.raises(ConfigError, match=r"Invalid timeout"):
+        load_model(parse("MODEL (name db.table, timeout 0); SELECT 1 AS a"))
+
+
 def test_model_cache(tmp_path: Path, mocker: MockerFixture):
     cache = ModelCache(tmp_path)
 
@@ -1,3 +1,7 @@
+import threading
+import typing as t
+from unittest import mock
+
 import pytest
 from pytest_mock.plugin import MockerFixture
 from sqlglot import parse_one
@@ -109,3 +113,172 @@ def test_airflow_evaluator_plan_application_dag_fails(sushi_plan: Plan, mocker:
     airflow_client_mock.apply_plan.assert_called_once()
     airflow_client_mock.wait_for_dag_run_completion.assert_called_once()
     airflow_client_mock.wait_for_first_dag_run.assert_called_once()
+
+
+def _dev_plan_with_breaking_change(context: Context) -> Plan:
+    context.upsert_model("sushi.waiter_revenue_by_day", stamp="1")
+    plan = Plan(
+        context._context_diff("dev"),
+        state_reader=context.state_reader,
+        is_dev=True,
+        start="1 week ago",
+    )
+    for snapshot in plan.new_snapshots:
+        plan.set_choice(snapshot, SnapshotChangeCategory.BREAKING)
+    return plan
+
+
+def _record_events(
+    evaluator: BuiltInPlanEvaluator, mocker: MockerFixture
+) -> t.Tuple[t.List[t.Tuple], t.Dict[str, mock.MagicMock]]:
+    events: t.List[t.Tuple] = []
+    mocks: t.Dict[str, mock.MagicMock] = {}
+    snapshot_evaluator = evaluator.snapshot_evaluator
+
+    for kind, method in (
+        ("create", "create_snapshot"),
+        ("evaluate", "evaluate"),
+        ("promote", "promote_snapshot"),
+    ):
+
+        def record(snapshot, *args, _kind=kind, _fn=getattr(snapshot_evaluator, method), **kwargs):
+            events.append((_kind, snapshot.name))
+            return _fn(snapshot, *args, **kwargs)
+
+        mocks[method] = mocker.patch.object(snapshot_evaluator, method, side_effect=record)
+
+    return events, mocks
+
+
+def test_builtin_evaluator_pipelines_dev_promotion(sushi_context: Context, mocker: MockerFixture):
+    plan = _dev_plan_with_breaking_change(sushi_context)
+    evaluator = BuiltInPlanEvaluator(
+        sushi_context.state_sync,
+        sushi_context.snapshot_evaluator,
+        console=sushi_context.console,
+    )
+    events, _ = _record_events(evaluator, mocker)
+
+    evaluator.evaluate(plan)
+
+    changed = {s.name for s in plan.new_snapshots}
+    assert changed == {"sushi.waiter_revenue_by_day", "sushi.top_waiters"}
+    assert {name for kind, name in events if kind == "create"} == changed
+    assert {name for kind, name in events if kind == "promote"} == set(sushi_context.models)
+
+    def positions(kind: str, names: t.Set[str]) -> t.List[int]:
+        return [i for i, (k, name) in enumerate(events) if k == kind and name in names]
+
+    for name in changed:
+        assert max(positions("create", {name})) < min(positions("evaluate", {name}))
+
+    # A snapshot is promoted only after it and all its upstream snapshots have been backfilled.
+    for name in sushi_context.models:
+        lineage = {name, *sushi_context.dag.upstream(name)}
+        promoted_at = positions("promote", {name})[0]
+        assert all(i < promoted_at for i in positions("evaluate", lineage))
+
+    environment = sushi_context.state_sync.get_environment("dev")
+    assert environment and environment.finalized_ts
+    assert sushi_context.engine_adapter.table_exists("sushi__dev.top_waiters")
+
+
+def test_builtin_evaluator_promotes_without_waiting_for_backfill(
+    sushi_context: Context, mocker: MockerFixture
+):
+    plan = _dev_plan_with_breaking_change(sushi_context)
+    evaluator = BuiltInPlanEvaluator(
+        sushi_context.state_sync,
+        sushi_context.snapshot_evaluator,
+        backfill_concurrent_tasks=2,
+        console=sushi_context.console,
+    )
+    _, mocks = _record_events(evaluator, mocker)
+
+    customers_promoted = threading.Event()
+    promote = mocks["promote_snapshot"].side_effect
+    evaluate = mocks["evaluate"].side_effect
+
+    def promote_snapshot(snapshot, *args, **kwargs):
+        promote(snapshot, *args, **kwargs)
+        if snapshot.name == "sushi.customers":
+            customers_promoted.set()
+
+    def blocking_evaluate(snapshot, *args, **kwargs):
+        # Unaffected models are promoted while the backfill of changed models is still running.
+        if snapshot.name == "sushi.top_waiters":
+            assert customers_promoted.wait(timeout=30)
+        return evaluate(snapshot, *args, **kwargs)
+
+    mocks["promote_snapshot"].side_effect = promote_snapshot
+    mocks["evaluate"].side_effect = blocking_evaluate
+
+    evaluator.evaluate(plan)
+    assert customers_promoted.is_set()
+
+
+def test_builtin_evaluator_pipelined_failure(sushi_context: Context, mocker: MockerFixture):
+    plan = _dev_plan_with_breaking_change(sushi_context)
+    evaluator = BuiltInPlanEvaluator(
+        sushi_context.state_sync,
+        sushi_context.snapshot_evaluator,
+        console=sushi_context.console,
+    )
+    events, mocks = _record_events(evaluator, mocker)
+
+    evaluate = mocks["evaluate"].side_effect
+
+    def failing_evaluate(snapshot, *args, **kwargs):
+        if snapshot.name == "sushi.waiter_revenue_by_day":
+            raise RuntimeError("boom")
+        return evaluate(snapshot, *args, **kwargs)
+
+    mocks["evaluate"].side_effect = failing_evaluate
+
+    with pytest.raises(SQLMeshError, match="Plan application failed."):
+        evaluator.evaluate(plan)
+
+    promoted = {name for kind, name in events if kind == "promote"}
+    assert "sushi.customers" in promoted
+    assert not promoted & {"sushi.waiter_revenue_by_day", "sushi.top_waiters"}
+
+    # New snapshots are stored only once their tables have been created.
+    assert len(sushi_context.state_sync.get_snapshots(plan.new_snapshots)) == 2
+
+    # The environment is only updated once all snapshots have been backfilled and promoted.
+    assert not sushi_context.state_sync.get_environment("dev")
+
+
+def test_builtin_evaluator_failed_backfill_keeps_environment(
+    sushi_context: Context, mocker: MockerFixture
+):
+    sushi_context.upsert_model("sushi.customers", stamp="1")
+    sushi_context.plan("dev", start="1 week ago", auto_apply=True, no_prompts=True)
+    environment = sushi_context.state_sync.get_environment("dev")
+    assert environment
+
+    plan = _dev_plan_with_breaking_change(sushi_context)
+    evaluator = BuiltInPlanEvaluator(
+        sushi_context.state_sync,
+        sushi_context.snapshot_evaluator,
+        console=sushi_context.console,
+    )
+    _, mocks = _record_events(evaluator, mocker)
+
+    evaluate = mocks["evaluate"].side_effect
+
+    def failing_evaluate(snapshot, *args, **kwargs):
+        if snapshot.name == "sushi.top_waiters":
+            raise RuntimeError("boom")
+        return evaluate(snapshot, *args, **kwargs)
+
+    mocks["evaluate"].side_effect = failing_evaluate
+    update_environment = mocker.spy(evaluator, "_update_environment")
+
+    with pytest.raises(SQLMeshError, match="Plan application failed."):
+        evaluator.evaluate(plan)
+
+    update_environment.assert_not_called()
+    assert sushi_context.state_sync.get_environment("dev") == environment
+    for snapshot in sushi_context.state_sync.get_snapshots(plan.new_snapshots).values():
+        assert not snapshot.unpaused_ts
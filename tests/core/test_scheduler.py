@@ -1,11 +1,17 @@
+import threading
+
 import pytest
+from pytest_mock.plugin import MockerFixture
 from sqlglot import parse_one
 
 from sqlmesh.core import constants as c
 from sqlmesh.core.context import Context
+from sqlmesh.core.notification_target import NotificationStatus
 from sqlmesh.core.scheduler import Scheduler
 from sqlmesh.core.snapshot import Snapshot, SnapshotChangeCategory, SnapshotFingerprint
+from sqlmesh.utils.cancellation import CancellationToken
 from sqlmesh.utils.date import to_datetime
+from sqlmesh.utils.tracing import InMemoryTraceSink, tracer
 
 
 @pytest.fixture
@@ -130,3 +136,117 @@ def test_run(sushi_context_fixed_date: Context, scheduler: Scheduler):
         )
         == (0, "Hotate", 5.99)
     )
+
+
+def test_run_cancelled(sushi_context_fixed_date: Context, scheduler: Scheduler):
+    cancellation_token = CancellationToken()
+    evaluated = []
+
+    def evaluate(snapshot, *args, **kwargs):
+        evaluated.append(snapshot.name)
+        cancellation_token.cancel()
+
+    scheduler.snapshot_evaluator.evaluate = evaluate  # type: ignore
+
+    assert not scheduler.run(
+        c.PROD, "2022-01-01", "2022-01-03", "2022-01-30", cancellation_token=cancellation_token
+    )
+    assert len(evaluated) == 1
+
+    snapshot = sushi_context_fixed_date.snapshots[evaluated[0]]
+    assert not any(
+        s.intervals
+        for s in sushi_context_fixed_date.state_sync.get_snapshots(None).values()
+        if s.snapshot_id != snapshot.snapshot_id
+    )
+
+
+def test_run_traced(sushi_context_fixed_date: Context, scheduler: Scheduler):
+    sink = InMemoryTraceSink()
+    tracer.add_sink(sink)
+    try:
+        scheduler.run(c.PROD, "2022-01-01", "2022-01-03", "2022-01-30")
+    finally:
+        tracer.remove_sink(sink)
+
+    evaluations = sink.by_name("scheduler.evaluate")
+    assert evaluations
+    assert {span.attributes["snapshot"] for span in evaluations} >= {"sushi.items"}
+
+    evaluate_span_ids = {span.span_id for span in evaluations}
+    assert all(
+        span.parent_id in evaluate_span_ids for span in sink.by_name("snapshot_evaluator.evaluate")
+    )
+    assert sink.by_name("engine_adapter.execute")
+    assert sink.by_name("state_sync.add_interval")
+
+
+def test_run_non_blocking_audits_deferred(
+    sushi_context_fixed_date: Context, scheduler: Scheduler, mocker: MockerFixture
+):
+    items = next(s for s in scheduler.snapshots.values() if s.name == "sushi.items")
+    items.audits = tuple(audit.copy(update={"blocking": False}) for audit in items.audits)
+
+    notification_target = mocker.Mock()
+    scheduler.notification_targets = [notification_target]
+    log_status_update = mocker.spy(scheduler.console, "log_status_update")
+
+    snapshot_evaluator = scheduler.snapshot_evaluator
+    evaluate, audit = snapshot_evaluator.evaluate, snapshot_evaluator.audit
+    order_items_evaluated = threading.Event()
+    audit_calls = []
+
+    def evaluate_snapshot(snapshot, *args, **kwargs):
+        result = evaluate(snapshot, *args, **kwargs)
+        if snapshot.name == "sushi.order_items":
+            order_items_evaluated.set()
+        return result
+
+    def audit_snapshot(*, snapshot, blocking=None, **kwargs):
+        audit_calls.append((snapshot.name, blocking))
+        results = audit(snapshot=snapshot, blocking=blocking, **kwargs)
+        if blocking is False:
+            # Downstream snapshots are evaluated without waiting for non-blocking audits.
+            assert order_items_evaluated.wait(timeout=30)
+            return [result.copy(update={"count": 1}) for result in results]
+        return results
+
+    mocker.patch.object(snapshot_evaluator, "evaluate", side_effect=evaluate_snapshot)
+    mocker.patch.object(snapshot_evaluator, "audit", side_effect=audit_snapshot)
+
+    assert scheduler.run(c.PROD, "2022-01-01", "2022-01-03", "2022-01-30")
+
+    assert ("sushi.items", True) in audit_calls
+    assert ("sushi.items", False) in audit_calls
+    assert all(blocking is None for name, blocking in audit_calls if name == "sushi.order_items")
+
+    message = "Audit 'assert_items_price_exceeds_threshold' for model 'sushi.items' failed."
+    assert any(message in call.args[0] for call in log_status_update.call_args_list)
+    notification_target.send.assert_called()
+    assert all(
+        call.args[0] == NotificationStatus.WARNING and message in call.args[1]
+        for call in notification_target.send.call_args_list
+    )
+
+
+def test_deferred_audits_cancelled(scheduler: Scheduler):
+    cancellation_token = CancellationToken()
+    scheduler.max_workers = 1
+    audit_started = threading.Event()
+
+    def blocking_audit() -> None:
+        audit_started.set()
+        # Keep the only worker busy until the context has dropped the pending audits.
+        threading.Event().wait(0.5)
+
+    with scheduler.deferred_audits(cancellation_token):
+        assert scheduler._audit_executor
+        running = scheduler._audit_executor.submit(blocking_audit)
+        pending = scheduler._audit_executor.submit(lambda: None)
+        scheduler._audit_futures.extend([running, pending])
+        assert audit_started.wait(timeout=30)
+        cancellation_token.cancel()
+
+    assert running.done() and not running.cancelled()
+    assert pending.cancelled()
+    assert not scheduler._audit_futures
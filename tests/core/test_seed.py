@@ -1,8 +1,11 @@
+from unittest import mock
+
 import pandas as pd
 import pytest
 from sqlglot import exp
 
-from sqlmesh.core.model.seed import Seed
+from sqlmesh.core.model.seed import Seed, create_seed, hash_seed_content
+from sqlmesh.utils.errors import SQLMeshError
 
 
 def test_read():
@@ -33,3 +36,40 @@ def test_read():
 
     with pytest.raises(StopIteration):
         next(dfs)
+
+
+def test_content_hash(tmp_path):
+    content = "key,value\n1,one\n"
+    seed_path = tmp_path / "seed.csv"
+    seed_path.write_text(content)
+
+    seed = create_seed(seed_path)
+    assert seed.content_hash == hash_seed_content(content) == Seed(content=content).content_hash
+    assert seed.dict() == {"content_hash": seed.content_hash}
+
+    # The content is read from the seed file once it's needed.
+    assert seed.content == content
+
+    seed_path.write_text("key,value\n2,two\n")
+    with pytest.raises(SQLMeshError, match="doesn't match its hash"):
+        seed.content
+
+    seed_path.unlink()
+    with pytest.raises(SQLMeshError, match="is not available"):
+        seed.content
+
+
+def test_content_loader():
+    content = "key,value\n1,one\n"
+    seed = Seed.parse_raw(Seed(content=content).json())
+    with pytest.raises(SQLMeshError, match="is not available"):
+        seed.content
+
+    loader = mock.Mock(return_value=content)
+    seed.set_content_loader(loader)
+    assert seed.columns_to_types == {
+        "key": exp.DataType.build("bigint"),
+        "value": exp.DataType.build("varchar"),
+    }
+    assert next(seed.read()).to_dict("records") == [{"key": 1, "value": "one"}]
+    loader.assert_called_once_with(seed.content_hash)
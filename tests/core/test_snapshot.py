@@ -6,6 +6,7 @@ from _pytest.monkeypatch import MonkeyPatch
 from pytest_mock.plugin import MockerFixture
 from sqlglot import exp, parse, parse_one, to_column
 
+import sqlmesh.core.snapshot.definition
 from sqlmesh.core.config import AutoCategorizationMode, CategorizerConfig
 from sqlmesh.core.model import (
     IncrementalByTimeRangeKind,
@@ -23,6 +24,7 @@ from sqlmesh.core.snapshot import (
     SnapshotFingerprint,
     categorize_change,
     fingerprint_from_model,
+    fingerprints_from_models,
 )
 from sqlmesh.utils.date import to_datetime, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError
@@ -396,7 +398,7 @@ def test_fingerprint_seed_model():
     )
 
     expected_fingerprint = SnapshotFingerprint(
-        data_hash="3896405490",
+        data_hash="3037616557",
         metadata_hash="2457734471",
     )
 
@@ -468,6 +470,35 @@ def test_stamp(model: Model):
     assert original_fingerprint != stamped_fingerprint
 
 
+def test_fingerprints_from_models(model: Model, parent_model: Model, mocker: MockerFixture):
+    models = {parent_model.name: parent_model, model.name: model}
+    data_hash_spy = mocker.spy(sqlmesh.core.snapshot.definition, "_compute_model_data_hash")
+
+    fingerprints = fingerprints_from_models(models)
+    assert fingerprints == {
+        name: fingerprint_from_model(m, models=models) for name, m in models.items()
+    }
+    assert fingerprints_from_models(models, names=[parent_model.name]) == {
+        parent_model.name: fingerprints[parent_model.name]
+    }
+
+    # Hashes of models are memoized and only recomputed if inputs change.
+    assert data_hash_spy.call_count == 2
+    fingerprints_from_models(models, physical_schema={model.name: "x"})
+    assert [call.args[0].name for call in data_hash_spy.call_args_list[2:]] == [model.name]
+
+
+def test_fingerprints_from_models_deep_dag():
+    models = {
+        f"db.model_{i}": SqlModel(
+            name=f"db.model_{i}",
+            query=parse_one(f"SELECT a FROM db.model_{i - 1}" if i else "SELECT 1 AS a"),
+        )
+        for i in range(1200)
+    }
+    assert len(fingerprints_from_models(models)) == 1200
+
+
 def test_table_name(snapshot: Snapshot):
     # Mimic a direct breaking change.
     snapshot.fingerprint = SnapshotFingerprint(
@@ -25,7 +25,7 @@ from sqlmesh.core.snapshot import (
     SnapshotFingerprint,
     SnapshotTableInfo,
 )
-from sqlmesh.utils.errors import ConfigError, SQLMeshError
+from sqlmesh.utils.errors import AuditError, ConfigError, SQLMeshError
 
 
 @pytest.fixture
@@ -318,6 +318,50 @@ def test_migrate_duckdb(snapshot: Snapshot, duck_conn, make_snapshot):
     ]
 
 
+def test_audit_fused_duckdb(duck_conn, make_snapshot, mocker: MockerFixture):
+    duck_conn.execute("CREATE VIEW tbl AS SELECT * FROM (VALUES (1), (1), (NULL)) AS t(a)")
+    model = load_model(
+        parse(  # type: ignore
+            """
+        MODEL (
+            name db.model,
+            kind FULL,
+            audits (
+                not_null(columns=[a]),
+                unique_values(columns=[a]),
+                accepted_values(column=a, is_in=[1, 2]),
+                number_of_rows(threshold=10),
+            ),
+        );
+
+        SELECT a::int FROM tbl
+        """
+        ),
+    )
+    snapshot = make_snapshot(model)
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    adapter = create_engine_adapter(lambda: duck_conn, "duckdb")
+    evaluator = SnapshotEvaluator(adapter)
+    evaluator.create([snapshot], {})
+    evaluator.evaluate(snapshot, "2020-01-01", "2020-01-01", "2020-01-01", snapshots={})
+
+    fetchone_spy = mocker.spy(adapter, "fetchone")
+    results = evaluator.audit(snapshot=snapshot, snapshots={}, raise_exception=False)
+
+    fetchone_spy.assert_called_once()
+    assert [(result.audit.name, result.count) for result in results] == [
+        ("not_null", 1),
+        ("unique_values", 1),
+        ("accepted_values", 0),
+        ("number_of_rows", 1),
+    ]
+    assert all(result.query for result in results)
+
+    with pytest.raises(AuditError, match="Audit 'not_null' for model 'db.model' failed."):
+        evaluator.audit(snapshot=snapshot, snapshots={})
+
+
 def test_audit_unversioned(mocker: MockerFixture, adapter_mock, make_snapshot):
     evaluator = SnapshotEvaluator(adapter_mock)
 
@@ -1,4 +1,5 @@
 import typing as t
+from copy import deepcopy
 
 import duckdb
 import pandas as pd
@@ -13,7 +14,10 @@ from sqlmesh.core.model import (
     IncrementalByTimeRangeKind,
     ModelKind,
     ModelKindName,
+    SeedKind,
+    SeedModel,
     SqlModel,
+    create_seed_model,
 )
 from sqlmesh.core.snapshot import Snapshot, SnapshotChangeCategory, SnapshotTableInfo
 from sqlmesh.core.state_sync import EngineAdapterStateSync
@@ -136,6 +140,62 @@ def test_push_snapshots(
     )
 
 
+def test_push_seed_snapshots(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, tmp_path
+) -> None:
+    content = 'key,value\n1,"it\'s a \\ test"\n'
+    seed_path = tmp_path / "seed.csv"
+    seed_path.write_text(content)
+
+    model = create_seed_model("test_db.seed", SeedKind(path=str(seed_path)))
+    assert isinstance(model, SeedModel)
+    snapshot_a = make_snapshot(model, version="1")
+    snapshot_b = make_snapshot(model.copy(update={"owner": "b"}), version="1")
+    state_sync.push_snapshots([snapshot_a])
+    state_sync.push_snapshots([snapshot_b])
+
+    # The content is stored once, separately from snapshots.
+    assert state_sync.engine_adapter.fetchall(
+        f"SELECT content_hash, content FROM {state_sync.seeds_table}"
+    ) == [(model.seed.content_hash, content)]
+    assert state_sync.get_seed_contents([model.seed.content_hash, "missing"]) == {
+        model.seed.content_hash: content
+    }
+
+    # The content of seeds is loaded from the state once it's needed.
+    seed_path.unlink()
+    stored_snapshots = state_sync.get_snapshots([snapshot_a, snapshot_b])
+    stored_model = stored_snapshots[snapshot_b.snapshot_id].model
+    assert isinstance(stored_model, SeedModel)
+    assert stored_model.seed.content == content
+    copied_model = deepcopy(stored_snapshots[snapshot_a.snapshot_id]).model
+    assert isinstance(copied_model, SeedModel)
+    assert copied_model.seed.content == content
+
+
+def test_get_snapshot_versions(
+    state_sync: EngineAdapterStateSync, snapshots: t.List[Snapshot]
+) -> None:
+    snapshot_a, snapshot_b = snapshots
+    snapshot_a.change_category = SnapshotChangeCategory.BREAKING
+    snapshot_b.change_category = SnapshotChangeCategory.FORWARD_ONLY
+    snapshot_b.previous_versions = snapshot_a.all_versions
+    snapshot_b.indirect_versions = {"a": snapshot_a.all_versions}
+    state_sync.push_snapshots(snapshots)
+
+    expected = {snapshot.snapshot_id: snapshot.version_info for snapshot in snapshots}
+    assert state_sync.get_snapshot_versions(expected) == expected
+    assert state_sync.get_snapshot_versions([]) == {}
+
+    # The dedicated columns are kept up to date along with the snapshot payload.
+    snapshot_a.indirect_versions = {"b": snapshot_b.all_versions}
+    state_sync._update_snapshot(snapshot_a)
+    assert (
+        state_sync.get_snapshot_versions([snapshot_a])[snapshot_a.snapshot_id]
+        == snapshot_a.version_info
+    )
+
+
 def test_duplicates(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable) -> None:
     snapshot_a = make_snapshot(
         SqlModel(
@@ -704,6 +764,19 @@ def test_migrate_rows(state_sync: EngineAdapterStateSync, mocker: MockerFixture)
     assert len(old_snapshots) == len(new_snapshots)
     assert len(old_environments) == len(new_environments)
 
+    all_snapshots = state_sync.get_snapshots(None)
+    assert state_sync.get_snapshot_versions(all_snapshots) == {
+        snapshot_id: snapshot.version_info for snapshot_id, snapshot in all_snapshots.items()
+    }
+
+    # The content of seeds is moved out of snapshots.
+    seed_snapshots = [snapshot for snapshot in all_snapshots.values() if snapshot.is_seed_kind]
+    assert seed_snapshots
+    assert not new_snapshots["snapshot"].str.contains('"content":', regex=False).any()
+    for snapshot in seed_snapshots:
+        assert isinstance(snapshot.model, SeedModel)
+        assert snapshot.model.seed.content.startswith("id,name\n")
+
     assert not state_sync.missing_intervals("staging")
     assert not state_sync.missing_intervals("dev")
     assert len(state_sync.missing_intervals("dev", start="2023-01-08", end="2023-01-10")) == 9
@@ -0,0 +1,245 @@
+import pathlib
+import threading
+import typing as t
+from unittest import mock
+
+import duckdb
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+from sqlmesh.core import test as model_test
+from sqlmesh.core.dialect import parse
+from sqlmesh.core.engine_adapter import DuckDBEngineAdapter, EngineAdapter
+from sqlmesh.core.model import load_model
+from sqlmesh.core.test import (
+    FixtureCache,
+    ModelTestResultCache,
+    _test_fixture_name,
+    load_model_test_file,
+    run_tests,
+)
+from sqlmesh.utils.errors import SQLMeshError
+
+
+@pytest.fixture
+def models() -> t.Dict[str, t.Any]:
+    models = [
+        load_model(parse("MODEL (name sushi.raw); SELECT 1::INT AS id, 1::INT AS value")),
+        load_model(
+            parse(
+                "MODEL (name sushi.foo); SELECT id::INT AS id, value::INT * 2 AS value FROM sushi.raw"
+            )
+        ),
+    ]
+    return {model.name: model for model in models}
+
+
+@pytest.fixture
+def test_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    tests = []
+    for i in range(5):
+        expected = i * 2 if i != 3 else -1
+        tests.append(
+            f"""
+test_foo_{i}:
+  model: sushi.foo
+  inputs:
+    sushi.raw:
+      rows:
+        - id: {i}
+          value: {i}
+  outputs:
+    query:
+      rows:
+        - id: {i}
+          value: {expected}
+"""
+        )
+    path = tmp_path / "test_foo.yaml"
+    path.write_text("".join(tests))
+    return path
+
+
+def _duckdb_adapter() -> EngineAdapter:
+    connection = duckdb.connect()
+    return DuckDBEngineAdapter(lambda: connection)
+
+
+def test_fixture_name():
+    assert _test_fixture_name("sushi.raw") == "sushi.raw__fixture"
+    assert _test_fixture_name("sushi.raw", "__test_1") == "sushi__test_1.raw__fixture"
+    assert _test_fixture_name("raw", "__test_1") == "sqlmesh__test_1.raw__fixture"
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 10])
+def test_run_tests(models, test_file, jobs):
+    result = run_tests(
+        list(load_model_test_file(test_file).values()),
+        models,
+        _duckdb_adapter(),
+        jobs=jobs,
+        engine_adapter_factory=_duckdb_adapter,
+    )
+
+    assert result.testsRun == 5
+    assert [str(test).split(" ")[0] for test, _ in result.failures] == ["test_foo_3"]
+    assert not result.errors
+
+
+def test_run_tests_concurrently(
+    models: t.Dict[str, t.Any], test_file: pathlib.Path, mocker: MockerFixture
+):
+    engine_adapters: t.List[EngineAdapter] = []
+    close_spies: t.List[mock.MagicMock] = []
+
+    def engine_adapter_factory() -> EngineAdapter:
+        engine_adapter = _duckdb_adapter()
+        close_spies.append(mocker.spy(engine_adapter, "close"))
+        engine_adapters.append(engine_adapter)
+        return engine_adapter
+
+    engine_adapter = engine_adapter_factory()
+    run_threads: t.Dict[str, t.Tuple[str, EngineAdapter]] = {}
+    run_test = model_test.ModelTest.runTest
+
+    def record_run(self: model_test.ModelTest) -> None:
+        run_threads[self.test_name] = (threading.current_thread().name, self.engine_adapter)
+        run_test(self)
+
+    mocker.patch.object(model_test.ModelTest, "runTest", record_run)
+
+    result = run_tests(
+        list(load_model_test_file(test_file).values()),
+        models,
+        engine_adapter,
+        jobs=2,
+        engine_adapter_factory=engine_adapter_factory,
+    )
+
+    assert result.testsRun == 5
+    assert len(result.failures) == 1
+
+    # Tests are sharded across workers, each with its own engine adapter.
+    assert len(engine_adapters) == 2
+    assert {adapter for _, adapter in run_threads.values()} == set(engine_adapters)
+    assert all(name.startswith("sqlmesh_test") for name, _ in run_threads.values())
+    assert run_threads["test_foo_0"][1] is engine_adapter
+    assert run_threads["test_foo_1"][1] is engine_adapters[1]
+
+    # Only adapters created by the runner are closed.
+    close_spies[0].assert_not_called()
+    close_spies[1].assert_called_once()
+
+    # Fixtures are dropped once tests finish.
+    assert not engine_adapter.fetchall(
+        "SELECT * FROM information_schema.tables WHERE table_name = 'raw__fixture'"
+    )
+
+
+def test_fixture_cache(models, tmp_path, mocker):
+    path = tmp_path / "test_foo.yaml"
+    path.write_text(
+        """
+test_foo_0:
+  model: sushi.foo
+  inputs:
+    sushi.raw:
+      rows: &raw
+        - id: 1
+          value: 1
+        - id: 2
+          value: 2
+  outputs:
+    query:
+      rows:
+        - id: 1
+          value: 2
+        - id: 2
+          value: 4
+
+test_foo_1:
+  model: sushi.foo
+  inputs:
+    sushi.raw:
+      rows: *raw
+  outputs:
+    query:
+      rows:
+        - id: 1
+          value: 2
+        - id: 2
+          value: 4
+"""
+    )
+    tests = load_model_test_file(path)
+    rows = tests["test_foo_0"].body["inputs"]["sushi.raw"]["rows"]
+
+    cache = FixtureCache()
+    fixture = cache.get(rows)
+    assert cache.get(tests["test_foo_1"].body["inputs"]["sushi.raw"]["rows"]) is fixture
+    assert fixture.df.to_dict("records") == [{"id": 1, "value": 1}, {"id": 2, "value": 2}]
+    assert {column: kind.sql() for column, kind in fixture.columns_to_types.items()} == {
+        "id": "INT",
+        "value": "INT",
+    }
+
+    to_fixture = mocker.spy(model_test, "_to_fixture")
+    result = run_tests(list(tests.values()), models, _duckdb_adapter())
+    assert result.wasSuccessful()
+    to_fixture.assert_called_once()
+
+
+def test_result_cache(models, test_file, tmp_path):
+    tests = list(load_model_test_file(test_file).values())
+
+    def run(fingerprint: str = "a", dialect: str = "duckdb", jobs: int = 1) -> t.Any:
+        return run_tests(
+            tests,
+            models,
+            _duckdb_adapter(),
+            jobs=jobs,
+            engine_adapter_factory=_duckdb_adapter,
+            result_cache=ModelTestResultCache(
+                tmp_path / "cache", fingerprints={"sushi.foo": fingerprint}, dialect=dialect
+            ),
+        )
+
+    result = run()
+    assert result.testsRun == 5
+    assert not result.skipped
+    assert len(result.failures) == 1
+
+    # Only the failed test is run again.
+    result = run(jobs=2)
+    assert result.testsRun == 5
+    assert sorted(str(test).split(" ")[0] for test, _ in result.skipped) == [
+        "test_foo_0",
+        "test_foo_1",
+        "test_foo_2",
+        "test_foo_4",
+    ]
+    assert [str(test).split(" ")[0] for test, _ in result.failures] == ["test_foo_3"]
+
+    # Changes of the model or the test engine invalidate the cached results.
+    assert not run(fingerprint="b").skipped
+    assert len(run(fingerprint="b").skipped) == 4
+    assert not run(fingerprint="b", dialect="spark").skipped
+
+    # Changes of the test definition invalidate its cached result.
+    tests[0].body["outputs"]["query"]["rows"][0]["value"] = 1
+    result = run(fingerprint="b", dialect="spark")
+    assert len(result.skipped) == 3
+    assert [str(test).split(" ")[0] for test, _ in result.failures] == [
+        "test_foo_0",
+        "test_foo_3",
+    ]
+
+
+def test_run_tests_concurrently_requires_factory(models, test_file):
+    with pytest.raises(SQLMeshError, match="engine adapter factory is required"):
+        run_tests(
+            list(load_model_test_file(test_file).values()),
+            models,
+            _duckdb_adapter(),
+            jobs=2,
+        )
@@ -133,6 +133,7 @@ def test_apply_plan(mocker: MockerFixture, snapshot: Snapshot):
         "users": [],
         "is_dev": False,
         "forward_only": False,
+        "seed_contents": {},
     }
 
 
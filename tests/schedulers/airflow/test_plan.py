@@ -55,6 +55,7 @@ def test_create_plan_dag_spec(mocker: MockerFixture, snapshot: Snapshot, random_
         users=[],
         is_dev=False,
         forward_only=True,
+        seed_contents={"test_hash": "key,value"},
     )
 
     deleted_snapshot = SnapshotTableInfo(
@@ -108,6 +109,7 @@ def test_create_plan_dag_spec(mocker: MockerFixture, snapshot: Snapshot, random_
 
     state_sync_mock.get_snapshots.assert_called_once()
     state_sync_mock.get_environment.assert_called_once()
+    state_sync_mock.push_seed_contents.assert_called_once_with({"test_hash": "key,value"})
 
 
 @pytest.mark.airflow
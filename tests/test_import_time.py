@@ -0,0 +1,74 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Generous enough to absorb slow CI machines while still catching heavy dependencies (e.g. pandas or
+# the engine adapters) creeping back into the eager import path.
+IMPORT_TIME_BUDGET_SECONDS = 1.0
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+
+def test_import_sqlmesh_time_budget():
+    # The first run warms up the OS file cache and the bytecode cache.
+    _run("import sqlmesh")
+
+    start = time.perf_counter()
+    _run("import sqlmesh")
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < IMPORT_TIME_BUDGET_SECONDS, f"import sqlmesh took {elapsed:.2f}s"
+
+
+def test_import_sqlmesh_is_lazy():
+    result = _run(
+        "import sys, sqlmesh; "
+        "print(','.join(m for m in ('pandas', 'dateparser', 'sqlmesh.core.context', "
+        "'sqlmesh.core.engine_adapter') if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_import_sqlmesh_public_api():
+    result = _run(
+        "import sqlmesh; "
+        "from sqlmesh import Context, model, macro; "
+        "from sqlmesh.core.context import Context as C; "
+        "assert Context is C; "
+        "print('Context' in dir(sqlmesh))"
+    )
+    assert result.stdout.strip() == "True"
+
+    with pytest.raises(subprocess.CalledProcessError) as ex:
+        _run("import sqlmesh; sqlmesh.missing")
+    assert "has no attribute 'missing'" in ex.value.stderr
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "sqlmesh.core.renderer",
+        "sqlmesh.core.state_sync",
+        "sqlmesh.core.plan",
+        "sqlmesh.core.scheduler",
+        "sqlmesh.core.config.scheduler",
+        "sqlmesh.schedulers.airflow.client",
+        "sqlmesh.utils.concurrency",
+    ],
+)
+def test_import_submodule_first(module: str):
+    # Submodules must be importable on their own now that `import sqlmesh` no longer
+    # imports the whole package in a fixed order.
+    _run(f"import {module}")
+
+
+def test_cli_help_does_not_import_context():
+    result = _run(
+        "import sys; from click.testing import CliRunner; from sqlmesh.cli.main import cli; "
+        "CliRunner().invoke(cli, ['--help']); print('sqlmesh.core.context' in sys.modules)"
+    )
+    assert result.stdout.strip() == "False"
@@ -1,8 +1,10 @@
 from pathlib import Path
 
 from pytest_mock.plugin import MockerFixture
+from sqlglot import exp, parse_one
+from sqlglot.optimizer.annotate_types import annotate_types
 
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.utils.cache import FileCache, OptimizedQueryCache
 from sqlmesh.utils.pydantic import PydanticModel
 
 
@@ -32,3 +34,80 @@ def test_file_cache(tmp_path: Path, mocker: MockerFixture):
     assert cache.get("different_name", "test_entry_b") is None
 
     loader.assert_called_once()
+
+
+def test_file_cache_many(tmp_path: Path):
+    cache = FileCache(tmp_path, _TestEntry, prefix="test")
+
+    cache.put_many(
+        [
+            ("name_a", "id_a", _TestEntry(value="value_a")),
+            ("name_b", "id_b", _TestEntry(value="value_b")),
+        ]
+    )
+    assert cache.get_many({"name_a": "id_a", "name_b": "different_id", "name_c": "id_c"}) == {
+        "name_a": _TestEntry(value="value_a")
+    }
+
+    # Entries are persisted in a single file and don't clash with entries that have a different prefix.
+    assert [path.name for path in tmp_path.glob("*.db")] == ["cache.db"]
+    assert FileCache(tmp_path, _TestEntry, prefix="test").get("name_b", "id_b") == _TestEntry(
+        value="value_b"
+    )
+    assert FileCache(tmp_path, _TestEntry, prefix="other").get("name_b", "id_b") is None
+
+
+def test_file_cache_eviction(tmp_path: Path):
+    cache = FileCache(tmp_path, _TestEntry, max_size=2500)
+
+    for i in range(5):
+        cache.put(f"name_{i}", "id", _TestEntry(value=str(i) * 500))
+        # Accessing the first entry keeps it from being evicted.
+        assert cache.get("name_0", "id")
+
+    assert cache.get("name_0", "id")
+    assert cache.get("name_4", "id")
+    assert cache.get("name_1", "id") is None
+    assert cache._total_size() <= 2500
+
+
+def test_optimized_query_cache(tmp_path: Path):
+    cache = OptimizedQueryCache(tmp_path)
+
+    entry_id_a = OptimizedQueryCache.entry_id("duckdb", "SELECT a FROM x")
+    entry_id_b = OptimizedQueryCache.entry_id("duckdb", "SELECT b FROM x")
+    assert entry_id_a != entry_id_b
+    assert entry_id_a == OptimizedQueryCache.entry_id("duckdb", "SELECT a FROM x")
+
+    query: exp.Expression = annotate_types(parse_one("SELECT 1::INT AS a -- comment"))
+    assert cache.get(entry_id_a) is None
+
+    cache.put(entry_id_a, query)
+    cached_query = OptimizedQueryCache(tmp_path).get(entry_id_a)
+    assert cached_query == query
+    assert cached_query is not None
+    assert cached_query.expressions[0].type.sql() == "INT"
+    assert cached_query.expressions[0].comments == query.expressions[0].comments
+
+    # Entries are kept apart from other entries of the same cache folder.
+    assert [path.name for path in tmp_path.glob("*.db")] == []
+    assert [path.name for path in (tmp_path / "optimized_query").glob("*.db")] == ["cache.db"]
+
+
+def test_optimized_query_cache_eviction(tmp_path: Path):
+    query: exp.Expression = parse_one("SELECT a FROM x")
+    entry_ids = [OptimizedQueryCache.entry_id(str(i)) for i in range(5)]
+
+    cache = OptimizedQueryCache(tmp_path)
+    cache.put(entry_ids[0], query)
+    entry_size = cache._file_cache._total_size()
+
+    cache = OptimizedQueryCache(tmp_path, max_size=entry_size * 3)
+    for entry_id in entry_ids[1:]:
+        cache.put(entry_id, query)
+        # Keep the first entry recently used.
+        assert cache.get(entry_ids[0]) is not None
+
+    assert cache.get(entry_ids[0]) is not None
+    assert cache.get(entry_ids[1]) is None
+    assert cache.get(entry_ids[-1]) is not None
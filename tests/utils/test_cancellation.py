@@ -0,0 +1,43 @@
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+from sqlmesh.utils.cancellation import CancellationToken
+from sqlmesh.utils.errors import ExecutionCancelledError
+
+
+def test_cancellation_token(mocker: MockerFixture):
+    token = CancellationToken()
+    callback = mocker.Mock()
+    unregistered_callback = mocker.Mock()
+
+    token.on_cancel(callback)
+    unregister = token.on_cancel(unregistered_callback)
+    unregister()
+
+    assert not token.is_cancelled
+    token.raise_if_cancelled()
+
+    token.cancel()
+    token.cancel()
+
+    assert token.is_cancelled
+    callback.assert_called_once()
+    unregistered_callback.assert_not_called()
+    with pytest.raises(ExecutionCancelledError):
+        token.raise_if_cancelled()
+
+    late_callback = mocker.Mock()
+    token.on_cancel(late_callback)
+    late_callback.assert_called_once()
+
+
+def test_cancellation_token_failing_callback(mocker: MockerFixture):
+    token = CancellationToken()
+    callback = mocker.Mock()
+
+    token.on_cancel(mocker.Mock(side_effect=RuntimeError("fail")))
+    token.on_cancel(callback)
+    token.cancel()
+
+    callback.assert_called_once()
+    assert token.wait(0)
@@ -2,10 +2,14 @@ import pytest
 from pytest_mock.plugin import MockerFixture
 
 from sqlmesh.core.snapshot import SnapshotId
+from sqlmesh.utils.cancellation import CancellationToken
 from sqlmesh.utils.concurrency import (
     NodeExecutionFailedError,
+    concurrent_apply_to_dag,
     concurrent_apply_to_snapshots,
 )
+from sqlmesh.utils.dag import DAG
+from sqlmesh.utils.errors import ExecutionCancelledError
 
 
 @pytest.mark.parametrize("tasks_num", [1, 2])
@@ -102,3 +106,49 @@ def test_concurrent_apply_to_snapshots_return_failed_skipped(mocker: MockerFixtu
     assert errors[0].node == snapshot_a.snapshot_id
 
     assert skipped == [snapshot_b.snapshot_id, snapshot_c.snapshot_id]
+
+
+@pytest.mark.parametrize("tasks_num", [1, 2])
+def test_concurrent_apply_to_dag_cancelled(tasks_num: int):
+    dag = DAG[str]({"a": set(), "b": {"a"}, "c": {"b"}})
+    cancellation_token = CancellationToken()
+    processed_nodes = []
+
+    def process(node: str) -> None:
+        processed_nodes.append(node)
+        if node == "a":
+            cancellation_token.cancel()
+
+    errors, skipped = concurrent_apply_to_dag(
+        dag,
+        process,
+        tasks_num,
+        raise_on_error=False,
+        cancellation_token=cancellation_token,
+    )
+
+    assert processed_nodes == ["a"]
+    assert not errors
+    assert sorted(skipped) == ["b", "c"]
+
+    with pytest.raises(ExecutionCancelledError):
+        concurrent_apply_to_dag(dag, process, tasks_num, cancellation_token=cancellation_token)
+
+
+def test_concurrent_apply_to_dag_cancelled_in_flight():
+    dag = DAG[str]({"a": set(), "b": set(), "c": {"a", "b"}, "d": set()})
+    cancellation_token = CancellationToken()
+
+    def process(node: str) -> None:
+        if node == "a":
+            cancellation_token.cancel()
+            raise ExecutionCancelledError("cancelled")
+        # Simulates a statement that is interrupted once the token is cancelled.
+        cancellation_token.wait(5)
+
+    errors, skipped = concurrent_apply_to_dag(
+        dag, process, 2, raise_on_error=False, cancellation_token=cancellation_token
+    )
+
+    assert [error.node for error in errors] == ["a"]
+    assert "c" in skipped
@@ -1,12 +1,15 @@
 from concurrent.futures import ThreadPoolExecutor
-from threading import get_ident
+from threading import Event, Thread, get_ident
 
+import pytest
 from pytest_mock.plugin import MockerFixture
 
 from sqlmesh.utils.connection_pool import (
+    BoundedConnectionPool,
     SingletonConnectionPool,
     ThreadLocalConnectionPool,
 )
+from sqlmesh.utils.errors import ConnectionPoolTimeoutError
 
 
 def test_singleton_connection_pool_get(mocker: MockerFixture):
@@ -207,3 +210,192 @@ def test_thread_local_connection_pool_transaction(mocker: MockerFixture):
     assert cursor_mock_thread_one.rollback.call_count == 1
 
     assert cursor_mock_thread_two.begin.call_count == 1
+
+
+def test_bounded_connection_pool_reuse(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    pool = BoundedConnectionPool(connection_factory_mock, max_connections=2)
+
+    main_connection = pool.get()
+    assert pool.get() == main_connection
+    assert pool.get_cursor() == pool.get_cursor()
+
+    worker_connections = []
+
+    def thread():
+        worker_connections.append(pool.get())
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(thread).result()
+    assert pool.size == 2
+
+    pool.release_all(exclude_calling_thread=True)
+    assert pool.size == 2
+    assert pool.get() == main_connection
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(thread).result()
+
+    # The released connection was handed out to the new thread instead of opening a new one.
+    assert worker_connections[0] == worker_connections[1]
+    assert connection_factory_mock.call_count == 2
+    worker_connections[0].close.assert_not_called()
+
+    pool.close_all()
+    assert pool.size == 0
+    main_connection.close.assert_called_once()
+    worker_connections[0].close.assert_called_once()
+
+
+def test_bounded_connection_pool_discards_stale_connections(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    health_check_mock = mocker.Mock(return_value=False)
+    pool = BoundedConnectionPool(
+        connection_factory_mock, health_check=health_check_mock, health_check_interval=0
+    )
+
+    stale_connection = pool.get()
+    pool.release_all()
+
+    new_connection = pool.get()
+    assert new_connection != stale_connection
+    health_check_mock.assert_called_once_with(stale_connection)
+    stale_connection.close.assert_called_once()
+
+    health_check_mock.return_value = True
+    pool.release_all()
+    pool._idle_connections[0].last_used_at -= 1000
+
+    assert pool.get() != new_connection
+    new_connection.close.assert_called_once()
+
+
+def test_bounded_connection_pool_max_connections(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    pool = BoundedConnectionPool(
+        connection_factory_mock, max_connections=1, health_check=lambda _: True
+    )
+
+    acquired = Event()
+    release = Event()
+    waiter_connections = []
+
+    def holder():
+        pool.get()
+        acquired.set()
+        release.wait()
+
+    def waiter():
+        waiter_connections.append(pool.get())
+
+    holder_thread = Thread(target=holder)
+    holder_thread.start()
+    acquired.wait()
+
+    waiter_thread = Thread(target=waiter)
+    waiter_thread.start()
+    waiter_thread.join(timeout=0.1)
+    assert waiter_thread.is_alive()
+
+    # Once the holder thread exits its connection is reclaimed by the waiting thread.
+    release.set()
+    holder_thread.join()
+    waiter_thread.join(timeout=5)
+    assert not waiter_thread.is_alive()
+
+    assert len(waiter_connections) == 1
+    assert connection_factory_mock.call_count == 1
+
+
+def test_bounded_connection_pool_transaction_pinning(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    pool = BoundedConnectionPool(connection_factory_mock)
+
+    connection = pool.get()
+    pool.begin()
+    assert pool.is_transaction_active
+
+    pool.release_all()
+    assert pool.get() == connection
+    assert pool.is_transaction_active
+
+    pool.commit()
+    assert not pool.is_transaction_active
+
+    pool.release_all()
+    assert not pool._thread_connections
+    assert len(pool._idle_connections) == 1
+
+
+def test_bounded_connection_pool_release(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    pool = BoundedConnectionPool(connection_factory_mock, health_check=lambda _: True)
+
+    connection = pool.get()
+    pool.begin()
+    pool.release()
+    assert pool._thread_connections
+    assert not pool._idle_connections
+
+    pool.commit()
+    pool.release()
+    assert not pool._thread_connections
+    assert len(pool._idle_connections) == 1
+
+    worker_connections = []
+
+    def thread():
+        worker_connections.append(pool.get())
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(thread).result()
+
+    assert worker_connections == [connection]
+    assert connection_factory_mock.call_count == 1
+
+
+def test_bounded_connection_pool_health_check_interval(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    health_check_mock = mocker.Mock(return_value=True)
+    pool = BoundedConnectionPool(connection_factory_mock, health_check=health_check_mock)
+
+    connection = pool.get()
+    pool.release()
+    assert pool.get() == connection
+    health_check_mock.assert_not_called()
+
+    # A connection is health checked before its reuse if it has been idle for too long.
+    pool.release()
+    pool._idle_connections[0].last_used_at -= 100
+    assert pool.get() == connection
+    health_check_mock.assert_called_once_with(connection)
+
+    # A connection is health checked before its reuse if a statement has failed.
+    pool.release(failed=True)
+    assert pool.get() == connection
+    assert health_check_mock.call_count == 2
+
+    pool.release()
+    assert pool.get() == connection
+    assert health_check_mock.call_count == 2
+
+
+def test_bounded_connection_pool_checkout_timeout(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    pool = BoundedConnectionPool(
+        connection_factory_mock,
+        max_connections=1,
+        health_check=lambda _: True,
+        checkout_timeout=0.1,
+    )
+
+    pool.get()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ConnectionPoolTimeoutError, match="Timed out after 0.1 seconds"):
+            executor.submit(pool.get).result()
+
+    pool.release()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(pool.get).result()
+    assert connection_factory_mock.call_count == 1
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from jinja2 import Environment
+
 from sqlmesh.utils import AttributeDict
 from sqlmesh.utils.jinja import (
     JinjaMacroRegistry,
@@ -184,3 +186,23 @@ def test_global_objs():
 
     deserialized_registry = JinjaMacroRegistry.parse_raw(original_registry.json())
     assert deserialized_registry.global_objs["target"].test == "value"
+
+
+def test_compiled_templates_are_reused(mocker):
+    macros = "{% macro macro_a(v) %}{{ v }}_{{ suffix }}{% endmacro %}{% macro macro_b() %}b{% endmacro %}"
+
+    extractor = MacroExtractor()
+    registry = JinjaMacroRegistry()
+    registry.add_macros(extractor.extract(macros))
+
+    compile_spy = mocker.spy(Environment, "compile")
+
+    first = registry.build_environment(suffix="x").from_string("{{ macro_a(1) }}").render()
+    compile_count = compile_spy.call_count
+    assert compile_count > 0
+
+    second = registry.build_environment(suffix="y").from_string("{{ macro_a(1) }}").render()
+    assert compile_spy.call_count == compile_count
+
+    assert first == "1_x"
+    assert second == "1_y"
@@ -245,3 +245,48 @@ class DataClass:
     return X + a""",
         ),
     }
+
+
+def test_prepare_env_cached(mocker: MockerFixture):
+    python_env = {
+        "math": Executable(payload="import math", kind=ExecutableKind.IMPORT),
+        "VALUES": Executable(payload="[1, 2]", kind=ExecutableKind.VALUE),
+        "add": Executable(name="add", payload="def add(x):\n    return math.floor(x) + 1"),
+    }
+
+    import builtins
+
+    compile_spy = mocker.spy(builtins, "compile")
+
+    def compiled_sources() -> int:
+        return sum(call.args[2] == "exec" for call in compile_spy.call_args_list)
+
+    env = prepare_env(python_env)
+    assert env["add"](1.5) == 2
+    assert compiled_sources() == 2
+
+    other_env = prepare_env(python_env, {"existing": 1})
+    assert other_env["existing"] == 1
+    assert other_env["add"](1.5) == 2
+    assert compiled_sources() == 2
+
+    prepare_env({**python_env, "VALUES": Executable(payload="[3]", kind=ExecutableKind.VALUE)})
+    assert compiled_sources() == 4
+
+
+def test_prepare_env_isolated():
+    python_env = {
+        "VALUES": Executable(payload="[]", kind=ExecutableKind.VALUE),
+        "append": Executable(
+            name="append", payload="def append(x):\n    VALUES.append(x)\n    return VALUES"
+        ),
+    }
+
+    assert prepare_env(python_env)["append"](1) == [1]
+    assert prepare_env(python_env)["append"](1) == [1]
+
+    env = prepare_env(
+        {"g": Executable(name="g", payload="def g():\n    return self")},
+        {"self": "context"},
+    )
+    assert env["g"]() == "context"
@@ -0,0 +1,114 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+from sqlmesh.core.engine_adapter import EngineAdapter
+from sqlmesh.utils.tracing import (
+    InMemoryTraceSink,
+    JsonlTraceSink,
+    LoggingTraceSink,
+    Tracer,
+    traced,
+    tracer,
+)
+
+
+@pytest.fixture
+def sink():
+    sink = InMemoryTraceSink()
+    tracer.add_sink(sink)
+    yield sink
+    tracer.remove_sink(sink)
+
+
+def test_disabled_tracer():
+    local_tracer = Tracer()
+    assert not local_tracer.enabled
+    with local_tracer.span("test") as span:
+        assert span is None
+
+
+def test_nested_spans():
+    local_tracer = Tracer()
+    sink = InMemoryTraceSink()
+    local_tracer.add_sink(sink)
+
+    with local_tracer.span("outer", snapshot="a") as outer:
+        with local_tracer.span("inner") as inner:
+            inner.set("row_count", 10)
+
+    assert [span.name for span in sink.spans] == ["inner", "outer"]
+    assert inner.parent_id == outer.span_id
+    assert outer.parent_id is None
+    assert inner.attributes == {"row_count": 10}
+    assert outer.attributes == {"snapshot": "a"}
+    assert outer.duration_ms >= inner.duration_ms >= 0
+
+
+def test_span_error():
+    local_tracer = Tracer()
+    sink = InMemoryTraceSink()
+    local_tracer.add_sink(sink)
+
+    with pytest.raises(ValueError):
+        with local_tracer.span("failing"):
+            raise ValueError("boom")
+
+    assert sink.spans[0].error == "ValueError('boom')"
+    assert sink.spans[0].duration_ms is not None
+
+
+def test_traced(sink: InMemoryTraceSink):
+    @traced("test.add")
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    assert add(1, 2) == 3
+    assert len(sink.by_name("test.add")) == 1
+
+
+def test_jsonl_sink(tmp_path: Path):
+    path = tmp_path / "trace.jsonl"
+    local_tracer = Tracer()
+    sink = JsonlTraceSink(path)
+    local_tracer.add_sink(sink)
+
+    with local_tracer.span("first", snapshot="a"):
+        pass
+    with local_tracer.span("second"):
+        pass
+    local_tracer.clear()
+
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [span["name"] for span in spans] == ["first", "second"]
+    assert spans[0]["snapshot"] == "a"
+    assert not local_tracer.enabled
+
+
+def test_logging_sink(caplog: pytest.LogCaptureFixture):
+    local_tracer = Tracer()
+    local_tracer.add_sink(LoggingTraceSink(logging.getLogger("test_tracing")))
+
+    with caplog.at_level(logging.INFO, logger="test_tracing"):
+        with local_tracer.span("logged", snapshot="a"):
+            pass
+
+    assert "logged took" in caplog.text
+    assert "snapshot=a" in caplog.text
+
+
+def test_engine_adapter_execute(mocker: MockerFixture, sink: InMemoryTraceSink):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    cursor_mock.rowcount = 5
+    connection_mock.cursor.return_value = cursor_mock
+
+    adapter = EngineAdapter(lambda: connection_mock, "")
+    adapter.execute("SELECT 1")
+
+    (span,) = sink.by_name("engine_adapter.execute")
+    assert span.attributes["row_count"] == 5
+    assert span.attributes["sql_hash"]
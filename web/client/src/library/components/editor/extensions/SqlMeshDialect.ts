@@ -36,7 +36,7 @@ export function useSqlMeshExtension(): [
       const SQLKeywords = options.keywords
       const SQLMeshModelDictionary = SQLMeshModelKeywords(dialects)
       const SQLMeshKeywords =
-        'model name kind owner cron start storage_format time_column partitioned_by pre post batch_size audits dialect'
+        'model name kind owner cron start storage_format time_column partitioned_by pre post batch_size audits dialect timeout'
       const SQLMeshTypes =
         'seed full incremental_by_time_range incremental_by_unique_key view embedded'
 
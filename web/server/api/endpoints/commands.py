@@ -11,6 +11,7 @@ from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
 
 from sqlmesh.core.context import Context
 from sqlmesh.core.snapshot.definition import SnapshotChangeCategory
+from sqlmesh.utils.cancellation import CancellationToken
 from sqlmesh.utils.errors import PlanError
 from web.server import models
 from web.server.settings import get_loaded_context
@@ -68,7 +69,12 @@ async def apply(
             if plan.is_new_snapshot(new) and new.name in categories:
                 plan.set_choice(new, categories[new.name])
 
-    request.app.state.task = asyncio.create_task(run_in_executor(context.apply, plan))
+    request.app.state.cancellation_token = cancellation_token = CancellationToken()
+    request.app.state.task = asyncio.create_task(
+        run_in_executor(
+            functools.partial(context.apply, plan, cancellation_token=cancellation_token)
+        )
+    )
     if not plan.requires_backfill or plan_options.skip_backfill:
         await request.app.state.task
 
@@ -102,4 +102,9 @@ async def cancel_plan(
         raise HTTPException(
             status_code=HTTP_422_UNPROCESSABLE_ENTITY, detail="No active task found."
         )
+    # Cancelling the task doesn't stop the thread which applies the plan, so the queries
+    # it runs are cancelled through the token.
+    cancellation_token = getattr(request.app.state, "cancellation_token", None)
+    if cancellation_token is not None:
+        cancellation_token.cancel()
     response.status_code = status.HTTP_204_NO_CONTENT
@@ -13,13 +13,13 @@ async def watch_project(queue: asyncio.Queue) -> None:
     settings = get_settings()
     context = await get_loaded_context(settings)
 
-    async for _ in awatch(
+    async for changes in awatch(
         (context.path / c.MODELS).resolve(),
         watch_filter=DefaultFilter(
             ignore_entity_patterns=context.config.ignore_patterns if context else c.IGNORE_PATTERNS
         ),
     ):
-        context.load()
+        context.load(update_paths={path for _, path in changes})
 
         queue.put_nowait(
             Event(event="models", data=json.dumps([model.dict() for model in get_models(context)]))